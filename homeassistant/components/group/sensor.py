@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections.abc import Callable
 from datetime import datetime
+from fractions import Fraction
 import logging
+import math
 import statistics
 from typing import TYPE_CHECKING, Any
 
@@ -50,7 +53,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import CONF_IGNORE_NON_NUMERIC, DOMAIN as GROUP_DOMAIN
 from .entity import GroupEntity
@@ -289,6 +292,132 @@ CALC_TYPES: dict[
 }
 
 
+class _SensorValues:
+    """Numeric values of the group members, updated one member at a time.
+
+    Besides the values in member order, the finite values are kept sorted
+    and summed up exactly, so min, max, range, median and mean can be
+    updated in O(log n) when a member changes, with the same results as
+    the calculators above.
+    """
+
+    __slots__ = (
+        "_entity_ids",
+        "states",
+        "_values",
+        "_sorted",
+        "_total",
+        "_non_finite_count",
+        "state_count",
+        "known_count",
+        "valid_count",
+    )
+
+    def __init__(self, entity_ids: list[str]) -> None:
+        """Initialize the values."""
+        self._entity_ids = entity_ids
+        self.states: list[State | None] = [None] * len(entity_ids)
+        self._values: list[tuple[str, float, State] | None] = [None] * len(entity_ids)
+        self._sorted: list[tuple[float, int]] = []
+        self._total = Fraction(0)
+        self._non_finite_count = 0
+        self.state_count = 0
+        self.known_count = 0
+        self.valid_count = 0
+
+    def update(
+        self, index: int, state: State | None, numeric_state: float | None
+    ) -> None:
+        """Update the state and numeric value of a member."""
+        if (old_state := self.states[index]) is not None:
+            self.state_count -= 1
+            if old_state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                self.known_count -= 1
+        if state is not None:
+            self.state_count += 1
+            if state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                self.known_count += 1
+        self.states[index] = state
+
+        if (old_value := self._values[index]) is not None:
+            self.valid_count -= 1
+            self._remove_value(index, old_value[1])
+        if state is None or numeric_state is None:
+            self._values[index] = None
+            return
+        self.valid_count += 1
+        self._values[index] = (self._entity_ids[index], numeric_state, state)
+        if not math.isfinite(numeric_state):
+            self._non_finite_count += 1
+            return
+        insort(self._sorted, (numeric_state, index))
+        self._total += Fraction(numeric_state)
+
+    def _remove_value(self, index: int, value: float) -> None:
+        """Remove a value from the sorted values and the total."""
+        if not math.isfinite(value):
+            self._non_finite_count -= 1
+            return
+        del self._sorted[bisect_left(self._sorted, (value, index))]
+        self._total -= Fraction(value)
+
+    @property
+    def can_calculate_incrementally(self) -> bool:
+        """Return if the incremental calculators can be used.
+
+        The calculators above handle empty groups, infinity and NaN in
+        their own way, so these are left to them.
+        """
+        return self.valid_count > 0 and not self._non_finite_count
+
+    def sensor_values(self) -> list[tuple[str, float, State]]:
+        """Return the values in member order."""
+        return [value for value in self._values if value is not None]
+
+    def calc_min(self) -> tuple[dict[str, str | None], float | None]:
+        """Calculate min value."""
+        value, index = self._sorted[0]
+        return {ATTR_MIN_ENTITY_ID: self._entity_ids[index]}, value
+
+    def _max(self) -> tuple[float, int]:
+        """Return the max value of the first member having it."""
+        sorted_values = self._sorted
+        return sorted_values[bisect_left(sorted_values, (sorted_values[-1][0], -1))]
+
+    def calc_max(self) -> tuple[dict[str, str | None], float | None]:
+        """Calculate max value."""
+        value, index = self._max()
+        return {ATTR_MAX_ENTITY_ID: self._entity_ids[index]}, value
+
+    def calc_mean(self) -> tuple[dict[str, str | None], float | None]:
+        """Calculate mean value."""
+        return {}, float(self._total / self.valid_count)
+
+    def calc_median(self) -> tuple[dict[str, str | None], float | None]:
+        """Calculate median value."""
+        sorted_values = self._sorted
+        middle = len(sorted_values) // 2
+        if len(sorted_values) % 2:
+            return {}, sorted_values[middle][0]
+        return {}, (sorted_values[middle - 1][0] + sorted_values[middle][0]) / 2
+
+    def calc_range(self) -> tuple[dict[str, str | None], float | None]:
+        """Calculate range value."""
+        return {}, self._max()[0] - self._sorted[0][0]
+
+
+INCREMENTAL_CALC_TYPES: dict[
+    str,
+    Callable[[_SensorValues], tuple[dict[str, str | None], float | None]],
+] = {
+    "min": _SensorValues.calc_min,
+    "max": _SensorValues.calc_max,
+    "mean": _SensorValues.calc_mean,
+    "median": _SensorValues.calc_median,
+    "range": _SensorValues.calc_range,
+}
+
+
 class SensorGroup(GroupEntity, SensorEntity):
     """Representation of a sensor group."""
 
@@ -322,11 +451,12 @@ class SensorGroup(GroupEntity, SensorEntity):
         self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entity_ids}
         self._attr_unique_id = unique_id
         self._ignore_non_numeric = ignore_non_numeric
-        self.mode = all if ignore_non_numeric is False else any
         self._state_calc: Callable[
             [list[tuple[str, float, State]]],
             tuple[dict[str, str | None], float | None],
         ] = CALC_TYPES[self._sensor_type]
+        self._incremental_state_calc = INCREMENTAL_CALC_TYPES.get(self._sensor_type)
+        self._sensor_values = _SensorValues(entity_ids)
         self._state_incorrect: set[str] = set()
         self._extra_state_attribute: dict[str, Any] = {}
 
@@ -338,91 +468,107 @@ class SensorGroup(GroupEntity, SensorEntity):
             self._native_unit_of_measurement
         )
         self._valid_units = self._get_valid_units()
+        # The numeric values depend on the units
+        self._sensor_values = _SensorValues(self._entity_ids)
         await super().async_added_to_hass()
 
     @callback
     def async_update_group_state(self) -> None:
         """Query all members and determine the sensor group state."""
-        states: list[StateType] = []
-        valid_states: list[bool] = []
-        sensor_values: list[tuple[str, float, State]] = []
-        for entity_id in self._entity_ids:
-            if (state := self.hass.states.get(entity_id)) is not None:
-                states.append(state.state)
-                try:
-                    numeric_state = float(state.state)
-                    if (
-                        self._valid_units
-                        and (uom := state.attributes["unit_of_measurement"])
-                        in self._valid_units
-                        and self._can_convert is True
-                    ):
-                        numeric_state = UNIT_CONVERTERS[self.device_class].convert(
-                            numeric_state, uom, self.native_unit_of_measurement
-                        )
-                    if (
-                        self._valid_units
-                        and (uom := state.attributes["unit_of_measurement"])
-                        not in self._valid_units
-                    ):
-                        raise HomeAssistantError("Not a valid unit")
-
-                    sensor_values.append((entity_id, numeric_state, state))
-                    if entity_id in self._state_incorrect:
-                        self._state_incorrect.remove(entity_id)
-                    valid_states.append(True)
-                except ValueError:
-                    valid_states.append(False)
-                    # Log invalid states unless ignoring non numeric values
-                    if (
-                        not self._ignore_non_numeric
-                        and entity_id not in self._state_incorrect
-                    ):
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only numerical states are supported,"
-                            " entity %s with value %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.entity_id,
-                        )
-                    continue
-                except (KeyError, HomeAssistantError):
-                    # This exception handling can be simplified
-                    # once sensor entity doesn't allow incorrect unit of measurement
-                    # with a device class, implementation see PR #107639
-                    valid_states.append(False)
-                    if entity_id not in self._state_incorrect:
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only entities with correct unit of measurement"
-                            " is supported,"
-                            " entity %s, value %s with device class %s"
-                            " and unit of measurement %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.device_class,
-                            state.attributes.get("unit_of_measurement"),
-                            self.entity_id,
-                        )
+        sensor_values = self._sensor_values
+        get_state = self.hass.states.get
+        member_states = sensor_values.states
+        for index, entity_id in enumerate(self._entity_ids):
+            # Only members with a new state need to be parsed again
+            if (state := get_state(entity_id)) is not member_states[index]:
+                sensor_values.update(
+                    index,
+                    state,
+                    None if state is None else self._numeric_state(entity_id, state),
+                )
 
         # Set group as unavailable if all members do not have numeric values
-        self._attr_available = any(numeric_state for numeric_state in valid_states)
+        self._attr_available = sensor_values.valid_count > 0
 
-        valid_state = self.mode(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
-        )
-        valid_state_numeric = self.mode(numeric_state for numeric_state in valid_states)
+        if self._ignore_non_numeric:
+            valid_state = sensor_values.known_count > 0
+            valid_state_numeric = sensor_values.valid_count > 0
+        else:
+            valid_state = sensor_values.known_count == sensor_values.state_count
+            valid_state_numeric = sensor_values.valid_count == sensor_values.state_count
 
         if not valid_state or not valid_state_numeric:
             self._attr_native_value = None
             return
 
         # Calculate values
+        if (
+            self._incremental_state_calc is not None
+            and sensor_values.can_calculate_incrementally
+        ):
+            (
+                self._extra_state_attribute,
+                self._attr_native_value,
+            ) = self._incremental_state_calc(sensor_values)
+            return
         self._extra_state_attribute, self._attr_native_value = self._state_calc(
-            sensor_values
+            sensor_values.sensor_values()
         )
 
+    def _numeric_state(self, entity_id: str, state: State) -> float | None:
+        """Return the numeric state of a member, or None if it is not valid."""
+        try:
+            numeric_state = float(state.state)
+            if (
+                self._valid_units
+                and (uom := state.attributes["unit_of_measurement"])
+                in self._valid_units
+                and self._can_convert is True
+            ):
+                numeric_state = UNIT_CONVERTERS[self.device_class].convert(
+                    numeric_state, uom, self.native_unit_of_measurement
+                )
+            if (
+                self._valid_units
+                and (uom := state.attributes["unit_of_measurement"])
+                not in self._valid_units
+            ):
+                raise HomeAssistantError("Not a valid unit")
+
+            if entity_id in self._state_incorrect:
+                self._state_incorrect.remove(entity_id)
+        except ValueError:
+            # Log invalid states unless ignoring non numeric values
+            if not self._ignore_non_numeric and entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only numerical states are supported,"
+                    " entity %s with value %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.entity_id,
+                )
+            return None
+        except (KeyError, HomeAssistantError):
+            # This exception handling can be simplified
+            # once sensor entity doesn't allow incorrect unit of measurement
+            # with a device class, implementation see PR #107639
+            if entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only entities with correct unit of measurement"
+                    " is supported,"
+                    " entity %s, value %s with device class %s"
+                    " and unit of measurement %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.device_class,
+                    state.attributes.get("unit_of_measurement"),
+                    self.entity_id,
+                )
+            return None
+        return numeric_state
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the sensor."""
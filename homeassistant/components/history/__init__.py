@@ -118,7 +118,7 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_query_job(
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
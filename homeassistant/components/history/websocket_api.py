@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
@@ -72,8 +72,28 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
+    if columnar:
+        return json_bytes(
+            messages.result_message(
+                msg_id,
+                history.get_significant_states_columns(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    None,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    max_points,
+                ),
+            )
+        )
     return json_bytes(
         messages.result_message(
             msg_id,
@@ -88,6 +108,7 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
@@ -103,6 +124,8 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=4)),
     }
 )
 @websocket_api.async_response
@@ -156,7 +179,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_query_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -167,12 +190,14 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg["columnar"],
+            msg.get("max_points"),
         )
     )
 
 
 def _generate_stream_message(
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: Mapping[str, Any],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -200,7 +225,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: Mapping[str, Any],
 ) -> bytes:
     """Generate a websocket response."""
     return json_bytes(
@@ -220,12 +245,15 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
+    max_points: int | None,
     send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        MutableMapping[str, list[dict[str, Any]]],
-        history.get_significant_states(
+    states: Mapping[str, Any]
+    last_time_ts = 0.0
+    if columnar:
+        states = history.get_significant_states_columns(
             hass,
             start_time,
             end_time,
@@ -235,17 +263,37 @@ def _generate_historical_response(
             significant_changes_only,
             minimal_response,
             no_attributes,
-            True,
-        ),
-    )
-    last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
+            max_points,
+        )
+        for columns in states.values():
+            if (
+                state_last_time := columns[COMPRESSED_STATE_LAST_UPDATED][-1]
+            ) > last_time_ts:
+                last_time_ts = cast(float, state_last_time)
+    else:
+        states = cast(
+            MutableMapping[str, list[dict[str, Any]]],
+            history.get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+                max_points,
+            ),
+        )
+        for state_list in states.values():
+            if (
+                state_list
+                and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
+                > last_time_ts
+            ):
+                last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
@@ -275,11 +323,13 @@ async def _async_send_historical_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
+    max_points: int | None,
     send_empty: bool,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_query_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -290,6 +340,8 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        columnar,
+        max_points,
         send_empty,
     )
     if payload:
@@ -328,6 +380,7 @@ async def _async_events_consumer(
     msg_id: int,
     stream_queue: asyncio.Queue[Event],
     no_attributes: bool,
+    columnar: bool,
 ) -> None:
     """Stream events from the queue."""
     while True:
@@ -344,7 +397,12 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if history_states := _events_to_compressed_states(events, no_attributes):
+        history_states: Mapping[str, Any] = _events_to_compressed_states(
+            events, no_attributes
+        )
+        if columnar:
+            history_states = history.compressed_states_to_columns(history_states)
+        if history_states:
             connection.send_message(
                 json_bytes(
                     messages.event_message(
@@ -401,6 +459,8 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=4)),
     }
 )
 @websocket_api.async_response
@@ -440,6 +500,8 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    columnar = msg["columnar"]
+    max_points: int | None = msg.get("max_points")
 
     if end_time and end_time <= utc_now:
         if (
@@ -465,6 +527,8 @@ async def ws_stream(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            columnar,
+            max_points,
             True,
         )
         return
@@ -529,6 +593,8 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        columnar,
+        max_points,
         True,
     )
 
@@ -543,6 +609,7 @@ async def ws_stream(
             msg_id,
             stream_queue,
             no_attributes,
+            columnar,
         )
     )
 
@@ -570,5 +637,7 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        columnar,
+        max_points,
         send_empty=not last_event_time,
     )
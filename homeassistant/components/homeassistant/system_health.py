@@ -6,7 +6,7 @@ from typing import Any
 
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import system_info
+from homeassistant.helpers import system_info, template
 
 
 @callback
@@ -20,6 +20,7 @@ def async_register(
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
+    template_cache_stats = template.async_get_template_cache_stats(hass)
 
     return {
         "version": f"core-{info.get('version')}",
@@ -35,4 +36,16 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
+        "template_compiled_cache": _format_cache_stats(
+            template_cache_stats["compiled"]
+        ),
+        "template_render_cache": _format_cache_stats(template_cache_stats["render"]),
     }
+
+
+def _format_cache_stats(stats: dict[str, int]) -> str:
+    """Format the statistics of a template cache."""
+    return (
+        f"{stats['size']}/{stats['max_size']} entries, {stats['hits']} hits, "
+        f"{stats['misses']} misses, {stats['evictions']} evictions"
+    )
@@ -13,6 +13,7 @@ import time
 from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
+from influxdb.line_protocol import make_lines
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
 from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
 from influxdb_client.rest import ApiException
@@ -47,12 +48,17 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
+    BATCH_BUFFER_SIZE_MAX,
+    BATCH_BUFFER_SIZE_MIN,
     BATCH_TIMEOUT,
+    BATCH_WRITE_LATENCY,
+    BUFFERED_MESSAGE,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
@@ -65,6 +71,7 @@ from .const import (
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_GZIP,
     CONF_IGNORE_ATTRIBUTES,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
@@ -74,6 +81,7 @@ from .const import (
     CONF_SSL_CA_CERT,
     CONF_TAGS,
     CONF_TAGS_ATTRIBUTES,
+    CONF_WRITE_BUFFER_SIZE,
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
@@ -99,9 +107,12 @@ from .const import (
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
+    WRITE_BUFFER_DIR,
     WRITE_ERROR,
+    WROTE_BUFFERED_MESSAGE,
     WROTE_MESSAGE,
 )
+from .write_buffer import WriteBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -186,6 +197,10 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
             {cv.string: _CUSTOMIZE_ENTITY_SCHEMA}
         ),
+        # Size of the on-disk write buffer in MiB
+        vol.Optional(CONF_WRITE_BUFFER_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
     }
 )
 
@@ -329,6 +344,7 @@ class InfluxClient:
     write: Callable[[str], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
+    write_lines: Callable[[str], None]
 
 
 def get_influx_connection(  # noqa: C901
@@ -348,10 +364,15 @@ def get_influx_connection(  # noqa: C901
         kwargs[CONF_VERIFY_SSL] = conf[CONF_VERIFY_SSL]
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
+        if conf.get(CONF_GZIP):
+            kwargs["enable_gzip"] = True
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
+        # Failed writes are only reported by the synchronous API, they are
+        # needed to buffer the events on disk
+        write_mode = SYNCHRONOUS if CONF_WRITE_BUFFER_SIZE in conf else ASYNCHRONOUS
+        initial_write_mode = SYNCHRONOUS if test_write else write_mode
         write_api = influx.write_api(write_options=initial_write_mode)
 
         def write_v2(json):
@@ -391,7 +412,7 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
+            write_api = influx.write_api(write_options=write_mode)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -400,7 +421,7 @@ def get_influx_connection(  # noqa: C901
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, query_v2, close_v2, write_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -429,12 +450,15 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
+    if conf.get(CONF_GZIP):
+        kwargs[CONF_GZIP] = True
+
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
+    def write_v1(json, **write_kwargs):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, time_precision=precision, **write_kwargs)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -461,6 +485,10 @@ def get_influx_connection(  # noqa: C901
                 raise ValueError(QUERY_ERROR % (query, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
+    def write_lines_v1(lines):
+        """Write line protocol data to V1 influx."""
+        write_v1(lines, protocol="line")
+
     def close_v1():
         """Close the V1 Influx client."""
         influx.close()
@@ -472,7 +500,7 @@ def get_influx_connection(  # noqa: C901
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, query_v1, close_v1, write_lines_v1)
 
 
 def _retry_setup(hass: HomeAssistant, config: ConfigType) -> None:
@@ -493,7 +521,20 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    write_buffer = None
+    if (write_buffer_size := conf.get(CONF_WRITE_BUFFER_SIZE)) is not None:
+        write_buffer = WriteBuffer(
+            hass.config.path(STORAGE_DIR, WRITE_BUFFER_DIR),
+            write_buffer_size * 1024 * 1024,
+        )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        conf.get(CONF_PRECISION),
+        write_buffer,
+    )
     instance.start()
 
     def shutdown(event):
@@ -510,7 +551,15 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        influx: InfluxClient,
+        event_to_json: Callable[[Event], dict[str, Any] | None],
+        max_tries: int,
+        precision: str | None = None,
+        write_buffer: WriteBuffer | None = None,
+    ) -> None:
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[
@@ -519,7 +568,11 @@ class InfluxThread(threading.Thread):
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.precision = precision
+        self.write_buffer = write_buffer
+        self.batch_size = BATCH_BUFFER_SIZE
         self.write_errors = 0
+        self.next_buffer_write = 0.0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -544,8 +597,14 @@ class InfluxThread(threading.Thread):
         dropped = 0
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+            while len(json) < self.batch_size and not self.shutdown:
+                if count:
+                    timeout = self.batch_timeout()
+                elif self.write_buffer is not None and self.write_buffer.count:
+                    # Wake up to retry the buffered events while idle
+                    timeout = RETRY_DELAY
+                else:
+                    timeout = None
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
@@ -555,7 +614,8 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
-                    if age < queue_seconds:
+                    # Old events are kept if they can be buffered on disk
+                    if age < queue_seconds or self.write_buffer is not None:
                         if event_json := self.event_to_json(event):
                             json.append(event_json)
                     else:
@@ -570,9 +630,17 @@ class InfluxThread(threading.Thread):
 
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
+        if self.write_buffer is not None and self.write_buffer.count:
+            # Keep the order of the events while the buffer is written
+            self.buffer_events(json)
+            self.write_buffered_events()
+            return
+
         for retry in range(self.max_tries + 1):
             try:
+                start = time.monotonic()
                 self.influx.write(json)
+                self.adapt_batch_size(time.monotonic() - start)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
@@ -586,17 +654,65 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.write_buffer is not None:
+                    _LOGGER.error(BUFFERED_MESSAGE, err)
+                    self.next_buffer_write = time.monotonic() + RETRY_DELAY
+                    self.buffer_events(json)
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
                     self.write_errors += len(json)
 
+    def buffer_events(self, json):
+        """Buffer preprocessed events on disk in line protocol."""
+        assert self.write_buffer is not None
+        if not self.write_buffer.append(
+            make_lines({"points": json}, self.precision), len(json)
+        ):
+            self.write_errors += len(json)
+
+    def write_buffered_events(self):
+        """Write the buffered events, oldest first, until a write fails."""
+        assert self.write_buffer is not None
+        if time.monotonic() < self.next_buffer_write:
+            return
+        while not self.shutdown and (batch := self.write_buffer.peek()) is not None:
+            lines, count = batch
+            try:
+                self.influx.write_lines(lines)
+            except ValueError as err:
+                _LOGGER.error(err)
+            except ConnectionError:
+                self.next_buffer_write = time.monotonic() + RETRY_DELAY
+                return
+            else:
+                _LOGGER.debug(WROTE_BUFFERED_MESSAGE, count)
+            self.write_buffer.pop()
+
+    def adapt_batch_size(self, latency):
+        """Adapt the batch size to the write latency and the backlog.
+
+        Slow writes halve the batch size. While more events are queued than
+        fit in a batch, the batch size doubles to catch up with fewer writes,
+        and it returns to the default once the queue is drained. Writes with
+        the asynchronous V2 API return before the points are sent, so only
+        the backlog adapts the batch size then.
+        """
+        if latency > BATCH_WRITE_LATENCY:
+            self.batch_size = max(self.batch_size // 2, BATCH_BUFFER_SIZE_MIN)
+        elif self.queue.qsize() > self.batch_size:
+            self.batch_size = min(self.batch_size * 2, BATCH_BUFFER_SIZE_MAX)
+        elif self.batch_size > BATCH_BUFFER_SIZE:
+            self.batch_size = max(self.batch_size // 2, BATCH_BUFFER_SIZE)
+
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
             _, json = self.get_events_json()
             if json:
                 self.write_to_influxdb(json)
+            elif self.write_buffer is not None and self.write_buffer.count:
+                self.write_buffered_events()
 
     def block_till_done(self):
         """Block till all events processed.
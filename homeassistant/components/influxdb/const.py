@@ -33,6 +33,8 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_GZIP = "gzip"
+CONF_WRITE_BUFFER_SIZE = "write_buffer_size"
 
 CONF_QUERIES = "queries"
 CONF_QUERIES_FLUX = "queries_flux"
@@ -78,6 +80,10 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BATCH_BUFFER_SIZE_MIN = 25
+BATCH_BUFFER_SIZE_MAX = 5000
+BATCH_WRITE_LATENCY = 2  # seconds
+WRITE_BUFFER_DIR = "influxdb_write_buffer"
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +126,12 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+BUFFERED_MESSAGE = "%s Buffering events on disk until InfluxDB is reachable again."
+BUFFER_FULL_MESSAGE = "Write buffer is full, dropped %d buffered events."
+BUFFER_LOAD_ERROR_MESSAGE = "Could not load the write buffer: %s"
+BUFFER_WRITE_ERROR_MESSAGE = "Could not buffer %d events on disk, they are lost: %s"
+BUFFER_READ_ERROR_MESSAGE = "Could not read %d buffered events, they are lost: %s"
+WROTE_BUFFERED_MESSAGE = "Wrote %d buffered events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -143,6 +155,7 @@ COMPONENT_CONFIG_SCHEMA_CONNECTION = {
     vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): cv.boolean,
     vol.Optional(CONF_SSL_CA_CERT): cv.isfile,
     vol.Optional(CONF_PRECISION): vol.In(["ms", "s", "us", "ns"]),
+    vol.Optional(CONF_GZIP, default=False): cv.boolean,
     # Connection config for V1 API only.
     vol.Inclusive(CONF_USERNAME, "authentication"): cv.string,
     vol.Inclusive(CONF_PASSWORD, "authentication"): cv.string,
@@ -0,0 +1,123 @@
+"""On-disk buffer for events which could not be written to InfluxDB."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import suppress
+import gzip
+import logging
+import os
+
+from .const import (
+    BUFFER_FULL_MESSAGE,
+    BUFFER_LOAD_ERROR_MESSAGE,
+    BUFFER_READ_ERROR_MESSAGE,
+    BUFFER_WRITE_ERROR_MESSAGE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_SUFFIX = ".lp.gz"
+
+
+class WriteBuffer:
+    """Batches of points in line protocol, kept on disk until they are written.
+
+    Every batch is stored gzip compressed in its own file. The file name
+    holds a sequence number, so batches are written in the order they
+    were buffered, even after a restart, and the number of points in the
+    batch. When the buffer exceeds its size the oldest batches are dropped.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the buffer and load the batches of a previous run."""
+        self.path = path
+        self.max_size = max_size
+        self.size = 0
+        self.count = 0
+        # Sequence number, file size and number of points of each batch
+        self._batches: deque[tuple[int, int, int]] = deque()
+        try:
+            os.makedirs(path, exist_ok=True)
+            file_names = sorted(os.listdir(path))
+        except OSError as err:
+            _LOGGER.error(BUFFER_LOAD_ERROR_MESSAGE, err)
+            return
+        for file_name in file_names:
+            if not file_name.endswith(_SUFFIX):
+                continue
+            seq_str, _, count_str = file_name.removesuffix(_SUFFIX).partition("-")
+            try:
+                seq, count = int(seq_str), int(count_str)
+            except ValueError:
+                _LOGGER.debug("Ignoring unknown file %s in the write buffer", file_name)
+                continue
+            try:
+                file_size = os.path.getsize(os.path.join(path, file_name))
+            except OSError as err:
+                _LOGGER.error(BUFFER_READ_ERROR_MESSAGE, count, err)
+                continue
+            self._batches.append((seq, file_size, count))
+            self.size += file_size
+            self.count += count
+
+    def _file_path(self, seq: int, count: int) -> str:
+        """Return the path of the file of a batch."""
+        return os.path.join(self.path, f"{seq:012d}-{count}{_SUFFIX}")
+
+    def append(self, lines: str, count: int) -> bool:
+        """Buffer a batch of points, dropping the oldest batches if full.
+
+        Returns False if the batch could not be written to disk.
+        """
+        seq = self._batches[-1][0] + 1 if self._batches else 0
+        data = gzip.compress(lines.encode(), compresslevel=1)
+        file_path = self._file_path(seq, count)
+        # Write to a temporary file first, so a crash can't leave a partial batch
+        try:
+            with open(f"{file_path}.tmp", "wb") as file:
+                file.write(data)
+            os.replace(f"{file_path}.tmp", file_path)
+        except OSError as err:
+            _LOGGER.error(BUFFER_WRITE_ERROR_MESSAGE, count, err)
+            with suppress(OSError):
+                os.unlink(f"{file_path}.tmp")
+            return False
+        self._batches.append((seq, len(data), count))
+        self.size += len(data)
+        self.count += count
+
+        dropped = 0
+        while self.size > self.max_size and len(self._batches) > 1:
+            dropped += self._batches[0][2]
+            self.pop()
+        if dropped:
+            _LOGGER.warning(BUFFER_FULL_MESSAGE, dropped)
+        return True
+
+    def peek(self) -> tuple[str, int] | None:
+        """Return the oldest batch and its number of points.
+
+        Batches which can't be read are dropped.
+        """
+        while self._batches:
+            seq, _, count = self._batches[0]
+            try:
+                with gzip.open(self._file_path(seq, count), "rt") as file:
+                    return file.read(), count
+            except (OSError, EOFError) as err:
+                _LOGGER.error(BUFFER_READ_ERROR_MESSAGE, count, err)
+                self.pop()
+        return None
+
+    def pop(self) -> None:
+        """Remove the oldest batch."""
+        seq, file_size, count = self._batches.popleft()
+        self.size -= file_size
+        self.count -= count
+        try:
+            os.unlink(self._file_path(seq, count))
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            _LOGGER.error("Could not remove a buffered batch: %s", err)
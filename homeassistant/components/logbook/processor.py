@@ -11,6 +11,8 @@ from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -143,33 +145,57 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
+            stmt = self._statement_for_request(session, start_day, end_day)
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Stream events for a period of time.
+
+        Rows are read with a streaming cursor and humanified as
+        they arrive so the full result set is never held in memory.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._statement_for_request(session, start_day, end_day)
+            yield from _humanify(
+                self.hass,
+                execute_stmt_lambda_element(session, stmt, orm_rows=False, stream=True),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
+            )
+
+    def _statement_for_request(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Build the statement for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
@@ -117,5 +117,5 @@ class LogbookView(HomeAssistantView):
             )
 
         return cast(
-            web.Response, await get_instance(hass).async_add_executor_job(json_events)
+            web.Response, await get_instance(hass).async_add_query_job(json_events)
         )
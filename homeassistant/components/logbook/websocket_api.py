@@ -35,6 +35,10 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# maximum number of historical events in a single stream message
+MAX_EVENTS_PER_MESSAGE = 1000
+# how long to wait for the connection to take a historical chunk
+CHUNK_SEND_TIMEOUT = 60
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -105,6 +109,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -127,6 +132,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -139,6 +145,7 @@ async def _async_send_historical_events(
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -160,6 +167,7 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -168,7 +176,34 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+
+    async def _async_send_chunk(message: bytes) -> bool:
+        """Send a chunk and wait until the connection writer has taken it."""
+        if msg_id not in connection.subscriptions:
+            return False
+        taken: asyncio.Future[None] = hass.loop.create_future()
+
+        def _take_chunk() -> bytes:
+            if not taken.done():
+                taken.set_result(None)
+            return message
+
+        connection.send_message(_take_chunk)
+        try:
+            async with asyncio.timeout(CHUNK_SEND_TIMEOUT):
+                await taken
+        except TimeoutError:
+            _LOGGER.debug("Client did not take historical events, stopping")
+            return False
+        return True
+
+    def _send_chunk(message: bytes) -> bool:
+        """Send a chunk of historical events from the executor."""
+        return asyncio.run_coroutine_threadsafe(
+            _async_send_chunk(message), hass.loop
+        ).result()
+
+    return await get_instance(hass).async_add_query_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -176,6 +211,7 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        _send_chunk,
     )
 
 
@@ -197,12 +233,46 @@ def _ws_stream_get_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    send_chunk: Callable[[bytes], bool],
 ) -> tuple[bytes, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    """Fetch events and convert them to json in the executor.
+
+    Events are read from a streaming cursor and every
+    MAX_EVENTS_PER_MESSAGE events are handed to send_chunk
+    as a partial message so a large window is never held
+    in memory at once. send_chunk blocks until the connection
+    has taken the chunk and returns False if the stream has
+    gone away. The remaining events are returned.
+    """
+    events: list[dict[str, Any]] = []
     last_time = None
+    for event in event_processor.iter_events(start_day, end_day):
+        events.append(event)
+        if len(events) == MAX_EVENTS_PER_MESSAGE:
+            last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+            sent = send_chunk(
+                _ws_stream_message(msg_id, events, start_day, end_day, formatter, True)
+            )
+            events = []
+            if not sent:
+                break
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+    return (
+        _ws_stream_message(msg_id, events, start_day, end_day, formatter, partial),
+        last_time,
+    )
+
+
+def _ws_stream_message(
+    msg_id: int,
+    events: list[dict[str, Any]],
+    start_day: dt,
+    end_day: dt,
+    formatter: Callable[[int, Any], dict[str, Any]],
+    partial: bool,
+) -> bytes:
+    """Generate a json stream message for a block of events."""
     message = _generate_stream_message(events, start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
@@ -210,7 +280,7 @@ def _ws_stream_get_events(
         # data in case the UI needs to show that historical
         # data is still loading in the future
         message["partial"] = True
-    return json_bytes(formatter(msg_id, message)), last_time
+    return json_bytes(formatter(msg_id, message))
 
 
 async def _async_events_consumer(
@@ -505,7 +575,7 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_query_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
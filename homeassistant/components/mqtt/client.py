@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass
-from functools import lru_cache
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any
 import uuid
 
 import certifi
+from lru import LRU
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -78,6 +79,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie
 from .util import get_file_path, get_mqtt_data, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -93,6 +95,12 @@ SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
 
+# The number of topics for which the matching subscriptions are cached
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
+# The maximum number of received messages handled before yielding to the loop
+MESSAGE_DISPATCH_CHUNK_SIZE = 100
+
 SubscribePayloadType = str | bytes  # Only bytes if encoding is None
 
 
@@ -231,7 +239,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -395,7 +402,19 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions: TopicTrie[Subscription] = TopicTrie()
+        self._matching_subscriptions_cache: LRU[str, list[Subscription]] = LRU(
+            MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+        )
+        self._matching_subscriptions_hits = 0
+        self._matching_subscriptions_misses = 0
+        # Messages received by the paho thread, waiting to be handled
+        # in the event loop, with the monotonic time they were received
+        self._pending_messages: deque[tuple[float, mqtt.MQTTMessage]] = deque()
+        self._drain_scheduled = False
+        self._max_message_queue_depth = 0
+        self._last_drain_latency = 0.0
+        self._max_drain_latency = 0.0
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -449,9 +468,29 @@ class MQTT:
         """Return the tracked subscriptions."""
         return [
             *chain.from_iterable(self._simple_subscriptions.values()),
-            *self._wildcard_subscriptions,
+            *self._wildcard_subscriptions.values(),
         ]
 
+    @callback
+    def matching_subscriptions_cache_stats(self) -> dict[str, int]:
+        """Return the statistics of the matching subscriptions cache."""
+        return {
+            "size": len(self._matching_subscriptions_cache),
+            "max_size": self._matching_subscriptions_cache.get_size(),
+            "hits": self._matching_subscriptions_hits,
+            "misses": self._matching_subscriptions_misses,
+        }
+
+    @callback
+    def message_dispatch_stats(self) -> dict[str, Any]:
+        """Return the statistics of the received message dispatch queue."""
+        return {
+            "queue_depth": len(self._pending_messages),
+            "max_queue_depth": self._max_message_queue_depth,
+            "last_drain_latency": round(self._last_drain_latency, 6),
+            "max_drain_latency": round(self._max_drain_latency, 6),
+        }
+
     def cleanup(self) -> None:
         """Clean up listeners."""
         while self._cleanup_on_unload:
@@ -478,8 +517,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -560,30 +599,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        if _is_simple_match(subscription.topic):
-            self._simple_subscriptions.setdefault(subscription.topic, []).append(
-                subscription
-            )
+        topic = subscription.topic
+        if _is_simple_match(topic):
+            self._simple_subscriptions.setdefault(topic, []).append(subscription)
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(topic, subscription)
+        self._async_invalidate_matching_subscriptions(topic)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -593,9 +627,19 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
+        self._async_invalidate_matching_subscriptions(topic)
+
+    @callback
+    def _async_invalidate_matching_subscriptions(self, topic: str) -> None:
+        """Invalidate cached matches affected by a subscription change."""
+        if _is_simple_match(topic):
+            # A simple subscription can only change the matches of its own topic
+            self._matching_subscriptions_cache.pop(topic, None)
+        else:
+            self._matching_subscriptions_cache.clear()
 
     @callback
     def _async_queue_subscriptions(
@@ -628,11 +672,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -642,7 +683,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -800,23 +840,60 @@ class MQTT:
     def _mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
-        """Message received callback."""
-        # MQTT messages tend to be high volume,
-        # and since they come in via a thread and need to be processed in the event loop,
-        # we want to avoid hass.add_job since most of the time is spent calling
-        # inspect to figure out how to run the callback.
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        MQTT messages tend to be high volume, especially when retained
+        messages are replayed after a (re)connect. Instead of scheduling
+        one callback in the event loop per message, messages are queued
+        and a single scheduled callback drains the queue.
+        """
+        self._pending_messages.append((time.monotonic(), msg))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.loop.call_soon_threadsafe(self._async_drain_messages)
+
+    @callback
+    def _async_drain_messages(self) -> None:
+        """Handle queued messages in chunks, yielding to the loop in between."""
+        pending = self._pending_messages
+        if (depth := len(pending)) > self._max_message_queue_depth:
+            self._max_message_queue_depth = depth
+        if depth:
+            # The oldest message in the chunk has waited the longest
+            latency = time.monotonic() - pending[0][0]
+            self._last_drain_latency = latency
+            if latency > self._max_drain_latency:
+                self._max_drain_latency = latency
+        for _ in range(min(depth, MESSAGE_DISPATCH_CHUNK_SIZE)):
+            _, msg = pending.popleft()
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling message on %s", msg.topic)
+        if not pending:
+            self._drain_scheduled = False
+            # The paho thread may have queued a message after the
+            # check above but before the flag was reset
+            if not pending:
+                return
+            self._drain_scheduled = True
+        self.loop.call_soon(self._async_drain_messages)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        """Return the subscriptions matching a topic.
+
+        Results are kept in a bounded LRU cache which is invalidated
+        when subscriptions are added or removed.
+        """
+        if (subscriptions := self._matching_subscriptions_cache.get(topic)) is not None:
+            self._matching_subscriptions_hits += 1
+            return subscriptions
+        self._matching_subscriptions_misses += 1
+        subscriptions = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            if subscription.matcher(topic)
-        )
+        subscriptions.extend(self._wildcard_subscriptions.match(topic))
+        self._matching_subscriptions_cache[topic] = subscriptions
         return subscriptions
 
     @callback
@@ -965,13 +1042,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
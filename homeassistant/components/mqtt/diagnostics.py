@@ -53,6 +53,7 @@ def _async_get_diagnostics(
 
     data = {
         "connected": is_connected(hass),
+        "message_dispatch": mqtt_instance.message_dispatch_stats(),
         "mqtt_config": redacted_config,
     }
 
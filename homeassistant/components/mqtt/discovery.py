@@ -21,8 +21,8 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
-from homeassistant.helpers.typing import DiscoveryInfoType
+from homeassistant.helpers.service_info.mqtt import MqttServiceInfo, ReceivePayloadType
+from homeassistant.helpers.typing import UNDEFINED, DiscoveryInfoType, UndefinedType
 from homeassistant.loader import async_get_mqtt
 from homeassistant.util.json import json_loads_object
 
@@ -86,6 +86,11 @@ MQTT_DISCOVERY_DONE = "mqtt_discovery_done_{}"
 
 TOPIC_BASE = "~"
 
+# Discovery messages exceeding this number in one event loop iteration
+# are decoded in the executor
+DISCOVERY_DECODE_EXECUTOR_THRESHOLD = 50
+DISCOVERY_DECODE_BATCH_SIZE = 250
+
 MQTT_ORIGIN_INFO_SCHEMA = vol.All(
     vol.Schema(
         {
@@ -103,9 +108,27 @@ class MQTTDiscoveryPayload(dict[str, Any]):
     discovery_data: DiscoveryInfoType
 
 
+def _decode_discovery_payloads(
+    payloads: list[ReceivePayloadType],
+) -> list[dict[str, Any] | ValueError]:
+    """Decode a batch of JSON discovery payloads.
+
+    This runs in the executor.
+    """
+    decoded_payloads: list[dict[str, Any] | ValueError] = []
+    for payload in payloads:
+        try:
+            decoded_payloads.append(json_loads_object(payload) if payload else {})
+        except ValueError as err:
+            decoded_payloads.append(err)
+    return decoded_payloads
+
+
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    get_mqtt_data(hass).discovery_already_discovered.remove(discovery_hash)
+    mqtt_data = get_mqtt_data(hass)
+    mqtt_data.discovery_already_discovered.remove(discovery_hash)
+    mqtt_data.discovery_payloads.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -168,11 +191,24 @@ async def async_start(  # noqa: C901
         )
     )
 
+    discovery_queue: deque[tuple[ReceiveMessage, str, str, str]] = deque()
+    # The last payload queued per discovery hash, it supersedes the last
+    # processed payload until the queue is drained
+    queued_payloads: dict[tuple[str, str], ReceivePayloadType] = {}
+    discovery_batch_running = False
+    messages_this_iteration = 0
+
+    @callback
+    def async_reset_message_count() -> None:
+        """Reset the number of messages received in this loop iteration."""
+        nonlocal messages_this_iteration
+        messages_this_iteration = 0
+
     @callback
-    def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
+    def async_discovery_message_received(msg: ReceiveMessage) -> None:
         """Process the received message."""
+        nonlocal discovery_batch_running, messages_this_iteration
         mqtt_data.last_discovery = time.time()
-        payload = msg.payload
         topic = msg.topic
         topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
 
@@ -195,14 +231,97 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = " ".join((node_id, object_id)) if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        if (
+            msg.payload
+            and discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+            and queued_payloads.get(
+                discovery_hash, mqtt_data.discovery_payloads.get(discovery_hash)
+            )
+            == msg.payload
+        ):
+            # Brokers replay all retained discovery messages on reconnect,
+            # skip decoding and validating payloads that did not change
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload for %s %s",
+                component,
+                discovery_id,
+            )
+            return
+
+        item = (msg, component, object_id, discovery_id)
+        if not discovery_batch_running:
+            if messages_this_iteration < DISCOVERY_DECODE_EXECUTOR_THRESHOLD:
+                if not messages_this_iteration:
+                    hass.loop.call_soon(async_reset_message_count)
+                messages_this_iteration += 1
+                async_process_discovery_message(*item, UNDEFINED)
+                return
+            # A burst of discovery messages, typically retained messages
+            # replayed after a (re)connect. Decode the rest of the burst in
+            # the executor, messages received meanwhile are queued to keep
+            # the order.
+            discovery_batch_running = True
+            hass.async_create_task(async_process_discovery_queue_in_batches())
+        discovery_queue.append(item)
+        queued_payloads[discovery_hash] = msg.payload
+
+    async def async_process_discovery_queue_in_batches() -> None:
+        """Process the queued discovery messages, decoding them in the executor."""
+        nonlocal discovery_batch_running
+        try:
+            while discovery_queue:
+                batch = [
+                    discovery_queue.popleft()
+                    for _ in range(
+                        min(len(discovery_queue), DISCOVERY_DECODE_BATCH_SIZE)
+                    )
+                ]
+                decoded_payloads = await hass.async_add_executor_job(
+                    _decode_discovery_payloads, [msg.payload for msg, *_ in batch]
+                )
+                for item, decoded_payload in zip(batch, decoded_payloads):
+                    try:
+                        async_process_discovery_message(*item, decoded_payload)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception(
+                            "Error processing discovery message on %s", item[0].topic
+                        )
+        finally:
+            discovery_batch_running = False
+            queued_payloads.clear()
+
+    @callback
+    def async_process_discovery_message(  # noqa: C901
+        msg: ReceiveMessage,
+        component: str,
+        object_id: str,
+        discovery_id: str,
+        decoded_payload: dict[str, Any] | ValueError | UndefinedType,
+    ) -> None:
+        """Process a received discovery message."""
+        payload = msg.payload
+        topic = msg.topic
+        discovery_hash = (component, discovery_id)
+
         if payload:
-            try:
-                discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
-            except ValueError:
+            if decoded_payload is UNDEFINED:
+                try:
+                    decoded_payload = json_loads_object(payload)
+                except ValueError as err:
+                    decoded_payload = err
+            if isinstance(decoded_payload, ValueError):
                 _LOGGER.warning("Unable to parse JSON %s: '%s'", object_id, payload)
                 return
+            discovery_payload = MQTTDiscoveryPayload(decoded_payload)
+            mqtt_data.discovery_payloads[discovery_hash] = payload
         else:
             discovery_payload = MQTTDiscoveryPayload({})
+            mqtt_data.discovery_payloads.pop(discovery_hash, None)
 
         for key in list(discovery_payload):
             abbreviated_key = key
@@ -262,10 +381,6 @@ async def async_start(  # noqa: C901
                         if topic[-1] == TOPIC_BASE:
                             availability_conf[CONF_TOPIC] = f"{topic[:-1]}{base}"
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = " ".join((node_id, object_id)) if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
@@ -0,0 +1,119 @@
+"""Topic trie to match MQTT topics against wildcard topic filters."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+MULTI_LEVEL_WILDCARD = "#"
+SINGLE_LEVEL_WILDCARD = "+"
+TOPIC_LEVEL_SEPARATOR = "/"
+
+
+class _TopicTrieNode(Generic[_T]):
+    """A node in the topic trie, representing one topic level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: list[_T] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Segment-level trie of MQTT topic filters.
+
+    Topic filters are split on the topic level separator and stored one
+    level per node, so matching a topic only visits the nodes that can
+    match it instead of testing every filter. The `+` and `#` wildcards
+    are stored as regular children and followed while matching.
+
+    Inserting and removing a filter only touches the nodes on its path.
+    """
+
+    __slots__ = ("_root", "_filters")
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        # topic filter -> number of values stored for it
+        self._filters: dict[str, int] = {}
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if at least one value is stored for a topic filter."""
+        return topic_filter in self._filters
+
+    def __len__(self) -> int:
+        """Return the number of stored values."""
+        return sum(self._filters.values())
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split(TOPIC_LEVEL_SEPARATOR):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values.append(value)
+        self._filters[topic_filter] = self._filters.get(topic_filter, 0) + 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the topic filter is unknown and ValueError if
+        the value is not stored for the topic filter.
+        """
+        node = self._root
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        for level in topic_filter.split(TOPIC_LEVEL_SEPARATOR):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+        if (count := self._filters[topic_filter] - 1) == 0:
+            del self._filters[topic_filter]
+        else:
+            self._filters[topic_filter] = count
+        # Prune the nodes that no longer lead to any value
+        for parent, level in reversed(path):
+            if node.values or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def values(self) -> Iterator[_T]:
+        """Iterate over all stored values."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            yield from node.values
+            stack.extend(node.children.values())
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic.
+
+        Follows the MQTT specification: `#` also matches the parent level
+        and wildcards at the first level do not match topics starting
+        with `$`.
+        """
+        levels = topic.split(TOPIC_LEVEL_SEPARATOR)
+        num_levels = len(levels)
+        wildcards_allowed = not topic.startswith("$")
+        matches: list[_T] = []
+        stack: list[tuple[_TopicTrieNode[_T], int]] = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            allow_wildcard = wildcards_allowed or index > 0
+            if allow_wildcard and (multi_level := children.get(MULTI_LEVEL_WILDCARD)):
+                matches.extend(multi_level.values)
+            if index == num_levels:
+                matches.extend(node.values)
+                continue
+            if allow_wildcard and (single_level := children.get(SINGLE_LEVEL_WILDCARD)):
+                stack.append((single_level, index + 1))
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+        return matches
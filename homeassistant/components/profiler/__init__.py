@@ -37,6 +37,7 @@ SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
+SERVICE_PROFILE_EVENT_BUS = "profile_event_bus"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -59,15 +60,19 @@ SERVICES = (
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
+    SERVICE_PROFILE_EVENT_BUS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+DEFAULT_EVENT_BUS_TOP = 20
+
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_TOP = "top"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -90,6 +95,11 @@ async def async_setup_entry(  # noqa: C901
         async with lock:
             await _async_generate_memory_profile(hass, call)
 
+    async def _async_run_event_bus_profile(call: ServiceCall) -> None:
+        if hass.bus.profile is not None:
+            raise HomeAssistantError("Event bus profiling already running")
+        await _async_generate_event_bus_profile(hass, call)
+
     async def _async_start_log_objects(call: ServiceCall) -> None:
         if LOG_INTERVAL_SUB in domain_data:
             raise HomeAssistantError("Object logging already started")
@@ -372,6 +382,21 @@ async def async_setup_entry(  # noqa: C901
         schema=vol.Schema({vol.Optional(CONF_ENABLED, default=True): cv.boolean}),
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE_EVENT_BUS,
+        _async_run_event_bus_profile,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_SECONDS, default=60.0): vol.Coerce(float),
+                vol.Optional(CONF_TOP, default=DEFAULT_EVENT_BUS_TOP): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=1024)
+                ),
+            }
+        ),
+    )
+
     return True
 
 
@@ -453,6 +478,68 @@ async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall)
     )
 
 
+async def _async_generate_event_bus_profile(hass: HomeAssistant, call: ServiceCall):
+    start_time = int(time.time() * 1000000)
+    persistent_notification.async_create(
+        hass,
+        (
+            "The event bus profile has started. This notification will be updated"
+            " when it is complete."
+        ),
+        title="Profile Started",
+        notification_id=f"event_bus_profiler_{start_time}",
+    )
+    hass.bus.async_start_profile()
+    try:
+        await asyncio.sleep(float(call.data[CONF_SECONDS]))
+    finally:
+        profile = hass.bus.async_stop_profile()
+    assert profile is not None
+    top = call.data[CONF_TOP]
+    result = profile.as_dict()
+
+    event_types = sorted(
+        result["event_types"].items(),
+        key=lambda item: item[1]["callback_time"],
+        reverse=True,
+    )
+    for event_type, stats in event_types[:top]:
+        _LOGGER.critical(
+            "Event type %s: fired %s times to %s listeners, %.6fs in callbacks",
+            event_type,
+            stats["fired"],
+            stats["listeners"],
+            stats["callback_time"],
+        )
+    jobs = sorted(
+        result["jobs"].items(), key=lambda item: item[1]["total_time"], reverse=True
+    )
+    for target, stats in jobs[:top]:
+        _LOGGER.critical(
+            "Event listener %s: %s calls, %.6fs total, %.6fs max, histogram %s",
+            target,
+            stats["calls"],
+            stats["total_time"],
+            stats["max_time"],
+            dict(
+                zip(
+                    [f"<={bucket}s" for bucket in result["buckets"]] + ["slower"],
+                    stats["histogram"],
+                )
+            ),
+        )
+
+    persistent_notification.async_create(
+        hass,
+        (
+            "The event bus profile has been written to the log. See [the"
+            " logs](/config/logs) to review the slowest event types and listeners."
+        ),
+        title="Profile Complete",
+        notification_id=f"event_bus_profiler_{start_time}",
+    )
+
+
 def _write_profile(profiler, cprofile_path, callgrind_path):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from contextlib import suppress
+import gzip
 import logging
 import string
 from typing import Any, TypeVar, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 from prometheus_client.metrics import MetricWrapperBase
 import voluptuous as vol
@@ -26,7 +27,7 @@ from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
 )
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES, ATTR_HUMIDITY
 from homeassistant.components.light import ATTR_BRIGHTNESS
 from homeassistant.components.sensor import SensorDeviceClass
@@ -109,8 +110,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -132,6 +131,8 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(metrics, conf[CONF_REQUIRES_AUTH]))
+
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
@@ -178,6 +179,12 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
+        # Every metric family is kept in its own registry, so it can be
+        # rendered on its own. The rendered text is cached until the family
+        # is touched again.
+        self._registries: dict[str, prometheus_client.CollectorRegistry] = {}
+        self._rendered: dict[str, bytes] = {}
+        self._dirty: set[str] = set()
         self._climate_units = climate_units
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
@@ -258,7 +265,7 @@ class PrometheusMetrics:
         self, entity_id: str, friendly_name: str | None = None
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
-        for metric in self._metrics.values():
+        for metric_key, metric in self._metrics.items():
             for sample in cast(list[prometheus_client.Metric], metric.collect())[
                 0
             ].samples:
@@ -272,6 +279,7 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+                    self._dirty.add(metric_key)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -299,18 +307,45 @@ class PrometheusMetrics:
             labels.extend(extra_labels)
 
         try:
-            return cast(_MetricBaseT, self._metrics[metric])
+            metric_wrapper = self._metrics[metric]
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(
+            registry = prometheus_client.CollectorRegistry(auto_describe=True)
+            metric_wrapper = factory(
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=registry,
             )
-            return cast(_MetricBaseT, self._metrics[metric])
+            self._registries[metric] = registry
+            self._metrics[metric] = metric_wrapper
+        # The metric is fetched to be updated, so its rendered text is stale
+        self._dirty.add(metric)
+        return cast(_MetricBaseT, metric_wrapper)
+
+    def render(self) -> bytes:
+        """Render the metrics in the Prometheus text format.
+
+        Only the metric families which changed since the last call are
+        rendered again, the others are taken from the cache. The collectors
+        of the global registry, like the process and platform collectors,
+        are always rendered.
+        """
+        # A family which is changed while it is rendered is marked dirty
+        # again and rendered on the next call
+        while self._dirty:
+            metric = self._dirty.pop()
+            self._rendered[metric] = prometheus_client.generate_latest(
+                self._registries[metric]
+            )
+        return b"".join(
+            [
+                prometheus_client.generate_latest(prometheus_client.REGISTRY),
+                *(self._rendered.get(metric, b"") for metric in list(self._metrics)),
+            ]
+        )
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -723,15 +758,26 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, metrics: PrometheusMetrics, requires_auth: bool) -> None:
         """Initialize Prometheus view."""
+        self.metrics = metrics
         self.requires_auth = requires_auth
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
-        )
+        hass = request.app[KEY_HASS]
+        compress = "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, "")
+        body = await hass.async_add_executor_job(self._render, compress)
+        response = web.Response(body=body, content_type=CONTENT_TYPE_TEXT_PLAIN)
+        if compress:
+            response.headers[hdrs.CONTENT_ENCODING] = "gzip"
+        return response
+
+    def _render(self, compress: bool) -> bytes:
+        """Render the metrics, gzip compressed if requested."""
+        body = self.metrics.render()
+        if compress:
+            return gzip.compress(body, compresslevel=1)
+        return body
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
 from typing import Any
 
@@ -50,16 +51,21 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_DB_QUERY_WORKERS = 4
+DEFAULT_DB_QUERY_TIMEOUT = timedelta(minutes=5)
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_QUERY_WORKERS = "db_query_workers"
+CONF_DB_QUERY_TIMEOUT = "db_query_timeout"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_COALESCE = "coalesce"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -103,12 +109,21 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_COALESCE, default=dict): {
+                        cv.string: cv.positive_time_period
+                    },
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
                     vol.Optional(
                         CONF_DB_RETRY_WAIT, default=DEFAULT_DB_RETRY_WAIT
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_DB_QUERY_WORKERS, default=DEFAULT_DB_QUERY_WORKERS
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=32)),
+                    vol.Optional(
+                        CONF_DB_QUERY_TIMEOUT, default=DEFAULT_DB_QUERY_TIMEOUT
+                    ): cv.positive_time_period,
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
@@ -161,6 +176,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        coalesce_windows=conf[CONF_COALESCE],
+        query_workers=conf[CONF_DB_QUERY_WORKERS],
+        query_timeout=conf[CONF_DB_QUERY_TIMEOUT],
     )
     instance.async_initialize()
     instance.async_register()
@@ -0,0 +1,154 @@
+"""Queue of the tasks and events waiting for the recorder thread."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event
+
+if TYPE_CHECKING:
+    from .tasks import RecorderTask
+
+
+class _CoalescedEvent:
+    """A queued state_changed event that newer events of the entity replace."""
+
+    __slots__ = ("entity_id", "event", "first_fired")
+
+    def __init__(self, entity_id: str, event: Event) -> None:
+        """Initialize the queued event."""
+        self.entity_id = entity_id
+        self.event = event
+        self.first_fired = event.time_fired_timestamp
+
+
+class RecorderQueue:
+    """FIFO queue that applies backpressure instead of growing unbounded.
+
+    Tasks are always queued. A state_changed event of an entity in a
+    domain with a coalesce window replaces the queued state_changed event
+    of the same entity that was fired less than the window before it, so
+    only the last state within the window is recorded.
+
+    Once the backlog reaches the high water mark the state changes of all
+    entities are coalesced until it drains, and while shedding is enabled
+    events other than state changes are dropped. As tasks and events keep
+    their order, statistics and purge tasks still see every event queued
+    before them recorded.
+    """
+
+    def __init__(self, coalesce_windows: dict[str, float], high_water: int) -> None:
+        """Initialize the queue."""
+        self._items: deque[RecorderTask | Event | _CoalescedEvent] = deque()
+        self._not_empty = threading.Condition(threading.Lock())
+        self._coalesced_events: dict[str, _CoalescedEvent] = {}
+        self.coalesce_windows = coalesce_windows
+        self.high_water = high_water
+        self.shed_events = False
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_size = 0
+
+    def qsize(self) -> int:
+        """Return the number of queued tasks and events."""
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """Return if the queue is empty."""
+        return not self._items
+
+    @property
+    def backpressure(self) -> bool:
+        """Return if the state changes of all entities are coalesced."""
+        return len(self._items) >= self.high_water
+
+    def put(self, item: RecorderTask | Event) -> None:
+        """Queue a task or an event without coalescing it."""
+        with self._not_empty:
+            self._append(item)
+
+    def put_event(self, event: Event, entity_id: Any) -> None:
+        """Queue an event, coalescing or dropping it under backpressure."""
+        with self._not_empty:
+            if event.event_type != EVENT_STATE_CHANGED or not isinstance(
+                entity_id, str
+            ):
+                if self.shed_events:
+                    self.dropped += 1
+                else:
+                    self._append(event)
+                return
+            window: float | None = None
+            if len(self._items) >= self.high_water:
+                window = math.inf
+            elif self.coalesce_windows:
+                window = self.coalesce_windows.get(entity_id.partition(".")[0])
+            if window is None:
+                self._append(event)
+                return
+            # States of removed entities are never coalesced so the
+            # removal and the next state of the entity are both recorded
+            if (
+                (queued := self._coalesced_events.get(entity_id)) is not None
+                and event.data.get("new_state") is not None
+                and queued.event.data.get("new_state") is not None
+                and event.time_fired_timestamp - queued.first_fired <= window
+            ):
+                queued.event = event
+                self.coalesced += 1
+                return
+            queued = self._coalesced_events[entity_id] = _CoalescedEvent(
+                entity_id, event
+            )
+            self._append(queued)
+
+    def get(self) -> RecorderTask | Event:
+        """Remove and return the next task or event, waiting for one."""
+        with self._not_empty:
+            while not self._items:
+                self._not_empty.wait()
+            return self._pop()
+
+    def get_nowait(self) -> RecorderTask | Event:
+        """Remove and return the next task or event.
+
+        Raises queue.Empty if the queue is empty.
+        """
+        with self._not_empty:
+            if not self._items:
+                raise queue.Empty
+            return self._pop()
+
+    def _append(self, item: RecorderTask | Event | _CoalescedEvent) -> None:
+        """Append an item and wake up the recorder thread."""
+        items = self._items
+        items.append(item)
+        if len(items) > self.max_size:
+            self.max_size = len(items)
+        self._not_empty.notify()
+
+    def _pop(self) -> RecorderTask | Event:
+        """Pop the next item, unwrapping coalesced events."""
+        item = self._items.popleft()
+        if not isinstance(item, _CoalescedEvent):
+            return item
+        if self._coalesced_events.get(item.entity_id) is item:
+            del self._coalesced_events[item.entity_id]
+        return item.event
+
+    def stats(self) -> dict[str, Any]:
+        """Return the queue metrics."""
+        return {
+            "backlog": len(self._items),
+            "max_backlog_seen": self.max_size,
+            "high_water": self.high_water,
+            "backpressure": self.backpressure,
+            "shedding": self.shed_events,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
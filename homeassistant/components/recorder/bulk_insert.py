@@ -0,0 +1,226 @@
+"""Multi-row inserts of the states and events recorded between commits.
+
+Adding one ORM object per state or event to the session makes the unit
+of work sort, flush and refresh every row on commit, which dominates the
+recorder thread at high event rates. Instead the recorder collects
+compact pending rows that reference their related rows by id or by the
+ORM object still pending in the session and writes them with a single
+executemany INSERT per table when the session is committed.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, State
+
+from .db_schema import (
+    EVENT_ORIGIN_TO_IDX,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+_CONTEXT_COLUMNS = (
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+    "origin_idx",
+)
+_STATES_COLUMNS = (
+    "state",
+    "last_updated_ts",
+    "last_changed_ts",
+    *_CONTEXT_COLUMNS,
+)
+_EVENTS_COLUMNS = ("time_fired_ts", *_CONTEXT_COLUMNS)
+
+
+class PendingStates:
+    """A row of the states table that has not been inserted yet.
+
+    Mirrors the attributes of States that are used when recording a
+    state change so it can be linked the same way as the ORM object.
+    """
+
+    __slots__ = (
+        "state",
+        "last_updated_ts",
+        "last_changed_ts",
+        "context_id_bin",
+        "context_user_id_bin",
+        "context_parent_id_bin",
+        "origin_idx",
+        "entity_id",
+        "attributes",
+        "old_state",
+        "old_state_id",
+        "states_meta_rel",
+        "metadata_id",
+        "state_attributes",
+        "attributes_id",
+        "state_id",
+        "depth",
+    )
+
+    def __init__(self, event: Event) -> None:
+        """Create a pending row from a state_changed event."""
+        state: State | None = event.data.get("new_state")
+        context = event.context
+        self.context_id_bin = ulid_to_bytes_or_none(context.id)
+        self.context_user_id_bin = uuid_hex_to_bytes_or_none(context.user_id)
+        self.context_parent_id_bin = ulid_to_bytes_or_none(context.parent_id)
+        self.origin_idx = EVENT_ORIGIN_TO_IDX.get(event.origin)
+        self.entity_id: str | None = event.data["entity_id"]
+        self.attributes: str | None = None
+        self.old_state: States | PendingStates | None = None
+        self.old_state_id: int | None = None
+        self.states_meta_rel: StatesMeta | None = None
+        self.metadata_id: int | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.attributes_id: int | None = None
+        self.state_id: int | None = None
+        # Number of pending rows this row has to be inserted after
+        # as it links to their state_id
+        self.depth = 0
+        # None state means the state was removed from the state machine
+        if state is None:
+            self.state: str | None = ""
+            self.last_updated_ts = event.time_fired_timestamp
+            self.last_changed_ts: float | None = None
+            return
+        self.state = state.state
+        self.last_updated_ts = state.last_updated_timestamp
+        if state.last_updated == state.last_changed:
+            self.last_changed_ts = None
+        else:
+            self.last_changed_ts = state.last_changed_timestamp
+
+    def to_params(self) -> dict[str, Any]:
+        """Return the insert parameters with the linked ids resolved."""
+        params = {column: getattr(self, column) for column in _STATES_COLUMNS}
+        if (old_state := self.old_state) is not None:
+            params["old_state_id"] = old_state.state_id
+        else:
+            params["old_state_id"] = self.old_state_id
+        if (states_meta := self.states_meta_rel) is not None:
+            params["metadata_id"] = states_meta.metadata_id
+        else:
+            params["metadata_id"] = self.metadata_id
+        if (state_attributes := self.state_attributes) is not None:
+            params["attributes_id"] = state_attributes.attributes_id
+        else:
+            params["attributes_id"] = self.attributes_id
+        return params
+
+
+class PendingEvents:
+    """A row of the events table that has not been inserted yet."""
+
+    __slots__ = (
+        "time_fired_ts",
+        "context_id_bin",
+        "context_user_id_bin",
+        "context_parent_id_bin",
+        "origin_idx",
+        "event_type_rel",
+        "event_type_id",
+        "event_data_rel",
+        "data_id",
+    )
+
+    def __init__(self, event: Event) -> None:
+        """Create a pending row from an event."""
+        context = event.context
+        self.time_fired_ts = event.time_fired_timestamp
+        self.context_id_bin = ulid_to_bytes_or_none(context.id)
+        self.context_user_id_bin = uuid_hex_to_bytes_or_none(context.user_id)
+        self.context_parent_id_bin = ulid_to_bytes_or_none(context.parent_id)
+        self.origin_idx = EVENT_ORIGIN_TO_IDX.get(event.origin)
+        self.event_type_rel: EventTypes | None = None
+        self.event_type_id: int | None = None
+        self.event_data_rel: EventData | None = None
+        self.data_id: int | None = None
+
+    def to_params(self) -> dict[str, Any]:
+        """Return the insert parameters with the linked ids resolved."""
+        params = {column: getattr(self, column) for column in _EVENTS_COLUMNS}
+        if (event_type := self.event_type_rel) is not None:
+            params["event_type_id"] = event_type.event_type_id
+        else:
+            params["event_type_id"] = self.event_type_id
+        if (event_data := self.event_data_rel) is not None:
+            params["data_id"] = event_data.data_id
+        else:
+            params["data_id"] = self.data_id
+        return params
+
+
+def insert_pending_events(
+    session: Session, table: type[Events], pending: list[PendingEvents]
+) -> None:
+    """Insert the pending events.
+
+    The session must be flushed first so the pending event types and
+    event data have their ids.
+    """
+    session.execute(insert(table), [row.to_params() for row in pending])
+
+
+def insert_pending_states(
+    session: Session,
+    table: type[States],
+    pending: list[list[PendingStates]],
+) -> None:
+    """Insert the pending states and assign their state_id.
+
+    The pending states are grouped by their depth so every group only
+    links to states inserted by the previous groups. The state_ids
+    returned by the insert are matched back to the rows that later
+    states link to by metadata_id, which is unique for those rows in
+    a group.
+
+    The session must be flushed first so the pending states metadata and
+    state attributes have their ids.
+    """
+    for rows in pending:
+        linked: dict[int | None, PendingStates] = {}
+        linked_params: list[dict[str, Any]] = []
+        params: list[dict[str, Any]] = []
+        for row in rows:
+            row_params = row.to_params()
+            # Rows of removed entities are never linked to
+            if row.state is None:
+                params.append(row_params)
+                continue
+            if (metadata_id := row_params["metadata_id"]) in linked:
+                _insert_linked_states(session, table, linked, linked_params)
+                linked = {}
+                linked_params = []
+            linked[metadata_id] = row
+            linked_params.append(row_params)
+        if params:
+            session.execute(insert(table), params)
+        if linked_params:
+            _insert_linked_states(session, table, linked, linked_params)
+
+
+def _insert_linked_states(
+    session: Session,
+    table: type[States],
+    linked: dict[int | None, PendingStates],
+    params: list[dict[str, Any]],
+) -> None:
+    """Insert states that later states link to and assign their state_id."""
+    result = session.execute(
+        insert(table).returning(table.state_id, table.metadata_id), params
+    )
+    for state_id, metadata_id in result:
+        linked[metadata_id].state_id = state_id
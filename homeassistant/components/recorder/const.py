@@ -40,6 +40,7 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_QUERY_WORKER_PREFIX = "DbQueryWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
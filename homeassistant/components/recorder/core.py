@@ -42,8 +42,16 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .backlog import RecorderQueue
+from .bulk_insert import (
+    PendingEvents,
+    PendingStates,
+    insert_pending_events,
+    insert_pending_states,
+)
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
+    DB_QUERY_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
@@ -77,9 +85,10 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, DBQueryExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -130,6 +139,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_query_timeout_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -179,6 +189,9 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        coalesce_windows: dict[str, timedelta],
+        query_workers: int,
+        query_timeout: timedelta,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -191,10 +204,20 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
-        self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        self._queue = RecorderQueue(
+            {
+                domain: window.total_seconds()
+                for domain, window in coalesce_windows.items()
+            },
+            MAX_QUEUE_BACKLOG_MIN_VALUE // 2,
+        )
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        # Read only queries run on their own workers and connections
+        # on databases that serve concurrent queries well
+        self.query_workers = query_workers
+        self.query_timeout = query_timeout.total_seconds()
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -206,6 +229,7 @@ class Recorder(threading.Thread):
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
+        self._last_checked_backlog = 0
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
         # The entity_filter is exposed on the recorder instance so that
@@ -217,6 +241,11 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # States and events to insert with a single statement per table
+        # and depth of the old_state_id links on the next commit
+        self._bulk_insert_states = False
+        self._pending_states: list[list[PendingStates]] = []
+        self._pending_events: list[PendingEvents] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -225,6 +254,7 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.purge_progress = PurgeProgress()
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -235,6 +265,9 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._query_executor: DBQueryExecutor | None = None
+        self._query_engine: Engine | None = None
+        self._get_query_session: scoped_session[Session] | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -257,6 +290,23 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    @property
+    def backlog_stats(self) -> dict[str, Any]:
+        """Return the metrics of the recorder backlog."""
+        return self._queue.stats()
+
+    @property
+    def query_pool_stats(self) -> dict[str, Any] | None:
+        """Return the metrics of the read only query pool, if any."""
+        if self._query_executor is None:
+            return None
+        return self._query_executor.stats()
+
+    @property
+    def purge_stats(self) -> dict[str, Any] | None:
+        """Return the progress of the current or last purge, if any."""
+        return self.purge_progress.stats()
+
     @property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -269,6 +319,13 @@ class Recorder(threading.Thread):
             SQLITE_URL_PREFIX
         )
 
+    @property
+    def _uses_query_pool(self) -> bool:
+        """Return if read only queries run on their own connection pool."""
+        return bool(self.query_workers) and not self.db_url.startswith(
+            SQLITE_URL_PREFIX
+        )
+
     @property
     def recording(self) -> bool:
         """Return if the recorder is recording."""
@@ -278,6 +335,11 @@ class Recorder(threading.Thread):
         """Get a new sqlalchemy session."""
         if self._get_session is None:
             raise RuntimeError("The database connection has not been established")
+        if (
+            self._get_query_session is not None
+            and threading.current_thread().name.startswith(DB_QUERY_WORKER_PREFIX)
+        ):
+            return self._get_query_session()
         return self._get_session()
 
     def queue_task(self, task: RecorderTask | Event) -> None:
@@ -296,18 +358,29 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self._uses_query_pool:
+            self._query_executor = DBQueryExecutor(
+                thread_name_prefix=DB_QUERY_WORKER_PREFIX,
+                max_workers=self.query_workers,
+                shutdown_hook=self._shutdown_query_session,
+            )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    def _shutdown_query_session(self) -> None:
+        """Close the query session of the current thread."""
+        if self._get_query_session is not None:
+            self._get_query_session.remove()
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_put = self._queue.put_event
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -316,23 +389,23 @@ class Recorder(threading.Thread):
                 return
 
             if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
-                queue_put(event)
+                queue_put(event, None)
                 return
 
             if isinstance(entity_id, str):
                 if entity_filter(entity_id):
-                    queue_put(event)
+                    queue_put(event, entity_id)
                 return
 
             if isinstance(entity_id, list):
                 for eid in entity_id:
                     if entity_filter(eid):
-                        queue_put(event)
+                        queue_put(event, None)
                         return
                 return
 
             # Unknown what it is.
-            queue_put(event)
+            queue_put(event, None)
 
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL,
@@ -369,8 +442,29 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    async def async_add_query_job(self, target: Callable[..., T], *args: Any) -> T:
+        """Run a read only query job from within the event loop.
+
+        The job runs on the query pool if there is one, so long queries
+        don't hold up the database executor. If the job doesn't finish
+        within the query timeout, TimeoutError is raised and the job is
+        cancelled if it has not started yet.
+        """
+        if (executor := self._query_executor) is None:
+            return await self.async_add_executor_job(target, *args)
+        future = self.hass.loop.run_in_executor(executor, target, *args)
+        try:
+            async with asyncio.timeout(self.query_timeout):
+                return await future
+        except TimeoutError:
+            executor.record_timeout()
+            raise
+
     def _stop_executor(self) -> None:
         """Stop the executor."""
+        if self._query_executor is not None:
+            self._query_executor.shutdown()
+            self._query_executor = None
         if self._db_executor is None:
             return
         self._db_executor.shutdown()
@@ -384,7 +478,35 @@ class Recorder(threading.Thread):
         """
         size = self.backlog
         _LOGGER.debug("Recorder queue size is: %s", size)
+        queue_ = self._queue
+        last_size, self._last_checked_backlog = self._last_checked_backlog, size
         if not self._reached_max_backlog_percentage(100):
+            queue_.high_water = self.max_backlog // 2
+            if queue_.shed_events:
+                _LOGGER.warning(
+                    "The recorder backlog queue recovered to %s events; "
+                    "all events are recorded again",
+                    size,
+                )
+                queue_.shed_events = False
+            return
+        # Shed load first and only stop recording if the backlog
+        # still keeps growing as only the last state of each entity
+        # is queued while shedding
+        if not queue_.shed_events:
+            _LOGGER.warning(
+                (
+                    "The recorder backlog queue reached the maximum size of %s "
+                    "events; usually, the system is CPU bound, I/O bound, or the "
+                    "database is corrupt due to a disk problem; The recorder "
+                    "will only record the last state of each entity and drop "
+                    "other events until the backlog recovers"
+                ),
+                size,
+            )
+            queue_.shed_events = True
+            return
+        if size <= last_size:
             return
         _LOGGER.error(
             (
@@ -714,6 +836,29 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_event_to_session(
+        self, session: Session, dbevent: Events | PendingEvents
+    ) -> None:
+        """Add an event to the session or the pending events."""
+        if type(dbevent) is not PendingEvents:  # noqa: E721
+            self._add_to_session(session, dbevent)
+            return
+        self._event_session_has_pending_writes = True
+        self._pending_events.append(dbevent)
+
+    def _add_state_to_session(
+        self, session: Session, dbstate: States | PendingStates
+    ) -> None:
+        """Add a state to the session or the pending states."""
+        if type(dbstate) is not PendingStates:  # noqa: E721
+            self._add_to_session(session, dbstate)
+            return
+        self._event_session_has_pending_writes = True
+        pending = self._pending_states
+        while len(pending) <= dbstate.depth:
+            pending.append([])
+        pending[dbstate.depth].append(dbstate)
+
     def _run(self) -> None:
         """Start processing events to save."""
         self.thread_id = threading.get_ident()
@@ -1051,10 +1196,14 @@ class Recorder(threading.Thread):
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
+        event_type_manager = self.event_type_manager
+        dbevent: Events | PendingEvents
+        if event_type_manager.active:
+            dbevent = PendingEvents(event)
+        else:
+            dbevent = Events.from_event(event)
 
         # Map the event_type to the EventTypes table
-        event_type_manager = self.event_type_manager
         if pending_event_types := event_type_manager.get_pending(event.event_type):
             dbevent.event_type_rel = pending_event_types
         elif event_type_id := event_type_manager.get(event.event_type, session, True):
@@ -1066,7 +1215,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1091,7 +1240,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -1100,11 +1249,21 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        dbstate: States | PendingStates
+        if self._bulk_insert_states and states_meta_manager.active:
+            dbstate = PendingStates(event)
+        else:
+            dbstate = States.from_event(event)
 
         states_manager = self.states_manager
         if old_state := states_manager.pop_pending(entity_id):
+            # Pending states are only linked to by pending states
+            # as they are only used once the database supports it
             dbstate.old_state = old_state
+            if isinstance(old_state, PendingStates) and isinstance(
+                dbstate, PendingStates
+            ):
+                dbstate.depth = old_state.depth + 1
         elif old_state_id := states_manager.pop_committed(entity_id):
             dbstate.old_state_id = old_state_id
         if entity_removed:
@@ -1164,7 +1323,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1203,7 +1362,17 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_events or self._pending_states:
+            # Flush first so the rows the pending states and events
+            # link to have their ids
+            session.flush()
+            if self._pending_events:
+                insert_pending_events(session, Events, self._pending_events)
+            if self._pending_states:
+                insert_pending_states(session, States, self._pending_states)
         session.commit()
+        self._pending_events.clear()
+        self._pending_states.clear()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1235,6 +1404,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_events.clear()
+        self._pending_states.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1385,6 +1556,17 @@ class Recorder(threading.Thread):
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
 
+    def _setup_query_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific settings for the connections of the query pool."""
+        assert self.engine is not None
+        dialect_name = self.engine.dialect.name
+        setup_connection_for_dialect(self, dialect_name, dbapi_connection, False)
+        setup_query_timeout_for_dialect(
+            dialect_name, dbapi_connection, self.query_timeout
+        )
+
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
         kwargs: dict[str, Any] = {}
@@ -1427,7 +1609,25 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        # The state_ids of inserted states are needed to link the
+        # next state of the entity to them
+        self._bulk_insert_states = self.engine.dialect.insert_executemany_returning
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if self._uses_query_pool:
+            # A connection for every query worker is kept open
+            self._query_engine = create_engine(
+                self.db_url,
+                **kwargs,
+                pool_size=self.query_workers,
+                max_overflow=0,
+                future=True,
+            )
+            sqlalchemy_event.listen(
+                self._query_engine, "connect", self._setup_query_connection
+            )
+            self._get_query_session = scoped_session(
+                sessionmaker(bind=self._query_engine, future=True)
+            )
         _LOGGER.debug("Connected to recorder database")
 
     def _close_connection(self) -> None:
@@ -1435,7 +1635,11 @@ class Recorder(threading.Thread):
         if self.engine:
             self.engine.dispose()
             self.engine = None
+        if self._query_engine:
+            self._query_engine.dispose()
+            self._query_engine = None
         self._get_session = None
+        self._get_query_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
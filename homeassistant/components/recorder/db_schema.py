@@ -68,7 +68,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 42
+SCHEMA_VERSION = 43
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +84,9 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAY = "statistics_day"
+TABLE_STATISTICS_WEEK = "statistics_week"
+TABLE_STATISTICS_MONTH = "statistics_month"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -105,6 +108,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAY,
+    TABLE_STATISTICS_WEEK,
+    TABLE_STATISTICS_MONTH,
 ]
 
 TABLES_TO_CHECK = [
@@ -722,6 +728,65 @@ class StatisticsShortTerm(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsRollupBase(StatisticsBase):
+    """Statistics summarizing the hourly statistics of a day, week or month.
+
+    The periods start at midnight in the time zone of the installation, so
+    the duration is only nominal.
+    """
+
+    # The number of hourly statistics with a mean in the period
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDay(Base, StatisticsRollupBase):
+    """Daily statistics."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_day_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAY
+
+
+class StatisticsWeek(Base, StatisticsRollupBase):
+    """Weekly statistics."""
+
+    duration = timedelta(days=7)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_week_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_WEEK
+
+
+class StatisticsMonth(Base, StatisticsRollupBase):
+    """Monthly statistics."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        Index(
+            "ix_statistics_month_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTH
+
+
 class StatisticsMeta(Base):
     """Statistics meta data."""
 
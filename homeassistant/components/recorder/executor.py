@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import Future
 from concurrent.futures.thread import _threads_queues, _worker
 import threading
-from typing import Any
+import time
+from typing import Any, TypeVar
 import weakref
 
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
+_T = TypeVar("_T")
+
 
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None], *args: Any, **kwargs: Any
@@ -63,3 +67,77 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+class DBQueryExecutor(DBInterruptibleThreadPoolExecutor):
+    """An executor for read only queries that tracks how long they wait.
+
+    The number of workers limits how many queries run concurrently. Queries
+    that are cancelled before a worker picks them up are never executed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Init the executor and its metrics."""
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.timed_out = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def submit(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> Future[_T]:
+        """Submit a query, recording when it was queued."""
+        with self._stats_lock:
+            self.queued += 1
+        future = super().submit(self._run_query, time.monotonic(), fn, *args, **kwargs)
+        future.add_done_callback(self._query_done)
+        return future
+
+    def _run_query(
+        self, queued_at: float, fn: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run a query in a worker, recording how long it waited."""
+        wait = time.monotonic() - queued_at
+        with self._stats_lock:
+            self.queued -= 1
+            self.running += 1
+            self.total_wait += wait
+            if wait > self.max_wait:
+                self.max_wait = wait
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self.running -= 1
+                self.completed += 1
+
+    def _query_done(self, future: Future[Any]) -> None:
+        """Account for queries cancelled before they started."""
+        # A future can only be cancelled while it's still queued
+        if future.cancelled():
+            with self._stats_lock:
+                self.queued -= 1
+                self.cancelled += 1
+
+    def record_timeout(self) -> None:
+        """Record that a caller stopped waiting for a query."""
+        with self._stats_lock:
+            self.timed_out += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the executor metrics."""
+        with self._stats_lock:
+            started = self.completed + self.running
+            return {
+                "workers": self._max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "cancelled": self.cancelled,
+                "timed_out": self.timed_out,
+                "average_wait": self.total_wait / started if started else 0.0,
+                "max_wait": self.max_wait,
+            }
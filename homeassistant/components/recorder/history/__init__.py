@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
@@ -17,6 +23,7 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columns as _modern_get_significant_states_columns,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -25,9 +32,11 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "compressed_states_to_columns",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columns",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -92,17 +101,30 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    max_points is ignored until the database is migrated to the modern schema.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states as _legacy_get_significant_states,
         )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+        return _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -113,9 +135,96 @@ def get_significant_states(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        max_points,
+    )
+
+
+def get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_points: int | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return significant states during a time period in the columnar format.
+
+    max_points is ignored until the database is migrated to the modern schema.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        return compressed_states_to_columns(
+            _legacy_get_significant_states(  # type: ignore[arg-type]
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            )
+        )
+    return _modern_get_significant_states_columns(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        max_points,
     )
 
 
+def compressed_states_to_columns(
+    states: Mapping[str, list[dict[str, Any]]],
+) -> dict[str, dict[str, list[Any]]]:
+    """Convert compressed states to the columnar history format."""
+    result: dict[str, dict[str, list[Any]]] = {}
+    for entity_id, comp_states in states.items():
+        if not comp_states:
+            continue
+        ent_states: list[str] = []
+        ent_last_updated: list[float] = []
+        ent_attributes: list[list[Any]] = []
+        ent_last_changed: list[list[Any]] = []
+        prev_attributes: dict[str, Any] | None = None
+        for idx, comp_state in enumerate(comp_states):
+            ent_states.append(comp_state[COMPRESSED_STATE_STATE])
+            ent_last_updated.append(comp_state[COMPRESSED_STATE_LAST_UPDATED])
+            if (
+                last_changed := comp_state.get(COMPRESSED_STATE_LAST_CHANGED)
+            ) is not None:
+                ent_last_changed.append([idx, last_changed])
+            if (
+                attributes := comp_state.get(COMPRESSED_STATE_ATTRIBUTES)
+            ) is not None and (not ent_attributes or attributes != prev_attributes):
+                ent_attributes.append([idx, attributes])
+                prev_attributes = attributes
+        columns: dict[str, list[Any]] = {
+            COMPRESSED_STATE_STATE: ent_states,
+            COMPRESSED_STATE_LAST_UPDATED: ent_last_updated,
+        }
+        if ent_attributes:
+            columns[COMPRESSED_STATE_ATTRIBUTES] = ent_attributes
+        if ent_last_changed:
+            columns[COMPRESSED_STATE_LAST_CHANGED] = ent_last_changed
+        result[entity_id] = columns
+    return result
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
 from itertools import groupby
+import math
 from operator import itemgetter
 from typing import Any, cast
 
@@ -22,7 +23,12 @@ from sqlalchemy import (
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -36,6 +42,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -103,6 +110,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -118,6 +126,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -196,6 +205,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -207,11 +217,101 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    max_points downsamples the numeric states of each entity, see
+    _downsample_rows.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if (
+        result := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            max_points,
+        )
+    ) is None:
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = result
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    max_points: int | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return significant states during a time period in the columnar format.
+
+    See _sorted_states_to_columns for the format.
+    """
+    if filters is not None:
+        raise NotImplementedError("Filters are no longer supported")
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if (
+            result := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                max_points,
+            )
+        ) is None:
+            return {}
+        rows, start_time_ts, entity_id_to_metadata_id = result
+        return _sorted_states_to_columns(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            no_attributes,
+        )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Return the significant states rows, the start time and the metadata ids.
+
+    Returns None if none of the entities were ever recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -220,7 +320,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -258,17 +358,90 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    # Stream the rows from the cursor so they are converted
+    # as they come in instead of being fetched all at once
+    rows: Iterable[Row] = execute_stmt_lambda_element(
+        session, stmt, orm_rows=False, stream=True
+    )
+    if max_points is not None:
+        # Only the downsampled rows are kept
+        rows = _downsample_rows(
+            rows,
+            start_time_ts,
+            end_time_ts or dt_util.utcnow().timestamp(),
+            max_points,
+        )
+    return (
+        rows,
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
+def _downsample_rows(
+    rows: Iterable[Row], start_time_ts: float, end_time_ts: float, max_points: int
+) -> Iterator[Row]:
+    """Downsample the numeric states of each entity to about max_points rows.
+
+    The time window is split in max_points / 4 buckets and of the numeric
+    states in a bucket only the first, lowest, highest and last are kept,
+    which draws the same line at that resolution. States which are not
+    numbers, like unavailable, are always kept and close the bucket, so
+    gaps are not bridged.
+
+    Rows must be sorted by metadata_id and last_updated
+    """
+    metadata_id_idx = _FIELD_MAP["metadata_id"]
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    bucket_width = (end_time_ts - start_time_ts) / max(max_points // 4, 1)
+    if bucket_width <= 0:
+        yield from rows
+        return
+
+    def _bucket_rows(first: Row, low: Row, high: Row, last: Row) -> list[Row]:
+        """Return the distinct rows of a bucket in time order."""
+        if high[last_updated_ts_idx] < low[last_updated_ts_idx]:
+            low, high = high, low
+        bucket_rows = [first]
+        for row in (low, high, last):
+            if row is not bucket_rows[-1]:
+                bucket_rows.append(row)
+        return bucket_rows
+
+    bucket: tuple[int, int] | None = None
+    first = low = high = last = None
+    low_value = high_value = 0.0
+    for row in rows:
+        try:
+            value = float(row[state_idx])
+        except (TypeError, ValueError):
+            value = math.nan
+        if not math.isfinite(value):
+            if bucket is not None:
+                yield from _bucket_rows(first, low, high, last)  # type: ignore[arg-type]
+                bucket = None
+            yield row
+            continue
+        # The start time state has no last_updated
+        row_ts = row[last_updated_ts_idx] or start_time_ts
+        key = (row[metadata_id_idx], int((row_ts - start_time_ts) // bucket_width))
+        if key != bucket:
+            if bucket is not None:
+                yield from _bucket_rows(first, low, high, last)  # type: ignore[arg-type]
+            bucket = key
+            first = low = high = last = row
+            low_value = high_value = value
+            continue
+        last = row
+        if value < low_value:
+            low, low_value = row, value
+        elif value > high_value:
+            high, high_value = row, value
+    if bucket is not None:
+        yield from _bucket_rows(first, low, high, last)  # type: ignore[arg-type]
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -771,3 +944,97 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, dict[str, list[Any]]]:
+    """Convert SQL results into the columnar history format.
+
+    This takes our state list and turns it into
+    {'entity_id': {'s': [states], 'lu': [last_updated timestamps],
+    'a': [[index, attributes]], 'lc': [[index, last_changed timestamp]]}}
+
+    The states and last_updated timestamps are parallel lists. Attributes
+    are only given for the rows where they differ from the previous row,
+    and last_changed only where it differs from last_updated, so a long
+    history of a sensor is three lists instead of a dict per row.
+
+    States must be sorted by entity_id and last_updated
+    """
+    field_map = _FIELD_MAP
+    result: dict[str, dict[str, list[Any]]] = {}
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    if len(entity_ids) == 1:
+        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+        assert metadata_id is not None  # should not be possible if we got here
+        states_iter: Iterable[tuple[int, Iterator[Row]]] = (
+            (metadata_id, iter(states)),
+        )
+    else:
+        key_func = itemgetter(field_map["metadata_id"])
+        states_iter = groupby(states, key_func)
+
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+
+    for metadata_id, group in states_iter:
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        # With minimal response only the first row has attributes and
+        # rows which do not change the state are left out
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        attr_cache: dict[str, dict[str, Any]] = {}
+        ent_states: list[str | None] = []
+        ent_last_updated: list[float | None] = []
+        ent_attributes: list[list[Any]] = []
+        ent_last_changed: list[list[Any]] = []
+        prev_source: Any = None
+        for row in group:
+            state = row[state_idx]
+            if minimal and ent_states and state == ent_states[-1]:
+                continue
+            idx = len(ent_states)
+            ent_states.append(state)
+            last_updated_ts = row[last_updated_ts_idx] or start_time_ts
+            ent_last_updated.append(last_updated_ts)
+            if (
+                last_changed_ts := getattr(row, "last_changed_ts", None)
+            ) and last_changed_ts != last_updated_ts:
+                ent_last_changed.append([idx, last_changed_ts])
+            if no_attributes or (minimal and idx):
+                continue
+            # Rows share the attributes source string when the
+            # attributes did not change, so they are only decoded once
+            source = getattr(row, "attributes", None)
+            if not idx or source != prev_source:
+                ent_attributes.append(
+                    [idx, decode_attributes_from_source(source, attr_cache)]
+                )
+                prev_source = source
+
+        if not ent_states:
+            continue
+        columns: dict[str, list[Any]] = {
+            COMPRESSED_STATE_STATE: ent_states,
+            COMPRESSED_STATE_LAST_UPDATED: ent_last_updated,
+        }
+        if not no_attributes:
+            columns[COMPRESSED_STATE_ATTRIBUTES] = ent_attributes
+        if ent_last_changed:
+            columns[COMPRESSED_STATE_LAST_CHANGED] = ent_last_changed
+        result[entity_id] = columns
+
+    # Keep the order of the requested entity ids
+    return {
+        entity_id: result[entity_id] for entity_id in entity_ids if entity_id in result
+    }
@@ -64,9 +64,12 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDay,
     StatisticsMeta,
+    StatisticsMonth,
     StatisticsRuns,
     StatisticsShortTerm,
+    StatisticsWeek,
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
@@ -84,7 +87,7 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import get_start_time, rebuild_all_statistics_rollups
 from .tasks import (
     CommitTask,
     PostSchemaMigrationTask,
@@ -1062,6 +1065,12 @@ def _apply_update(  # noqa: C901
         _migrate_statistics_columns_to_timestamp_removing_duplicates(
             hass, instance, session_maker, engine
         )
+    elif new_version == 43:
+        # Summarize the existing hourly statistics per day, week and month
+        for rollup_table in (StatisticsDay, StatisticsWeek, StatisticsMonth):
+            cast(Table, rollup_table.__table__).create(engine, checkfirst=True)
+        with session_scope(session=session_maker()) as session:
+            rebuild_all_statistics_rollups(session)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -7,7 +7,7 @@ from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -35,6 +35,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_state_and_event_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -50,6 +51,105 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+MAX_STATES_BATCHES_PER_PURGE = 100
+MAX_EVENTS_BATCHES_PER_PURGE = 75
+# Target duration of a purge cycle, the recorder thread does not
+# write new states and events while a cycle runs
+PURGE_CYCLE_TARGET_SECONDS = 2
+
+
+class PurgeProgress:
+    """Track the progress of a purge across its cycles.
+
+    The progress is estimated from how far the oldest remaining state or
+    event moved towards the purge target, which is cheap to find with the
+    timestamp indexes, unlike counting the rows left to purge.
+
+    The number of batches of a cycle adapts to the measured delete latency,
+    so a cycle takes about PURGE_CYCLE_TARGET_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the purge progress."""
+        self.states_batch_size = DEFAULT_STATES_BATCHES_PER_PURGE
+        self.events_batch_size = DEFAULT_EVENTS_BATCHES_PER_PURGE
+        self.running = False
+        self.purge_before_ts = 0.0
+        self.started = 0.0
+        self.elapsed = 0.0
+        self.first_ts: float | None = None
+        self.oldest_ts: float | None = None
+        self.rows = 0
+
+    def cycle_started(self, purge_before_ts: float, oldest_ts: float | None) -> None:
+        """Update the oldest row and start tracking a new purge if needed."""
+        if not self.running or purge_before_ts != self.purge_before_ts:
+            self.running = True
+            self.purge_before_ts = purge_before_ts
+            self.started = time.monotonic()
+            self.first_ts = oldest_ts
+            self.rows = 0
+        self.oldest_ts = oldest_ts
+        self.elapsed = time.monotonic() - self.started
+
+    def finished(self) -> None:
+        """Mark the purge finished."""
+        self.running = False
+        self.elapsed = time.monotonic() - self.started
+        self.oldest_ts = self.purge_before_ts
+
+    @property
+    def fraction(self) -> float | None:
+        """Return the purged fraction of the time range to purge."""
+        if not self.running:
+            return 1.0
+        if (
+            self.first_ts is None
+            or self.oldest_ts is None
+            or self.first_ts >= self.purge_before_ts
+        ):
+            return None
+        purged = (self.oldest_ts - self.first_ts) / (
+            self.purge_before_ts - self.first_ts
+        )
+        return min(max(purged, 0.0), 1.0)
+
+    def stats(self) -> dict[str, Any] | None:
+        """Return the metrics of the current or last purge."""
+        if not self.started:
+            return None
+        fraction = self.fraction
+        rate: float | None = None
+        eta: int | None = None
+        if self.elapsed:
+            rate = round(self.rows / self.elapsed, 1)
+        if fraction is not None and fraction > 0:
+            eta = round(self.elapsed * (1 - fraction) / fraction)
+        return {
+            "running": self.running,
+            "rows_purged": self.rows,
+            "rows_per_second": rate,
+            "progress": None if fraction is None else round(fraction * 100, 1),
+            "eta_seconds": eta,
+            "states_batch_size": self.states_batch_size,
+            "events_batch_size": self.events_batch_size,
+        }
+
+
+def _adapt_batch_size(
+    batch_size: int, batches: int, elapsed: float, max_batch_size: int
+) -> int:
+    """Return the number of batches that fit in a purge cycle."""
+    if not batches:
+        return batch_size
+    if batches < batch_size and elapsed <= PURGE_CYCLE_TARGET_SECONDS:
+        # The cycle ran out of rows to purge, so it says nothing about
+        # how many more batches would fit
+        return batch_size
+    if not elapsed:
+        return min(batch_size * 2, max_batch_size)
+    fitting = int(PURGE_CYCLE_TARGET_SECONDS * batches / elapsed)
+    return max(1, min(fitting, batch_size * 2, max_batch_size))
 
 
 @retryable_database_job("purge")
@@ -58,18 +158,37 @@ def purge_old_data(
     purge_before: datetime,
     repack: bool,
     apply_filter: bool = False,
-    events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
-    states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    events_batch_size: int | None = None,
+    states_batch_size: int | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    Unless the batch sizes are given, they adapt to the delete latency.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    progress = instance.purge_progress
+    adapt_states_batch_size = states_batch_size is None
+    adapt_events_batch_size = events_batch_size is None
+    if states_batch_size is None:
+        states_batch_size = progress.states_batch_size
+    if events_batch_size is None:
+        events_batch_size = progress.events_batch_size
     with session_scope(session=instance.get_session()) as session:
+        oldest_state_ts, oldest_event_ts = session.execute(
+            find_oldest_state_and_event_ts()
+        ).one()
+        progress.cycle_started(
+            purge_before.timestamp(),
+            min(
+                (ts for ts in (oldest_state_ts, oldest_event_ts) if ts is not None),
+                default=None,
+            ),
+        )
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -84,12 +203,29 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
+            start = time.monotonic()
+            has_more_states, batches = _purge_states_and_attributes_ids(
                 instance, session, states_batch_size, purge_before
             )
-            has_more_to_purge |= _purge_events_and_data_ids(
+            if adapt_states_batch_size:
+                progress.states_batch_size = _adapt_batch_size(
+                    states_batch_size,
+                    batches,
+                    time.monotonic() - start,
+                    MAX_STATES_BATCHES_PER_PURGE,
+                )
+            start = time.monotonic()
+            has_more_events, batches = _purge_events_and_data_ids(
                 instance, session, events_batch_size, purge_before
             )
+            if adapt_events_batch_size:
+                progress.events_batch_size = _adapt_batch_size(
+                    events_batch_size,
+                    batches,
+                    time.monotonic() - start,
+                    MAX_EVENTS_BATCHES_PER_PURGE,
+                )
+            has_more_to_purge |= has_more_states or has_more_events
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
@@ -121,6 +257,7 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+    progress.finished()
     if repack:
         repack_database(instance)
     return True
@@ -176,10 +313,11 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
-) -> bool:
+) -> tuple[bool, int]:
     """Purge states and linked attributes id in a batch.
 
-    Returns true if there are more states to purge.
+    Returns true if there are more states to purge and the number of
+    batches purged.
     """
     database_engine = instance.database_engine
     assert database_engine is not None
@@ -190,6 +328,7 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    batches = 0
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -199,13 +338,15 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        instance.purge_progress.rows += len(state_ids)
+        batches += 1
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
     )
-    return has_remaining_state_ids_to_purge
+    return has_remaining_state_ids_to_purge, batches
 
 
 def _purge_events_and_data_ids(
@@ -213,10 +354,11 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
-) -> bool:
-    """Purge states and linked attributes id in a batch.
+) -> tuple[bool, int]:
+    """Purge events and linked data id in a batch.
 
-    Returns true if there are more states to purge.
+    Returns true if there are more events to purge and the number of
+    batches purged.
     """
     has_remaining_event_ids_to_purge = True
     # There are more events relative to data_ids so
@@ -225,6 +367,7 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    batches = 0
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -234,13 +377,15 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        instance.purge_progress.rows += len(event_ids)
+        batches += 1
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
     )
-    return has_remaining_event_ids_to_purge
+    return has_remaining_event_ids_to_purge, batches
 
 
 def _select_state_attributes_ids_to_purge(
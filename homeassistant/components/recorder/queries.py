@@ -635,6 +635,16 @@ def find_states_to_purge(
     )
 
 
+def find_oldest_state_and_event_ts() -> StatementLambdaElement:
+    """Find the timestamps of the oldest state and the oldest event."""
+    return lambda_stmt(
+        lambda: select(
+            select(func.min(States.last_updated_ts)).scalar_subquery(),
+            select(func.min(Events.time_fired_ts)).scalar_subquery(),
+        )
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
@@ -58,8 +58,12 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDay,
+    StatisticsMonth,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
+    StatisticsWeek,
 )
 from .models import (
     StatisticData,
@@ -147,6 +151,7 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_HOURLY_STATISTICS_ACCUMULATOR = "recorder_hourly_statistics_accumulator"
 
 
 def mean(values: list[float]) -> float | None:
@@ -190,6 +195,111 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _HourlyStatisticsEntry:
+    """Running summary of the short term statistics of a metadata_id."""
+
+    mean_total: float = 0.0
+    mean_count: int = 0
+    min: float | None = None
+    max: float | None = None
+    last_reset_ts: float | None = None
+    state: float | None = None
+    sum: float | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class HourlyStatisticsAccumulator:
+    """Summary of the short term statistics compiled during the current hour.
+
+    The summary is updated as every 5-minute period is compiled, so the
+    hourly statistics don't have to be aggregated from the short term
+    statistics table. It is only used if all 5-minute periods of the hour
+    were compiled and no short term statistics were changed in the meantime.
+    """
+
+    _hour_start_ts: float | None = None
+    _periods: set[float] = dataclasses.field(default_factory=set)
+    _valid: bool = False
+    _entries: dict[int, _HourlyStatisticsEntry] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def add_period(
+        self, period_start: datetime, short_term_stats: Iterable[StatisticsBase]
+    ) -> None:
+        """Add the short term statistics compiled for a 5-minute period."""
+        hour_start_ts = period_start.replace(minute=0).timestamp()
+        period_start_ts = period_start.timestamp()
+        if hour_start_ts != self._hour_start_ts:
+            self._hour_start_ts = hour_start_ts
+            self._periods.clear()
+            self._entries.clear()
+            self._valid = True
+        elif period_start_ts in self._periods:
+            # The period is compiled again after its session was rolled back
+            self._valid = False
+        self._periods.add(period_start_ts)
+        if not self._valid:
+            return
+        entries = self._entries
+        for stat in short_term_stats:
+            if TYPE_CHECKING:
+                assert stat.metadata_id is not None
+            if (entry := entries.get(stat.metadata_id)) is None:
+                entry = entries[stat.metadata_id] = _HourlyStatisticsEntry()
+            if (mean_ := stat.mean) is not None:
+                entry.mean_total += mean_
+                entry.mean_count += 1
+            if (min_ := stat.min) is not None and (
+                entry.min is None or min_ < entry.min
+            ):
+                entry.min = min_
+            if (max_ := stat.max) is not None and (
+                entry.max is None or max_ > entry.max
+            ):
+                entry.max = max_
+            entry.last_reset_ts = stat.last_reset_ts
+            entry.state = stat.state
+            entry.sum = stat.sum
+
+    def invalidate(self) -> None:
+        """Invalidate the summary after short term statistics were changed."""
+        self._valid = False
+        self._entries.clear()
+
+    def get_summary(
+        self, hour_start: datetime
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the hourly statistics or None if the summary is incomplete."""
+        hour_start_ts = hour_start.timestamp()
+        if (
+            not self._valid
+            or self._hour_start_ts != hour_start_ts
+            or len(self._periods) != 12
+        ):
+            return None
+        # The values are None like in the rows summarized by the database
+        # if the statistic has no mean or sum
+        return {
+            metadata_id: cast(
+                StatisticDataTimestamp,
+                {
+                    "start_ts": hour_start_ts,
+                    "mean": entry.mean_total / entry.mean_count
+                    if entry.mean_count
+                    else None,
+                    "min": entry.min,
+                    "max": entry.max,
+                    "last_reset_ts": entry.last_reset_ts,
+                    "state": entry.state,
+                    "sum": entry.sum,
+                },
+            )
+            for metadata_id, entry in self._entries.items()
+        }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -384,14 +494,32 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    session: Session, start: datetime, accumulator: HourlyStatisticsAccumulator
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
-    - average, min max is computed by a database query
+    - average, min max is computed by the accumulator, or by a database
+      query if not all 5-minute periods of the hour were accumulated
     - sum is taken from the last 5-minute entry during the hour
     """
     start_time = start.replace(minute=0)
+    if (summary := accumulator.get_summary(start_time)) is None:
+        summary = _query_hourly_statistics_summary(session, start_time)
+
+    # Insert compiled hourly statistics in the database
+    session.add_all(
+        Statistics.from_stats_ts(metadata_id, summary_item)
+        for metadata_id, summary_item in summary.items()
+    )
+    _update_statistics_rollups(session, start_time.timestamp(), summary)
+
+
+def _query_hourly_statistics_summary(
+    session: Session, start_time: datetime
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize the 5-minute statistics for one hour in the database."""
     start_time_ts = start_time.timestamp()
     end_time = start_time + timedelta(hours=1)
     end_time_ts = end_time.timestamp()
@@ -434,11 +562,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item)
-        for metadata_id, summary_item in summary.items()
-    )
+    return summary
 
 
 @retryable_database_job("compile missing statistics")
@@ -463,6 +587,8 @@ def compile_missing_statistics(instance: Recorder) -> bool:
         if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
             start = max(start, process_timestamp(last_run) + timedelta(minutes=5))
 
+        _ensure_statistics_rollups_in_time_zone(session)
+
         periods_without_commit = 0
         while start < last_period:
             periods_without_commit += 1
@@ -575,9 +701,12 @@ def _compile_statistics(
         ):
             new_short_term_stats.append(new_stat)
 
+    accumulator = get_hourly_statistics_accumulator(instance.hass)
+    accumulator.add_period(start, new_short_term_stats)
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _ensure_statistics_rollups_in_time_zone(session)
+        _compile_hourly_statistics(session, start, accumulator)
 
     session.add(StatisticsRuns(start=start))
 
@@ -724,6 +853,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
 
 
 def update_statistics_metadata(
@@ -1091,6 +1221,191 @@ def _reduce_statistics_per_month(
     )
 
 
+STATISTICS_ROLLUPS: dict[
+    str,
+    tuple[
+        type[StatisticsRollupBase],
+        Callable[
+            [],
+            tuple[
+                Callable[[float, float], bool],
+                Callable[[float], tuple[float, float]],
+            ],
+        ],
+    ],
+] = {
+    "day": (StatisticsDay, reduce_day_ts_factory),
+    "week": (StatisticsWeek, reduce_week_ts_factory),
+    "month": (StatisticsMonth, reduce_month_ts_factory),
+}
+
+
+def _update_statistics_rollups(
+    session: Session, hour_start_ts: float, summary: dict[int, StatisticDataTimestamp]
+) -> None:
+    """Fold the statistics of a compiled hour into the day, week and month.
+
+    The hour must be the newest hour of the statistics in the summary.
+    """
+    if not summary:
+        return
+    for table, ts_factory in STATISTICS_ROLLUPS.values():
+        _, period_start_end = ts_factory()
+        period_start_ts = period_start_end(hour_start_ts)[0]
+        rollups: dict[int | None, StatisticsRollupBase] = {
+            rollup.metadata_id: rollup
+            for rollup in session.query(table).filter(table.start_ts == period_start_ts)
+        }
+        for metadata_id, stat in summary.items():
+            _mean = stat.get("mean")
+            if (rollup := rollups.get(metadata_id)) is None:
+                rollup = table.from_stats_ts(
+                    metadata_id, {**stat, "start_ts": period_start_ts}
+                )
+                rollup.mean_count = int(_mean is not None)
+                session.add(rollup)
+                continue
+            if _mean is not None:
+                count = rollup.mean_count or 0
+                if rollup.mean is None or not count:
+                    rollup.mean = _mean
+                    count = 0
+                else:
+                    rollup.mean = (rollup.mean * count + _mean) / (count + 1)
+                rollup.mean_count = count + 1
+            if (_min := stat.get("min")) is not None and (
+                rollup.min is None or _min < rollup.min
+            ):
+                rollup.min = _min
+            if (_max := stat.get("max")) is not None and (
+                rollup.max is None or _max > rollup.max
+            ):
+                rollup.max = _max
+            rollup.last_reset_ts = stat.get("last_reset_ts")
+            rollup.state = stat.get("state")
+            rollup.sum = stat.get("sum")
+
+
+def _rebuild_statistics_rollup(
+    session: Session,
+    table: type[StatisticsRollupBase],
+    start_ts: float,
+    end_ts: float,
+    metadata_ids: Collection[int] | None,
+) -> None:
+    """Rebuild the statistics of one period from the hourly statistics."""
+    delete_query = session.query(table).filter(table.start_ts == start_ts)
+    mean_stmt = (
+        select(
+            Statistics.metadata_id,
+            func.avg(Statistics.mean),
+            func.min(Statistics.min),
+            func.max(Statistics.max),
+            func.count(Statistics.mean),
+        )
+        .filter(Statistics.start_ts >= start_ts)
+        .filter(Statistics.start_ts < end_ts)
+        .group_by(Statistics.metadata_id)
+    )
+    sum_subquery = (
+        select(
+            Statistics.metadata_id,
+            Statistics.last_reset_ts,
+            Statistics.state,
+            Statistics.sum,
+            func.row_number()
+            .over(
+                partition_by=Statistics.metadata_id,
+                order_by=Statistics.start_ts.desc(),
+            )
+            .label("rownum"),
+        )
+        .filter(Statistics.start_ts >= start_ts)
+        .filter(Statistics.start_ts < end_ts)
+    )
+    if metadata_ids is not None:
+        delete_query = delete_query.filter(table.metadata_id.in_(metadata_ids))
+        mean_stmt = mean_stmt.filter(Statistics.metadata_id.in_(metadata_ids))
+        sum_subquery = sum_subquery.filter(Statistics.metadata_id.in_(metadata_ids))
+    delete_query.delete(synchronize_session=False)
+    rollups: dict[int, StatisticsRollupBase] = {}
+    for metadata_id, _mean, _min, _max, mean_count in session.execute(mean_stmt):
+        rollup = rollups[metadata_id] = table.from_stats_ts(
+            metadata_id,
+            {"start_ts": start_ts, "mean": _mean, "min": _min, "max": _max},
+        )
+        rollup.mean_count = mean_count
+    subquery = sum_subquery.subquery()
+    for metadata_id, last_reset_ts, state, _sum in session.execute(
+        select(
+            subquery.c.metadata_id,
+            subquery.c.last_reset_ts,
+            subquery.c.state,
+            subquery.c.sum,
+        ).filter(subquery.c.rownum == 1)
+    ):
+        rollup = rollups[metadata_id]
+        rollup.last_reset_ts = last_reset_ts
+        rollup.state = state
+        rollup.sum = _sum
+    session.add_all(rollups.values())
+
+
+def _rebuild_statistics_rollups(
+    session: Session,
+    start_ts: float,
+    end_ts: float,
+    metadata_ids: Collection[int] | None = None,
+) -> None:
+    """Rebuild the days, weeks and months overlapping start_ts - end_ts."""
+    for table, ts_factory in STATISTICS_ROLLUPS.values():
+        _, period_start_end = ts_factory()
+        period_start_ts = period_start_end(start_ts)[0]
+        while period_start_ts < end_ts:
+            period_end_ts = period_start_end(period_start_ts)[1]
+            _rebuild_statistics_rollup(
+                session, table, period_start_ts, period_end_ts, metadata_ids
+            )
+            period_start_ts = period_end_ts
+
+
+def _rebuild_statistics_rollups_for_metadata_id(
+    session: Session, metadata_id: int, start_ts: float
+) -> None:
+    """Rebuild the days, weeks and months of a statistic starting at start_ts."""
+    if (
+        end_ts := session.query(func.max(Statistics.start_ts))
+        .filter(Statistics.metadata_id == metadata_id)
+        .scalar()
+    ) is None:
+        return
+    _rebuild_statistics_rollups(session, start_ts, end_ts + 3600, (metadata_id,))
+
+
+def rebuild_all_statistics_rollups(session: Session) -> None:
+    """Rebuild all days, weeks and months from the hourly statistics."""
+    start_ts, end_ts = session.query(
+        func.min(Statistics.start_ts), func.max(Statistics.start_ts)
+    ).one()
+    for table, _ in STATISTICS_ROLLUPS.values():
+        session.query(table).delete(synchronize_session=False)
+    if start_ts is not None:
+        _rebuild_statistics_rollups(session, start_ts, end_ts + 3600)
+
+
+def _ensure_statistics_rollups_in_time_zone(session: Session) -> None:
+    """Rebuild the days, weeks and months if the time zone has changed.
+
+    The days are checked since they are the first to be misaligned.
+    """
+    if (newest_ts := session.query(func.max(StatisticsDay.start_ts)).scalar()) is None:
+        return
+    _, day_start_end = reduce_day_ts_factory()
+    if day_start_end(newest_ts)[0] != newest_ts:
+        _LOGGER.info("Time zone changed, rebuilding daily to monthly statistics")
+        rebuild_all_statistics_rollups(session)
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1643,6 +1958,58 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: str,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return the days, weeks or months summarized by the recorder.
+
+    Returns None if there are none or if they were summarized in another
+    time zone and still have to be rebuilt, in which case the hourly
+    statistics have to be reduced instead.
+    """
+    table, ts_factory = STATISTICS_ROLLUPS[period]
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return None
+    _, period_start_end = ts_factory()
+    start_ts_idx = stats[0]._fields.index("start_ts")
+    if any(
+        period_start_end(start_ts := stat[start_ts_idx])[0] != start_ts
+        for stat in stats
+    ):
+        return None
+    result = _sorted_statistics_to_dict(
+        hass,
+        session,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        table,
+        start_time,
+        units,
+        types,
+    )
+    for rows in result.values():
+        for row in rows:
+            row["end"] = period_start_end(row["start"])[1]
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1713,37 +2080,53 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if period in STATISTICS_ROLLUPS and (
+        rollup_result := _statistics_rollups_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            period,
+            units,
+            types,
+        )
+    ):
+        result = rollup_result
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if not stats:
-        return {}
+        if not stats:
+            return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        session,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        start_time,
-        units,
-        types,
-    )
+        result = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2268,15 +2651,26 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    starts: list[datetime] = []
     for stat in statistics:
+        starts.append(stat["start"])
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
 
     if table != StatisticsShortTerm:
+        if starts:
+            _rebuild_statistics_rollups(
+                session,
+                min(starts).timestamp(),
+                max(starts).timestamp() + 3600,
+                (metadata_id,),
+            )
         return True
 
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
+
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
     run_cache = get_short_term_statistics_run_cache(instance.hass)
@@ -2295,6 +2689,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_HOURLY_STATISTICS_ACCUMULATOR)
+def get_hourly_statistics_accumulator(
+    hass: HomeAssistant,
+) -> HourlyStatisticsAccumulator:
+    """Get the summary of the short term statistics of the current hour."""
+    return HourlyStatisticsAccumulator()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2388,6 +2790,7 @@ def adjust_statistics(
         ):
             sum_adjustment = convert(sum_adjustment)
 
+        get_hourly_statistics_accumulator(instance.hass).invalidate()
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
@@ -2403,6 +2806,9 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        _rebuild_statistics_rollups_for_metadata_id(
+            session, metadata[statistic_id][0], start_time.replace(minute=0).timestamp()
+        )
 
     return True
 
@@ -2464,9 +2870,13 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDay,
+            StatisticsWeek,
+            StatisticsMonth,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        get_hourly_statistics_accumulator(instance.hass).invalidate()
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from ..bulk_insert import PendingStates
 from ..db_schema import States
 
 
@@ -10,10 +11,10 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, States | PendingStates] = {}
         self._last_committed_id: dict[str, int] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> States | PendingStates | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -34,7 +35,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: States | PendingStates) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -51,7 +52,7 @@ class StatesManager:
         recorder thread.
         """
         for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+            self._last_committed_id[entity_id] = db_states.state_id  # type: ignore[assignment]
         self._pending.clear()
 
     def reset(self) -> None:
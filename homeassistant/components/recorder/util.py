@@ -211,6 +211,7 @@ def execute_stmt_lambda_element(
     end_time: datetime | None = None,
     yield_per: int = DEFAULT_YIELD_STATES_ROWS,
     orm_rows: bool = True,
+    stream: bool = False,
 ) -> Sequence[Row] | Result:
     """Execute a StatementLambdaElement.
 
@@ -222,14 +223,26 @@ def execute_stmt_lambda_element(
     when selecting non-ranged rows (ie selecting
     specific entities) since they are usually faster
     with .all().
+
+    If stream is set the rows are always returned as a
+    Result backed by a server side cursor on PostgreSQL
+    and MySQL, and by chunked fetches on SQLite, so the
+    caller can consume them without materializing the
+    whole result set. The session must stay open until
+    the Result is exhausted.
     """
-    use_all = not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    use_all = not stream and (
+        not start_time or ((end_time or dt_util.utcnow()) - start_time).days <= 1
+    )
+    kwargs: dict[str, Any] = (
+        {"execution_options": {"yield_per": yield_per}} if stream else {}
+    )
     for tryno in range(RETRIES):
         try:
             if orm_rows:
-                executed = session.execute(stmt)
+                executed = session.execute(stmt, **kwargs)
             else:
-                executed = session.connection().execute(stmt)
+                executed = session.connection().execute(stmt, **kwargs)
             if use_all:
                 return executed.all()
             return executed.yield_per(yield_per)
@@ -605,6 +618,27 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_query_timeout_for_dialect(
+    dialect_name: str, dbapi_connection: DBAPIConnection, timeout: float
+) -> None:
+    """Make the database cancel queries running longer than the timeout."""
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, f"SET statement_timeout = {int(timeout * 1000)}"
+        )
+    elif dialect_name == SupportedDialect.MYSQL:
+        result = query_on_connection(dbapi_connection, "SELECT VERSION()")
+        if "mariadb" in result[0][0].lower():
+            execute_on_connection(
+                dbapi_connection, f"SET SESSION max_statement_time = {timeout}"
+            )
+        else:
+            execute_on_connection(
+                dbapi_connection,
+                f"SET SESSION max_execution_time = {int(timeout * 1000)}",
+            )
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
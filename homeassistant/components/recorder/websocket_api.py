@@ -127,7 +127,7 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_query_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -196,7 +196,7 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_query_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -496,6 +496,9 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        backlog_stats = instance.backlog_stats
+        query_pool_stats = instance.query_pool_stats
+        purge_stats = instance.purge_stats
     else:
         backlog = None
         migration_in_progress = False
@@ -503,10 +506,16 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        backlog_stats = None
+        query_pool_stats = None
+        purge_stats = None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
+        "backlog_stats": backlog_stats,
+        "query_pool_stats": query_pool_stats,
+        "purge_stats": purge_stats,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
         "recording": recording,
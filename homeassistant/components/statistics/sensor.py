@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
+from fractions import Fraction
 import logging
 import math
 import statistics
@@ -180,6 +182,23 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Statistics of a numeric source which are updated sample by sample
+STATS_NUMERIC_ONLINE = {
+    STAT_AVERAGE_TIMELESS,
+    STAT_DATETIME_VALUE_MAX,
+    STAT_DATETIME_VALUE_MIN,
+    STAT_DISTANCE_95P,
+    STAT_DISTANCE_99P,
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_MEAN,
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+    STAT_STANDARD_DEVIATION,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+    STAT_VARIANCE,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -282,6 +301,114 @@ async def async_setup_platform(
     )
 
 
+class OnlineStatistics:
+    """Statistics of a sample buffer, updated when samples are added or removed.
+
+    The samples are kept sorted for the order statistics, and their sum and
+    sum of squares are kept as exact fractions for the moments. Removing
+    old samples does not accumulate rounding errors, and the results match
+    the statistics module, which uses exact fractions as well.
+
+    Every sample gets a sequence number, so samples with the same value are
+    ordered like in the buffer.
+    """
+
+    __slots__ = (
+        "_sorted",
+        "_sum",
+        "_sum_squares",
+        "_first_seq",
+        "_next_seq",
+        "non_finite_count",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self._sorted: list[tuple[float, int]] = []
+        self._sum = Fraction(0)
+        self._sum_squares = Fraction(0)
+        self._first_seq = 0
+        self._next_seq = 0
+        self.non_finite_count = 0
+
+    def add(self, value: float) -> None:
+        """Add the newest sample."""
+        seq = self._next_seq
+        self._next_seq += 1
+        if not math.isfinite(value):
+            self.non_finite_count += 1
+            return
+        insort(self._sorted, (value, seq))
+        exact = Fraction(value)
+        self._sum += exact
+        self._sum_squares += exact * exact
+
+    def remove_oldest(self, value: float) -> None:
+        """Remove the oldest sample."""
+        seq = self._first_seq
+        self._first_seq += 1
+        if not math.isfinite(value):
+            self.non_finite_count -= 1
+            return
+        del self._sorted[bisect_left(self._sorted, (value, seq))]
+        exact = Fraction(value)
+        self._sum -= exact
+        self._sum_squares -= exact * exact
+
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        return float(self._sum / len(self._sorted))
+
+    def variance(self) -> float:
+        """Return the sample variance, needs at least two samples."""
+        count = len(self._sorted)
+        sum_squared_deviations = (
+            count * self._sum_squares - self._sum * self._sum
+        ) / count
+        return float(sum_squared_deviations / (count - 1))
+
+    def standard_deviation(self) -> float:
+        """Return the sample standard deviation, needs at least two samples.
+
+        Unlike the statistics module, the square root is taken of the
+        rounded variance, so the result may differ in the last bit.
+        """
+        return math.sqrt(self.variance())
+
+    def median(self) -> float:
+        """Return the median of the samples."""
+        sorted_samples = self._sorted
+        middle = len(sorted_samples) // 2
+        if len(sorted_samples) % 2:
+            return sorted_samples[middle][0]
+        return (sorted_samples[middle - 1][0] + sorted_samples[middle][0]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile with the exclusive method, needs two samples."""
+        sorted_samples = self._sorted
+        count = len(sorted_samples)
+        scaled = percentile * (count + 1)
+        index = min(max(scaled // 100, 1), count - 1)
+        delta = scaled - index * 100
+        return (
+            sorted_samples[index - 1][0] * (100 - delta)
+            + sorted_samples[index][0] * delta
+        ) / 100
+
+    def min(self) -> tuple[float, int]:
+        """Return the min and the buffer index of its oldest sample."""
+        value, seq = self._sorted[0]
+        return value, seq - self._first_seq
+
+    def max(self) -> tuple[float, int]:
+        """Return the max and the buffer index of its oldest sample."""
+        sorted_samples = self._sorted
+        value, seq = sorted_samples[
+            bisect_left(sorted_samples, (sorted_samples[-1][0],))
+        ]
+        return value, seq - self._first_seq
+
+
 class StatisticsSensor(SensorEntity):
     """Representation of a Statistics sensor."""
 
@@ -318,6 +445,9 @@ class StatisticsSensor(SensorEntity):
 
         self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self.online_statistics: OnlineStatistics | None = None
+        if not self.is_binary and state_characteristic in STATS_NUMERIC_ONLINE:
+            self.online_statistics = OnlineStatistics()
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[
@@ -369,10 +499,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._add_sample(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self._add_sample(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -385,6 +514,15 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _add_sample(self, value: float | bool, age: datetime) -> None:
+        """Add a sample to the buffer, dropping the oldest one if it is full."""
+        if (online_statistics := self.online_statistics) is not None:
+            if len(self.states) == self.states.maxlen:
+                online_statistics.remove_oldest(self.states[0])
+            online_statistics.add(value)
+        self.states.append(value)
+        self.ages.append(age)
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -497,7 +635,9 @@ class StatisticsSensor(SensorEntity):
                 (now - self.ages[0]),
             )
             self.ages.popleft()
-            self.states.popleft()
+            value = self.states.popleft()
+            if self.online_statistics is not None:
+                self.online_statistics.remove_oldest(value)
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -637,6 +777,17 @@ class StatisticsSensor(SensorEntity):
         )
         return function
 
+    def _online_statistics(self) -> OnlineStatistics | None:
+        """Return the online statistics if they can be used for the samples.
+
+        Infinite and NaN samples are left to the statistics module.
+        """
+        if (
+            online_statistics := self.online_statistics
+        ) is not None and not online_statistics.non_finite_count:
+            return online_statistics
+        return None
+
     # Statistics for numeric sensor
 
     def _stat_average_linear(self) -> StateType:
@@ -699,11 +850,15 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
+            if online_statistics := self._online_statistics():
+                return self.ages[online_statistics.max()[1]]
             return self.ages[self.states.index(max(self.states))]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
+            if online_statistics := self._online_statistics():
+                return self.ages[online_statistics.min()[1]]
             return self.ages[self.states.index(min(self.states))]
         return None
 
@@ -719,11 +874,15 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
+            if online_statistics := self._online_statistics():
+                return online_statistics.max()[0] - online_statistics.min()[0]
             return max(self.states) - min(self.states)
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
+            if online_statistics := self._online_statistics():
+                return online_statistics.mean()
             return statistics.mean(self.states)
         return None
 
@@ -736,6 +895,8 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
+            if online_statistics := self._online_statistics():
+                return online_statistics.median()
             return statistics.median(self.states)
         return None
 
@@ -746,12 +907,16 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
+            if online_statistics := self._online_statistics():
+                return online_statistics.percentile(self._percentile)
             percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
             return percentiles[self._percentile - 1]
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
+            if online_statistics := self._online_statistics():
+                return online_statistics.standard_deviation()
             return statistics.stdev(self.states)
         return None
 
@@ -782,16 +947,22 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
+            if online_statistics := self._online_statistics():
+                return online_statistics.max()[0]
             return max(self.states)
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
+            if online_statistics := self._online_statistics():
+                return online_statistics.min()[0]
             return min(self.states)
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
+            if online_statistics := self._online_statistics():
+                return online_statistics.variance()
             return statistics.variance(self.states)
         return None
 
@@ -53,7 +53,9 @@ class AuthPhase:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        send_message: Callable[
+            [bytes | str | dict[str, Any] | Callable[[], bytes]], None
+        ],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
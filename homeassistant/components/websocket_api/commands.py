@@ -60,6 +60,7 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_subscriptions import async_get_entity_subscription_hub
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -75,6 +76,7 @@ def async_register_commands(
     """Register commands."""
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_entity_source)
+    async_reg(hass, handle_event_bus_profile)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
     async_reg(hass, handle_get_config)
@@ -319,13 +321,25 @@ def _async_get_allowed_states(
 
 
 @callback
-@decorators.websocket_command({vol.Required("type"): "get_states"})
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "get_states",
+        vol.Optional("stream"): bool,
+    }
+)
 def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
     states = _async_get_allowed_states(hass, connection)
 
+    if msg.get("stream"):
+        connection.send_result(msg["id"])
+        _send_states_in_chunks(
+            connection, msg["id"], states, _as_dict_json, b'{"states":[', b"]"
+        )
+        return
+
     try:
         serialized_states = [state.as_dict_json for state in states]
     except (ValueError, TypeError):
@@ -350,6 +364,72 @@ def handle_get_states(
     _send_handle_get_states_response(connection, msg["id"], serialized_states)
 
 
+def _as_dict_json(state: State) -> bytes:
+    """Return the JSON of the state."""
+    return state.as_dict_json
+
+
+def _as_compressed_state_json(state: State) -> bytes:
+    """Return the JSON key value pair of the compressed state."""
+    return state.as_compressed_state_json
+
+
+@callback
+def _send_states_in_chunks(
+    connection: ActiveConnection,
+    msg_id: int,
+    states: list[State],
+    serialize: Callable[[State], bytes],
+    start: bytes,
+    end: bytes,
+) -> None:
+    """Send the states as event messages of at most STATES_CHUNK_SIZE states.
+
+    The chunks are queued at once, so state changes are always sent after
+    them, but each chunk is serialized when it is written to avoid holding
+    the serialized states of all chunks in memory. The last chunk has
+    complete set.
+    """
+    chunk_start_bytes = b"".join(
+        (b'{"id":', str(msg_id).encode(), b',"type":"event","event":', start)
+    )
+    chunk_size = const.STATES_CHUNK_SIZE
+    for chunk_start in range(0, len(states) or 1, chunk_size):
+        complete = chunk_start + chunk_size >= len(states)
+        connection.send_message(
+            partial(
+                _serialize_states_chunk,
+                connection,
+                states[chunk_start : chunk_start + chunk_size],
+                serialize,
+                chunk_start_bytes,
+                b"".join((end, b',"complete":true}}' if complete else b"}}")),
+            )
+        )
+
+
+def _serialize_states_chunk(
+    connection: ActiveConnection,
+    states: list[State],
+    serialize: Callable[[State], bytes],
+    start: bytes,
+    end: bytes,
+) -> bytes:
+    """Serialize a chunk of states, leaving out the unserializable states."""
+    serialized_states: list[bytes] = []
+    for state in states:
+        try:
+            serialized_states.append(serialize(state))
+        except (ValueError, TypeError):
+            connection.logger.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+                ),
+            )
+    return b"".join((start, b",".join(serialized_states), end))
+
+
 def _send_handle_get_states_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
@@ -361,35 +441,12 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("stream"): bool,
     }
 )
 def handle_subscribe_entities(
@@ -401,19 +458,25 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
+    connection.subscriptions[msg["id"]] = async_get_entity_subscription_hub(
+        hass
+    ).async_subscribe(
+        connection.send_message,
+        connection.user,
+        msg["id"],
+        entity_ids,
+        connection.send_entity_update if connection.can_conflate else None,
     )
     connection.send_result(msg["id"])
 
+    if msg.get("stream"):
+        if entity_ids:
+            states = [state for state in states if state.entity_id in entity_ids]
+        _send_states_in_chunks(
+            connection, msg["id"], states, _as_compressed_state_json, b'{"a":{', b"}"
+        )
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -549,6 +612,31 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "event_bus/profile",
+        vol.Optional("enabled"): bool,
+    }
+)
+@decorators.require_admin
+def handle_event_bus_profile(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle event bus profile command.
+
+    Optionally starts or stops profiling and returns the profile
+    recorded until now, None if profiling was not enabled.
+    """
+    bus = hass.bus
+    profile = bus.profile
+    if (enabled := msg.get("enabled")) is False:
+        bus.async_stop_profile()
+    elif enabled and profile is None:
+        bus.async_start_profile()
+    connection.send_result(msg["id"], profile.as_dict() if profile else None)
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
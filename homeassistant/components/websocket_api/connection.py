@@ -10,8 +10,9 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
+from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.http import current_request
 from homeassistant.util.json import JsonValueType
 
@@ -37,11 +38,14 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_entity_update",
         "user",
         "refresh_token_id",
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "can_conflate",
+        "can_compress",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -51,7 +55,9 @@ class ActiveConnection:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        send_message: Callable[
+            [bytes | str | dict[str, Any] | Callable[[], bytes]], None
+        ],
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
@@ -59,11 +65,16 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self.send_entity_update: (
+            Callable[[int, Event[EventStateChangedData]], None] | None
+        ) = None
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_conflate = False
+        self.can_compress = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema]] = self.hass.data[
             const.DOMAIN
@@ -79,6 +90,11 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_conflate = (
+            const.FEATURE_CONFLATE_ENTITY_UPDATES in features
+            and self.send_entity_update is not None
+        )
+        self.can_compress = const.FEATURE_COMPRESS_MESSAGES in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -244,7 +260,7 @@ class ActiveConnection:
 
     @callback
     def _connect_closed_error(
-        self, msg: bytes | str | dict[str, Any] | Callable[[], str]
+        self, msg: bytes | str | dict[str, Any] | Callable[[], bytes]
     ) -> None:
         """Send a message when the connection is closed."""
         self.logger.debug("Tried to send message %s on closed connection", msg)
@@ -22,6 +22,8 @@ DOMAIN: Final = "websocket_api"
 URL: Final = "/api/websocket"
 PENDING_MSG_PEAK: Final = 1024
 PENDING_MSG_PEAK_TIME: Final = 5
+# Number of states in a message when streaming states
+STATES_CHUNK_SIZE: Final = 1000
 # Maximum number of messages that can be pending at any given time.
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
@@ -49,5 +51,17 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to count entity updates merged into a pending update
+DATA_CONFLATED_MESSAGES: Final = f"{DOMAIN}.conflated_messages"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_CONFLATE_ENTITY_UPDATES = "conflate_entity_updates"
+FEATURE_COMPRESS_MESSAGES = "compress_messages"
+
+# Messages smaller than this are always sent as text
+COMPRESS_MIN_SIZE: Final = 1024
+# Larger messages are compressed in the executor
+COMPRESS_MAX_SYNC_SIZE: Final = 64 * 1024
+# Level 1 gets most of the ratio of higher levels on state JSON at a
+# fraction of the CPU time
+COMPRESS_LEVEL: Final = 1
@@ -0,0 +1,158 @@
+"""Shared fan-out of state changes to subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import EventStateChangedData
+
+from .messages import cached_state_diff_message
+
+DATA_ENTITY_SUBSCRIPTIONS = "websocket_api_entity_subscriptions"
+
+SendMessage = Callable[[bytes], None]
+SendEntityUpdate = Callable[[int, Event[EventStateChangedData]], None]
+
+
+class _SubscriberGroup:
+    """Subscriptions of a user with the same entity filter."""
+
+    __slots__ = ("user", "entity_ids", "subscribers")
+
+    def __init__(self, user: User, entity_ids: frozenset[str]) -> None:
+        """Initialize the group."""
+        self.user = user
+        self.entity_ids = entity_ids
+        self.subscribers: dict[
+            tuple[SendMessage, int, SendEntityUpdate | None], None
+        ] = {}
+
+
+class EntitySubscriptionHub:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener serves every subscription. Subscriptions
+    are grouped by user and entity filter, so the filter and the permissions
+    of the user are checked once per group, and the state diff message is
+    serialized once per event and subscription id instead of once per
+    connection. Connections that conflate entity updates get the event
+    instead, to merge it with a queued update of the same entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._groups: dict[tuple[str, frozenset[str]], _SubscriberGroup] = {}
+        self._unfiltered_groups: dict[_SubscriberGroup, None] = {}
+        self._groups_by_entity_id: dict[str, dict[_SubscriberGroup, None]] = {}
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @property
+    def subscription_count(self) -> int:
+        """Return the number of subscriptions."""
+        return sum(len(group.subscribers) for group in self._groups.values())
+
+    @property
+    def group_count(self) -> int:
+        """Return the number of subscriber groups."""
+        return len(self._groups)
+
+    @callback
+    def async_subscribe(
+        self,
+        send_message: SendMessage,
+        user: User,
+        msg_id: int,
+        entity_ids: set[str],
+        send_entity_update: SendEntityUpdate | None = None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of the entities, or all if empty."""
+        filter_ids = frozenset(entity_ids)
+        key = (user.id, filter_ids)
+        if (group := self._groups.get(key)) is None:
+            group = self._groups[key] = _SubscriberGroup(user, filter_ids)
+            if filter_ids:
+                for entity_id in filter_ids:
+                    self._groups_by_entity_id.setdefault(entity_id, {})[group] = None
+            else:
+                self._unfiltered_groups[group] = None
+        subscriber = (send_message, msg_id, send_entity_update)
+        group.subscribers[subscriber] = None
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_forward_entity_changes,
+                run_immediately=True,
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscription."""
+            del group.subscribers[subscriber]
+            if not group.subscribers:
+                self._async_remove_group(key, group)
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_remove_group(
+        self, key: tuple[str, frozenset[str]], group: _SubscriberGroup
+    ) -> None:
+        """Remove a group without subscriptions."""
+        del self._groups[key]
+        if not group.entity_ids:
+            del self._unfiltered_groups[group]
+        for entity_id in group.entity_ids:
+            groups = self._groups_by_entity_id[entity_id]
+            del groups[group]
+            if not groups:
+                del self._groups_by_entity_id[entity_id]
+        if not self._groups and self._unsub_state_changed is not None:
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+
+    @callback
+    def _async_forward_entity_changes(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Forward a state changed event to the subscriptions."""
+        entity_id = event.data["entity_id"]
+        filtered_groups = self._groups_by_entity_id.get(entity_id)
+        if not self._unfiltered_groups and not filtered_groups:
+            return
+        messages: dict[int, bytes] = {}
+        for groups in (self._unfiltered_groups, filtered_groups):
+            if not groups:
+                continue
+            # Iterate over copies so subscriptions can be removed while forwarding
+            for group in list(groups):
+                # We have to lookup the permissions again because the user
+                # might have changed since the subscription was created.
+                user = group.user
+                if not user.is_admin:
+                    permissions = user.permissions
+                    if not permissions.access_all_entities(
+                        POLICY_READ
+                    ) and not permissions.check_entity(entity_id, POLICY_READ):
+                        continue
+                for send_message, msg_id, send_entity_update in list(group.subscribers):
+                    if send_entity_update is not None:
+                        send_entity_update(msg_id, event)
+                        continue
+                    if (message := messages.get(msg_id)) is None:
+                        message = messages[msg_id] = cached_state_diff_message(
+                            msg_id, event
+                        )
+                    send_message(message)
+
+
+@callback
+def async_get_entity_subscription_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the entity subscription hub."""
+    if (hub := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        hub = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = EntitySubscriptionHub(hass)
+    return hub
@@ -9,19 +9,24 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import EventStateChangedData, async_call_later
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESS_LEVEL,
+    COMPRESS_MAX_SYNC_SIZE,
+    COMPRESS_MIN_SIZE,
+    DATA_CONFLATED_MESSAGES,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
@@ -31,7 +36,11 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import (
+    cached_state_diff_message,
+    conflated_state_diff_message,
+    message_to_json_bytes,
+)
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -62,6 +71,20 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+class _PendingEntityUpdate:
+    """A queued entity update that later updates of the entity merge into."""
+
+    __slots__ = ("msg_id", "entity_id", "event", "old_state", "new_state")
+
+    def __init__(self, msg_id: int, event: Event[EventStateChangedData]) -> None:
+        """Initialize the pending update."""
+        self.msg_id = msg_id
+        self.entity_id: str = event.data["entity_id"]
+        self.event: Event[EventStateChangedData] | None = event
+        self.old_state: State | None = event.data["old_state"]
+        self.new_state: State | None = event.data["new_state"]
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -78,6 +101,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_pending_entity_updates",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -97,8 +121,12 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes | None] = deque()
+        self._message_queue: deque[
+            bytes | _PendingEntityUpdate | Callable[[], bytes] | None
+        ] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # Entity updates in the queue by subscription id and entity id
+        self._pending_entity_updates: dict[tuple[int, str], _PendingEntityUpdate] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -139,34 +167,58 @@ class WebSocketHandler:
                     messages_remaining = len(message_queue)
 
                 # A None message is used to signal the end of the connection
-                if (message := message_queue.popleft()) is None:
+                if (queued := message_queue.popleft()) is None:
                     return
+                deferred_chunk = False
+                if type(queued) is bytes:  # noqa: E721
+                    message = queued
+                else:
+                    deferred_chunk = type(queued) is not _PendingEntityUpdate
+                    message = self._serialize_queued(queued)
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
 
                 if (
-                    not messages_remaining
+                    deferred_chunk
+                    or not messages_remaining
                     or not (connection := self._connection)
                     or not connection.can_coalesce
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
+                    if len(message) < COMPRESS_MIN_SIZE:
+                        await send_bytes_text(message)
+                    else:
+                        await self._send_large_message(send_bytes_text, message)
+                    if deferred_chunk:
+                        # Chunks of a large response are sent in their own
+                        # frame, yield before serializing the next one
+                        await asyncio.sleep(0)
                     continue
 
                 messages: list[bytes] = [message]
                 while messages_remaining:
                     # A None message is used to signal the end of the connection
-                    if (message := message_queue.popleft()) is None:
+                    if (queued := message_queue[0]) is None:
                         return
-                    messages.append(message)
+                    if type(queued) is bytes:  # noqa: E721
+                        messages.append(queued)
+                    elif type(queued) is not _PendingEntityUpdate:
+                        # Deferred chunks are sent in their own frame
+                        break
+                    else:
+                        messages.append(self._serialize_queued(queued))
+                    message_queue.popleft()
                     messages_remaining -= 1
 
                 coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if len(coalesced_messages) < COMPRESS_MIN_SIZE:
+                    await send_bytes_text(coalesced_messages)
+                else:
+                    await self._send_large_message(send_bytes_text, coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -184,8 +236,82 @@ class WebSocketHandler:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    async def _send_large_message(
+        self,
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        message: bytes,
+    ) -> None:
+        """Send a message, compressed if the client supports it.
+
+        Compressed messages are sent as binary frames with the zlib
+        compressed JSON. Messages are never compressed twice when
+        permessage-deflate was negotiated for the websocket.
+        """
+        if (
+            self._wsock.compress
+            or not (connection := self._connection)
+            or not connection.can_compress
+        ):
+            await send_bytes_text(message)
+            return
+        if len(message) > COMPRESS_MAX_SYNC_SIZE:
+            compressed = await self._hass.async_add_executor_job(
+                zlib.compress, message, COMPRESS_LEVEL
+            )
+        else:
+            compressed = zlib.compress(message, COMPRESS_LEVEL)
+        await self._wsock.send_bytes(compressed)
+
+    def _serialize_queued(
+        self, queued: bytes | _PendingEntityUpdate | Callable[[], bytes]
+    ) -> bytes:
+        """Serialize a message that was queued to be serialized when written."""
+        if isinstance(queued, bytes):
+            return queued
+        if not isinstance(queued, _PendingEntityUpdate):
+            return queued()
+        del self._pending_entity_updates[(queued.msg_id, queued.entity_id)]
+        if (event := queued.event) is not None:
+            # Not conflated, the message is shared with other connections
+            return cached_state_diff_message(queued.msg_id, event)
+        return conflated_state_diff_message(
+            queued.msg_id, queued.entity_id, queued.old_state, queued.new_state
+        )
+
     @callback
-    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
+    def _send_entity_update(
+        self, msg_id: int, event: Event[EventStateChangedData]
+    ) -> None:
+        """Queue an entity update of a subscribe_entities subscription.
+
+        An update of an entity that is still queued is merged into the
+        queued update, so the queue holds at most one update per entity.
+        """
+        if self._closing:
+            return
+        key = (msg_id, event.data["entity_id"])
+        if (pending := self._pending_entity_updates.get(key)) is not None:
+            pending.event = None
+            pending.new_state = event.data["new_state"]
+            hass = self._hass
+            hass.data[DATA_CONFLATED_MESSAGES] = (
+                hass.data.get(DATA_CONFLATED_MESSAGES, 0) + 1
+            )
+            return
+        pending = self._pending_entity_updates[key] = _PendingEntityUpdate(
+            msg_id, event
+        )
+        self._send_message(pending)
+
+    @callback
+    def _send_message(
+        self,
+        message: str
+        | bytes
+        | dict[str, Any]
+        | _PendingEntityUpdate
+        | Callable[[], bytes],
+    ) -> None:
         """Queue sending a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -338,6 +464,7 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
+            connection.send_entity_update = self._send_entity_update
             self._writer_task = create_eager_task(self._writer(send_bytes_text))
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -187,15 +187,39 @@ def _state_diff_event(event: Event[EventStateChangedData]) -> dict:
         "r": [entity_id,…]
     }
     """
-    if (event_new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if (event_old_state := event.data["old_state"]) is None:
-        return {
-            ENTITY_EVENT_ADD: {
-                event_new_state.entity_id: event_new_state.as_compressed_state
-            }
+    return _entity_diff(
+        event.data["entity_id"], event.data["old_state"], event.data["new_state"]
+    )
+
+
+def conflated_state_diff_message(
+    iden: int, entity_id: str, old_state: State | None, new_state: State | None
+) -> bytes:
+    """Return an event message for all state changes of an entity since old_state.
+
+    Serialized for a single connection, as the old state depends on which
+    changes were conflated in the queue of the connection.
+    """
+    return _message_to_json_bytes_or_none(
+        {
+            "id": iden,
+            "type": "event",
+            "event": _entity_diff(entity_id, old_state, new_state),
         }
-    return _state_diff(event_old_state, event_new_state)
+    ) or json_bytes(
+        error_message(iden, const.ERR_UNKNOWN_ERROR, "Invalid JSON in response")
+    )
+
+
+def _entity_diff(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict:
+    """Convert a change from old_state to new_state to the minimal version."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
+        return {ENTITY_EVENT_ADD: {entity_id: new_state.as_compressed_state}}
+    return _state_diff(old_state, new_state)
 
 
 def _state_diff(
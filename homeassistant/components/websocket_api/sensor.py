@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
+    DATA_CONFLATED_MESSAGES,
     DATA_CONNECTIONS,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
@@ -22,9 +23,7 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the API streams platform."""
-    entity = APICount()
-
-    async_add_entities([entity])
+    async_add_entities([APICount(), ConflatedMessagesCount()])
 
 
 class APICount(SensorEntity):
@@ -66,3 +65,36 @@ class APICount(SensorEntity):
     def _update_count(self) -> None:
         self.count = self.hass.data.get(DATA_CONNECTIONS, 0)
         self.async_write_ha_state()
+
+
+class ConflatedMessagesCount(SensorEntity):
+    """Entity to represent how many entity updates were conflated.
+
+    The count is polled, signalling every merged update would write a
+    state for each update during the very storm it counts.
+    """
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self) -> None:
+        """Initialize the conflated messages count."""
+        self.count = 0
+
+    @property
+    def name(self) -> str:
+        """Return name of entity."""
+        return "Conflated messages"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of conflated messages."""
+        return self.count
+
+    @property
+    def native_unit_of_measurement(self) -> str:
+        """Return the unit of measurement."""
+        return "messages"
+
+    async def async_update(self) -> None:
+        """Update the conflated messages count."""
+        self.count = self.hass.data.get(DATA_CONFLATED_MESSAGES, 0)
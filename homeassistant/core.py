@@ -6,7 +6,9 @@ of entities and react to changes.
 
 from __future__ import annotations
 
+import array
 import asyncio
+import bisect
 from collections import UserDict, defaultdict
 from collections.abc import (
     Callable,
@@ -25,6 +27,7 @@ import enum
 import functools
 import inspect
 import logging
+import math
 import os
 import pathlib
 import re
@@ -1320,10 +1323,119 @@ class _OneTimeListener:
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+# Upper bounds in seconds of the event bus profile job time histogram buckets
+EVENT_BUS_PROFILE_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+
+def _job_target_name(target: Callable[..., Any]) -> str:
+    """Return a stable name for the target of a job."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    if (qualname := getattr(target, "__qualname__", None)) is None:
+        qualname = type(target).__qualname__
+    return f"{getattr(target, '__module__', None)}.{qualname}"
+
+
+class _EventBusJobStats:
+    """Timing statistics of the jobs of a single target."""
+
+    __slots__ = ("calls", "total_time", "max_time", "histogram")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        # One bucket per upper bound plus one for slower calls
+        self.histogram = [0] * (len(EVENT_BUS_PROFILE_BUCKETS) + 1)
+
+    def record(self, duration: float) -> None:
+        """Record the duration of a call."""
+        self.calls += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.histogram[bisect.bisect_left(EVENT_BUS_PROFILE_BUCKETS, duration)] += 1
+
+
+class EventBusProfile:
+    """Fan-out statistics of the event bus while profiling is enabled.
+
+    Records per event type how often it was fired and to how many
+    listeners it was dispatched, and per job target the time spent
+    running callbacks. Coroutine and executor jobs only count as
+    dispatched listeners as they do not run in the dispatching callback.
+    """
+
+    __slots__ = ("started", "event_types", "jobs")
+
+    def __init__(self) -> None:
+        """Initialize the profile."""
+        self.started = monotonic()
+        # event type -> [fired, dispatched to listeners, callback time]
+        self.event_types: defaultdict[str, list[float]] = defaultdict(
+            lambda: [0, 0, 0.0]
+        )
+        self.jobs: defaultdict[str, _EventBusJobStats] = defaultdict(_EventBusJobStats)
+
+    @callback
+    def async_record_fire(self, event_type: str, listeners: int) -> None:
+        """Record an event being fired."""
+        stats = self.event_types[event_type]
+        stats[0] += 1
+        stats[1] += listeners
+
+    @callback
+    def async_record_job(
+        self, event_type: str, job: HassJob[..., Any], duration: float
+    ) -> None:
+        """Record the time spent running a job for an event."""
+        self.event_types[event_type][2] += duration
+        self.jobs[_job_target_name(job.target)].record(duration)
+
+    @callback
+    def async_run_callback_job(
+        self, job: HassJob[[Event[Any]], Any], event: Event[Any]
+    ) -> None:
+        """Run a callback job scheduled by the event bus and record its time."""
+        start = monotonic()
+        try:
+            job.target(event)
+        finally:
+            self.async_record_job(event.event_type, job, monotonic() - start)
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile as a dictionary."""
+        return {
+            "duration": monotonic() - self.started,
+            "buckets": list(EVENT_BUS_PROFILE_BUCKETS),
+            "event_types": {
+                event_type: {
+                    "fired": fired,
+                    "listeners": listeners,
+                    "callback_time": callback_time,
+                }
+                for event_type, (fired, listeners, callback_time) in (
+                    self.event_types.items()
+                )
+            },
+            "jobs": {
+                target: {
+                    "calls": stats.calls,
+                    "total_time": stats.total_time,
+                    "max_time": stats.max_time,
+                    "histogram": stats.histogram,
+                }
+                for target, stats in self.jobs.items()
+            },
+        }
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = ("_listeners", "_match_all_listeners", "_hass", "_profile")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1331,6 +1443,30 @@ class EventBus:
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
+        self._profile: EventBusProfile | None = None
+
+    @property
+    def profile(self) -> EventBusProfile | None:
+        """Return the active profile, None if profiling is disabled."""
+        return self._profile
+
+    @callback
+    def async_start_profile(self) -> EventBusProfile:
+        """Start profiling the event bus, replacing any active profile.
+
+        This method must be run in the event loop.
+        """
+        self._profile = EventBusProfile()
+        return self._profile
+
+    @callback
+    def async_stop_profile(self) -> EventBusProfile | None:
+        """Stop profiling the event bus and return the profile.
+
+        This method must be run in the event loop.
+        """
+        profile, self._profile = self._profile, None
+        return profile
 
     @callback
     def async_listeners(self) -> dict[str, int]:
@@ -1383,6 +1519,10 @@ class EventBus:
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
+        if (profile := self._profile) is not None:
+            self._async_fire_profiled(profile, event, listeners)
+            return
+
         if not listeners and not match_all_listeners:
             return
 
@@ -1406,6 +1546,44 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_fire_profiled(
+        self,
+        profile: EventBusProfile,
+        event: Event[Any],
+        listeners: list[_FilterableJobType[Any]],
+    ) -> None:
+        """Dispatch an event to its listeners while recording a profile.
+
+        This mirrors async_fire, but times the listener jobs.
+        """
+        event_type = event.event_type
+        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+        if event_type != EVENT_HOMEASSISTANT_CLOSE:
+            listeners = self._match_all_listeners + listeners
+        dispatched = 0
+        for job, event_filter, run_immediately in listeners:
+            if event_filter is not None:
+                try:
+                    if not event_filter(event):
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in event filter")
+                    continue
+            dispatched += 1
+            if run_immediately:
+                start = monotonic()
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error running job: %s", job)
+                profile.async_record_job(event_type, job, monotonic() - start)
+            elif job.job_type is HassJobType.Callback:
+                self._hass.loop.call_soon(profile.async_run_callback_job, job, event)
+            else:
+                self._hass.async_add_hass_job(job, event)
+        profile.async_record_fire(event_type, dispatched)
+
     def listen(
         self,
         event_type: str,
@@ -1782,17 +1960,72 @@ class State:
         )
 
 
+class _DomainStateColumns:
+    """Columnar snapshot of the states of a single domain.
+
+    Each state is a row spread over parallel columns; removing a row
+    moves the last row into its place to keep the columns dense.
+    """
+
+    __slots__ = ("rows", "entity_ids", "states", "values", "last_changed")
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.rows: dict[str, int] = {}
+        self.entity_ids: list[str] = []
+        self.states: list[str] = []
+        # The state as float, NaN if the state is not numeric
+        self.values = array.array("d")
+        self.last_changed = array.array("d")
+
+    def set(self, state: State) -> None:
+        """Add or update the row of a state."""
+        try:
+            value = float(state.state)
+        except ValueError:
+            value = math.nan
+        if (row := self.rows.get(state.entity_id)) is None:
+            self.rows[state.entity_id] = len(self.entity_ids)
+            self.entity_ids.append(state.entity_id)
+            self.states.append(state.state)
+            self.values.append(value)
+            self.last_changed.append(state.last_changed_timestamp)
+            return
+        self.states[row] = state.state
+        self.values[row] = value
+        self.last_changed[row] = state.last_changed_timestamp
+
+    def remove(self, entity_id: str) -> None:
+        """Remove the row of a state."""
+        row = self.rows.pop(entity_id)
+        last_entity_id = self.entity_ids.pop()
+        last_state = self.states.pop()
+        last_value = self.values.pop()
+        last_changed = self.last_changed.pop()
+        if last_entity_id == entity_id:
+            return
+        self.rows[last_entity_id] = row
+        self.entity_ids[row] = last_entity_id
+        self.states[row] = last_state
+        self.values[row] = last_value
+        self.last_changed[row] = last_changed
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    And optionally a columnar index of the states per domain, which is
+    created on first use by async_columns.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._columns: dict[str, _DomainStateColumns] | None = None
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -1802,13 +2035,32 @@ class States(UserDict[str, State]):
         """Add an item."""
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        if self._columns is not None:
+            if (columns := self._columns.get(entry.domain)) is None:
+                columns = self._columns[entry.domain] = _DomainStateColumns()
+            columns.set(entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
+        if self._columns is not None:
+            self._columns[entry.domain].remove(entry.entity_id)
         super().__delitem__(key)
 
+    def async_columns(self) -> dict[str, _DomainStateColumns]:
+        """Return the columnar index, creating it if needed.
+
+        Once created, the index is maintained on every state change.
+        """
+        if self._columns is None:
+            self._columns = {}
+            for domain, states in self._domain_index.items():
+                columns = self._columns[domain] = _DomainStateColumns()
+                for state in states.values():
+                    columns.set(state)
+        return self._columns
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -1908,6 +2160,61 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_query_entity_ids(
+        self,
+        domain_filter: str | Iterable[str] | None = None,
+        *,
+        state: str | Collection[str] | None = None,
+        above: float | None = None,
+        below: float | None = None,
+        changed_since: datetime.datetime | None = None,
+    ) -> list[str]:
+        """Return the entity ids of the states matching all given conditions.
+
+        above and below require a numeric state and are exclusive, like the
+        numeric state trigger. The query is answered from a columnar index
+        of the states, which is created on first use and then maintained
+        incrementally, so no State objects are visited.
+
+        This method must be run in the event loop.
+        """
+        all_columns = self._states.async_columns()
+        if domain_filter is None:
+            domains: Iterable[str] = all_columns
+        elif isinstance(domain_filter, str):
+            domains = (domain_filter.lower(),)
+        else:
+            domains = domain_filter
+        if isinstance(state, str):
+            state = (state,)
+        changed_since_timestamp = (
+            None if changed_since is None else changed_since.timestamp()
+        )
+
+        entity_ids: list[str] = []
+        for domain in domains:
+            if (columns := all_columns.get(domain)) is None:
+                continue
+            rows: Iterable[int] = range(len(columns.entity_ids))
+            if state is not None:
+                states = columns.states
+                rows = [row for row in rows if states[row] in state]
+            if above is not None:
+                values = columns.values
+                rows = [row for row in rows if values[row] > above]
+            if below is not None:
+                values = columns.values
+                rows = [row for row in rows if values[row] < below]
+            if changed_since_timestamp is not None:
+                last_changed = columns.last_changed
+                rows = [
+                    row for row in rows if last_changed[row] >= changed_since_timestamp
+                ]
+            column_entity_ids = columns.entity_ids
+            entity_ids.extend(column_entity_ids[row] for row in rows)
+        return entity_ids
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
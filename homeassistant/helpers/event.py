@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import functools as ft
 import logging
@@ -73,6 +73,8 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TRACK_UTC_TIME_CHANGE_GROUPS = "track_utc_time_change_groups"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1731,14 +1733,26 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
+_TimeChangeKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
+
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
+    """Track a time pattern for all listeners of the pattern.
+
+    The next matching time is calculated once per pattern and all
+    listeners are run from a single timer.
+    """
+
     hass: HomeAssistant
+    key: _TimeChangeKey
     time_match_expression: tuple[list[int], list[int], list[int]]
     microsecond: int
     local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    jobs: dict[HassJob[[datetime], Coroutine[Any, Any, None] | None], None] = field(
+        default_factory=dict
+    )
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1755,6 +1769,31 @@ class _TrackUTCTimeChange:
             self._calculate_next(dt_util.utcnow()),
         )
 
+    @callback
+    def async_add_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> CALLBACK_TYPE:
+        """Add a listener of the pattern."""
+        self.jobs[job] = None
+
+        @callback
+        def _async_remove_job() -> None:
+            """Remove the listener and stop tracking if it was the last one."""
+            jobs = self.jobs
+            if job not in jobs:
+                return
+            del jobs[job]
+            if jobs:
+                return
+            self.async_cancel()
+            groups: dict[_TimeChangeKey, _TrackUTCTimeChange] = self.hass.data[
+                TRACK_UTC_TIME_CHANGE_GROUPS
+            ]
+            if groups.get(self.key) is self:
+                del groups[self.key]
+
+        return _async_remove_job
+
     def _calculate_next(self, utc_now: datetime) -> datetime:
         """Calculate and set the next time the trigger should fire."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
@@ -1770,7 +1809,13 @@ class _TrackUTCTimeChange:
         # time when the timer was scheduled
         utc_now = time_tracker_utcnow()
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        hass.async_run_hass_job(self.job, localized_now, background=True)
+        jobs = self.jobs
+        # Listeners can remove themselves or other listeners of the pattern
+        for job in list(jobs):
+            if job in jobs:
+                hass.async_run_hass_job(job, localized_now, background=True)
+        if not jobs:
+            return
         if TYPE_CHECKING:
             assert self._pattern_time_change_listener_job is not None
         self._cancel_callback = async_track_point_in_utc_time(
@@ -1815,21 +1860,32 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    # Listeners of the same pattern share a single timer
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    groups: dict[_TimeChangeKey, _TrackUTCTimeChange] = hass.data.setdefault(
+        TRACK_UTC_TIME_CHANGE_GROUPS, {}
+    )
+    if (track := groups.get(key)) is None:
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        listener_job_name = f"time change listener {hour}:{minute}:{second}"
+        track = groups[key] = _TrackUTCTimeChange(
+            hass,
+            key,
+            (matching_seconds, matching_minutes, matching_hours),
+            microsecond,
+            local,
+            listener_job_name,
+        )
+        track.async_attach()
+    return track.async_add_job(job)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
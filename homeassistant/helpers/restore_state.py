@@ -25,6 +25,7 @@ DATA_RESTORE_STATE = "restore_state"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_KEY_JOURNAL = "core.restore_state_journal"
 STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
@@ -33,6 +34,14 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How often the full set of states is rewritten even if little changed,
+# this bounds how stale last_seen can be for unchanged entities
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
+# Rewrite the full set of states once the journal holds this
+# fraction of them
+STATE_COMPACT_RATIO = 0.25
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -137,8 +146,16 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.journal = Store[list[dict[str, Any]]](
+            hass, STORAGE_VERSION, STORAGE_KEY_JOURNAL, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state and extra data on disk for each entity, used to
+        # only journal the entities that changed since the last dump
+        self._written: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        self._journal_states: dict[str, StoredState] = {}
+        self._last_compact: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -168,6 +185,26 @@ class RestoreStateData:
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
+
+        try:
+            journal_states = await self.journal.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last states journal", exc_info=exc)
+            journal_states = None
+
+        # The journal holds the entities that changed since the last full
+        # dump. Only apply entries that are not older than the full dump
+        # in case it was rewritten without clearing the journal.
+        for item in journal_states or ():
+            entity_id = item["state"]["entity_id"]
+            if not valid_entity_id(entity_id):
+                continue
+            stored_state = StoredState.from_dict(item)
+            existing = self.last_states.get(entity_id)
+            if existing is None or stored_state.last_seen >= existing.last_seen:
+                self.last_states[entity_id] = stored_state
+
+        if self.last_states:
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
     @callback
@@ -215,17 +252,68 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the states that changed since the last full dump are written
+        to the journal. All states are rewritten on the first dump of a
+        run, when a state has to be dropped, when the journal grows past
+        STATE_COMPACT_RATIO of the states and every STATE_COMPACT_INTERVAL.
+        """
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        stored_states = self.async_get_stored_states()
+        written = self._written
+        current: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        changed: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        for stored_state in stored_states:
+            entity_id = stored_state.state.entity_id
+            extra_data = stored_state.extra_data
+            entry = (stored_state.state, extra_data.as_dict() if extra_data else None)
+            current[entity_id] = entry
+            if (
+                (last := written.get(entity_id)) is None
+                or last[0] is not entry[0]
+                or last[1] != entry[1]
+            ):
+                changed[entity_id] = entry
+                self._journal_states[entity_id] = stored_state
+
+        compact = (
+            self._last_compact is None
+            or now - self._last_compact >= STATE_COMPACT_INTERVAL
+            or len(self._journal_states) > len(stored_states) * STATE_COMPACT_RATIO
+            or not written.keys() <= current.keys()
+            or not self._journal_states.keys() <= current.keys()
+        )
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            if compact:
+                await self.store.async_save(
+                    [stored_state.as_dict() for stored_state in stored_states]
+                )
+            else:
+                await self.journal.async_save(
+                    [
+                        stored_state.as_dict()
+                        for stored_state in self._journal_states.values()
+                    ]
+                )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        if not compact:
+            written.update(changed)
+            return
+
+        self._written = current
+        self._journal_states = {}
+        self._last_compact = now
+        # A journal left behind is harmless, its entries are not newer
+        # than the full dump and it is rewritten by the next dump
+        try:
+            await self.journal.async_save([])
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error clearing last states journal", exc_info=exc)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -100,6 +100,7 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_RENDER_MEMO = "template.render_memo"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -160,6 +161,20 @@ EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
+#
+# Compiled template code only depends on the template source and the
+# type of environment, so it is shared between all environments and
+# all Template instances with the same source.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
+RENDER_MEMO_CACHE_SIZE = 512
+
+ENV_TYPE_NORMAL = "normal"
+ENV_TYPE_LIMITED = "limited"
+ENV_TYPE_STRICT = "strict"
+
+_MEMOIZABLE_RESULT_TYPES = {str, int, float, bool, type(None)}
+
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
@@ -169,6 +184,80 @@ ORJSON_PASSTHROUGH_OPTIONS = (
 )
 
 
+class _BoundedCache:
+    """A bounded LRU cache which keeps track of its evictions."""
+
+    __slots__ = ("_lru", "evictions")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._lru: LRU = LRU(size, callback=self._evicted)
+        self.evictions = 0
+
+    def _evicted(self, key: Any, value: Any) -> None:
+        """Count an evicted entry."""
+        self.evictions += 1
+
+    def get(self, key: Any) -> Any:
+        """Return a cached value or None."""
+        return self._lru.get(key)
+
+    def set(self, key: Any, value: Any) -> None:
+        """Cache a value."""
+        self._lru[key] = value
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        hits, misses = self._lru.get_stats()
+        return {
+            "size": len(self._lru),
+            "max_size": self._lru.get_size(),
+            "hits": hits,
+            "misses": misses,
+            "evictions": self.evictions,
+        }
+
+
+COMPILED_TEMPLATE_CACHE = _BoundedCache(COMPILED_TEMPLATE_CACHE_SIZE)
+
+
+class _MemoizedRender:
+    """The result of a pure template render and the states it was based on."""
+
+    __slots__ = ("states", "result", "entities", "rate_limit")
+
+    def __init__(
+        self,
+        states: tuple[tuple[str, State | None], ...],
+        result: Any,
+        entities: collections.abc.Set[str],
+        rate_limit: timedelta | None,
+    ) -> None:
+        """Initialize the memoized render."""
+        self.states = states
+        self.result = result
+        self.entities = entities
+        self.rate_limit = rate_limit
+
+
+@callback
+def _async_get_render_memo(hass: HomeAssistant) -> _BoundedCache:
+    """Return the render memo of the hass instance."""
+    memo: _BoundedCache | None = hass.data.get(_RENDER_MEMO)
+    if memo is None:
+        memo = hass.data[_RENDER_MEMO] = _BoundedCache(RENDER_MEMO_CACHE_SIZE)
+    return memo
+
+
+@callback
+def async_get_template_cache_stats(hass: HomeAssistant) -> dict[str, dict[str, int]]:
+    """Return the statistics of the compiled template and render caches."""
+    return {
+        "compiled": COMPILED_TEMPLATE_CACHE.stats(),
+        "render": _async_get_render_memo(hass).stats(),
+    }
+
+
 def _template_state_no_collect(hass: HomeAssistant, state: State) -> TemplateState:
     """Return a TemplateState for a state without collecting."""
     if template_state := CACHED_TEMPLATE_NO_COLLECT_LRU.get(state):
@@ -687,9 +776,16 @@ class Template:
         variables: TemplateVarsType = None,
         strict: bool = False,
         log_fn: Callable[[int, str], None] | None = None,
+        memoize: bool = False,
         **kwargs: Any,
     ) -> RenderInfo:
-        """Render the template and collect an entity filter."""
+        """Render the template and collect an entity filter.
+
+        If memoize is True, the caller asserts that the template is pure:
+        its result only depends on the states of the entities it tracks.
+        The result is then shared with other renders of the same template
+        source as long as none of the tracked states has changed.
+        """
         self._renders += 1
         assert self.hass and _render_info.get() is None
 
@@ -701,6 +797,32 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        memo_key: tuple[str, str] | None = None
+        if (
+            memoize
+            and not variables
+            and log_fn is None
+            and kwargs.keys() <= {"limited"}
+        ):
+            # The result depends on the environment the template renders in,
+            # which is fixed once the template has been compiled
+            limited: bool = kwargs.get("limited", False)
+            if self._compiled is not None:
+                limited, strict = bool(self._limited), bool(self._strict)
+            if limited:
+                env_type = ENV_TYPE_LIMITED
+            elif strict:
+                env_type = ENV_TYPE_STRICT
+            else:
+                env_type = ENV_TYPE_NORMAL
+            memo_key = (env_type, self.template)
+            if memoized := self._async_get_memoized_render(memo_key):
+                render_info._result = memoized.result
+                render_info.entities = memoized.entities
+                render_info.rate_limit = memoized.rate_limit
+                render_info._freeze()
+                return render_info
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(
@@ -712,8 +834,56 @@ class Template:
             _render_info.reset(token)
 
         render_info._freeze()
+        if memo_key is not None:
+            self._async_memoize_render(memo_key, render_info)
         return render_info
 
+    def _async_get_memoized_render(
+        self, memo_key: tuple[str, str]
+    ) -> _MemoizedRender | None:
+        """Return the memoized render if the tracked states did not change."""
+        assert self.hass is not None
+        memoized: _MemoizedRender | None = _async_get_render_memo(self.hass).get(
+            memo_key
+        )
+        if memoized is None:
+            return None
+        get_state = self.hass.states.get
+        for entity_id, state in memoized.states:
+            if get_state(entity_id) is not state:
+                return None
+        return memoized
+
+    def _async_memoize_render(
+        self, memo_key: tuple[str, str], render_info: RenderInfo
+    ) -> None:
+        """Memoize the render if it only depends on the tracked entities."""
+        assert self.hass is not None
+        # pylint: disable=protected-access
+        if (
+            render_info.exception is not None
+            or render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.domains
+            or render_info.domains_lifecycle
+            or render_info.has_time
+            or type(render_info._result) not in _MEMOIZABLE_RESULT_TYPES
+        ):
+            return
+        get_state = self.hass.states.get
+        _async_get_render_memo(self.hass).set(
+            memo_key,
+            _MemoizedRender(
+                tuple(
+                    (entity_id, get_state(entity_id))
+                    for entity_id in render_info.entities
+                ),
+                render_info._result,
+                render_info.entities,
+                render_info.rate_limit,
+            ),
+        )
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -1273,6 +1443,32 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
     return list(found.values())
 
 
+def domain_entities(
+    hass: HomeAssistant,
+    domain: str | Iterable[str],
+    state: str | Iterable[str] | None = None,
+    above: Any = None,
+    below: Any = None,
+) -> Iterable[str]:
+    """Get entity ids of one or more domains, optionally filtered by state.
+
+    above and below only match numeric states. The states are looked up in
+    the columnar index of the state machine without creating template states.
+    """
+    domains = [domain] if isinstance(domain, str) else list(domain)
+    for domain_name in domains:
+        if not valid_domain(domain_name):
+            raise TemplateError(f"Invalid domain name '{domain_name}'")
+    if (render_info := _render_info.get()) is not None:
+        render_info.domains.update(domains)  # type: ignore[attr-defined]
+    return hass.states.async_query_entity_ids(
+        domains,
+        state=state if state is None or isinstance(state, str) else set(state),
+        above=None if above is None else float(above),
+        below=None if below is None else float(below),
+    )
+
+
 def device_entities(hass: HomeAssistant, _device_id: str) -> Iterable[str]:
     """Get entity ids for entities tied to a device."""
     entity_reg = entity_registry.async_get(hass)
@@ -2509,6 +2705,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        if limited:
+            self.env_type = ENV_TYPE_LIMITED
+        elif strict:
+            self.env_type = ENV_TYPE_STRICT
+        else:
+            self.env_type = ENV_TYPE_NORMAL
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
@@ -2681,6 +2883,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             hass_globals = [
                 "closest",
                 "distance",
+                "domain_entities",
                 "expand",
                 "is_hidden_entity",
                 "is_state",
@@ -2701,6 +2904,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             ]
             hass_filters = [
                 "closest",
+                "domain_entities",
                 "expand",
                 "device_id",
                 "area_id",
@@ -2723,6 +2927,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         self.globals["expand"] = hassfunction(expand)
         self.filters["expand"] = self.globals["expand"]
+        self.globals["domain_entities"] = hassfunction(domain_entities)
+        self.filters["domain_entities"] = self.globals["domain_entities"]
         self.globals["closest"] = hassfunction(closest)
         self.filters["closest"] = hassfunction(closest_filter)
         self.globals["distance"] = hassfunction(distance)
@@ -2816,6 +3022,14 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
+        if isinstance(source, str):
+            key = (self.env_type, source)
+            code: CodeType | None = COMPILED_TEMPLATE_CACHE.get(key)
+            if code is None:
+                code = super().compile(source)
+                COMPILED_TEMPLATE_CACHE.set(key, code)
+            return code
+
         if (cached := self.template_cache.get(source)) is None:
             cached = self.template_cache[source] = super().compile(source)
 
@@ -9,10 +9,13 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import random
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
+import zlib
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -315,6 +318,269 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_matching_subscriptions(hass):
+    """Replay a topic stream against 10k MQTT subscriptions.
+
+    Mimics a zigbee2mqtt and Tasmota install: exact subscriptions per
+    device, wildcard subscriptions per Tasmota device and discovery
+    wildcards, with a high cardinality topic stream.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT, Subscription
+
+    config_entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain="mqtt",
+        title="benchmark",
+        data={},
+        source=config_entries.SOURCE_USER,
+    )
+    mqtt_client = MQTT(hass, config_entry, {})
+    job = core.HassJob(lambda msg: None)
+    for idx in range(2000):
+        for topic in (
+            f"zigbee2mqtt/device_{idx}",
+            f"zigbee2mqtt/device_{idx}/availability",
+            f"tele/tasmota_{idx}/+",
+            f"stat/tasmota_{idx}/+",
+            f"tasmota_{idx}/+/POWER",
+        ):
+            mqtt_client._async_track_subscription(Subscription(topic, job))
+    for topic in ("homeassistant/+/+/config", "homeassistant/+/+/+/config"):
+        mqtt_client._async_track_subscription(Subscription(topic, job))
+    mqtt_client._async_track_subscription(Subscription("tasmota/discovery/#", job))
+
+    rand = random.Random(0)
+    topics = [
+        rand.choice(
+            (
+                f"zigbee2mqtt/device_{rand.randrange(2500)}",
+                f"zigbee2mqtt/device_{rand.randrange(2500)}/availability",
+                f"tele/tasmota_{rand.randrange(2500)}/SENSOR",
+                f"stat/tasmota_{rand.randrange(2500)}/RESULT",
+                f"tasmota_{rand.randrange(2500)}/cmnd/POWER",
+                f"tasmota/discovery/{rand.randrange(2500)}/config",
+                f"homeassistant/sensor/node_{rand.randrange(2500)}/config",
+            )
+        )
+        for _ in range(10**5)
+    ]
+
+    start = timer()
+
+    for topic in topics:
+        mqtt_client._matching_subscriptions(topic)
+
+    return timer() - start
+
+
+@benchmark
+async def websocket_compress_states(hass):
+    """Compress the subscribe_entities snapshot of 10k entities.
+
+    Prints the payload size as text and compressed.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.const import COMPRESS_LEVEL
+
+    states = [
+        core.State(
+            f"sensor.benchmark_{idx}",
+            str(idx * 1.37),
+            {
+                "friendly_name": f"Benchmark {idx}",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+            },
+        )
+        for idx in range(10**4)
+    ]
+    payload = b"".join(
+        (
+            b'{"id":2,"type":"event","event":{"a":{',
+            b",".join(
+                b"".join(
+                    (
+                        b'"',
+                        state.entity_id.encode(),
+                        b'":',
+                        state.as_compressed_state_json,
+                    )
+                )
+                for state in states
+            ),
+            b"}}}",
+        )
+    )
+
+    start = timer()
+    compressed = zlib.compress(payload, COMPRESS_LEVEL)
+    runtime = timer() - start
+
+    print(f"Payload {len(payload)} bytes, compressed {len(compressed)} bytes")
+    return runtime
+
+
+async def _subscribe_entities_fan_out(hass, clients):
+    """Fan out 10k state changes to subscribe_entities clients.
+
+    Mimics wall tablets and phones: each client has its own connection
+    and writer queue, most clients subscribe to all entities with one of
+    a few users and the rest to a few entities.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.entity_subscriptions import (
+        async_get_entity_subscription_hub,
+    )
+
+    hub = async_get_entity_subscription_hub(hass)
+    users = [User(f"user {idx}", None, is_owner=True) for idx in range(4)]
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(100)]
+    queues = [collections.deque() for _ in range(clients)]
+    for idx, writer_queue in enumerate(queues):
+        subscribed = set(entity_ids[idx % 10 :: 10]) if idx % 5 == 0 else set()
+        hub.async_subscribe(writer_queue.append, users[idx % 4], 2, subscribed)
+
+    start = timer()
+
+    for value in range(100):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, value)
+
+    await hass.async_block_till_done()
+
+    assert sum(len(writer_queue) for writer_queue in queues)
+
+    return timer() - start
+
+
+@benchmark
+async def subscribe_entities_fan_out_10(hass):
+    """Fan out 10k state changes to 10 subscribe_entities clients."""
+    return await _subscribe_entities_fan_out(hass, 10)
+
+
+@benchmark
+async def subscribe_entities_fan_out_100(hass):
+    """Fan out 10k state changes to 100 subscribe_entities clients."""
+    return await _subscribe_entities_fan_out(hass, 100)
+
+
+@benchmark
+async def subscribe_entities_fan_out_500(hass):
+    """Fan out 10k state changes to 500 subscribe_entities clients."""
+    return await _subscribe_entities_fan_out(hass, 500)
+
+
+@benchmark
+async def sensor_group_300_members(hass):
+    """Update members of 300 member sensor groups 10k times.
+
+    Mimics a group of power plugs: every member change updates a min,
+    mean, median and sum group of the same members.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.group.sensor import SensorGroup
+
+    entity_ids = [f"sensor.power_{idx}" for idx in range(300)]
+    for idx, entity_id in enumerate(entity_ids):
+        hass.states.async_set(entity_id, idx)
+    groups = [
+        SensorGroup(
+            hass, None, "Power", entity_ids, False, sensor_type, None, None, None
+        )
+        for sensor_type in ("min", "mean", "median", "sum")
+    ]
+    for group in groups:
+        group.async_update_group_state()
+
+    rand = random.Random(0)
+    updates = [
+        (rand.choice(entity_ids), str(round(rand.uniform(0, 3000), 1)))
+        for _ in range(10**4)
+    ]
+
+    start = timer()
+
+    for entity_id, value in updates:
+        hass.states.async_set(entity_id, value)
+        for group in groups:
+            group.async_update_group_state()
+
+    return timer() - start
+
+
+@benchmark
+async def history_columnar(hass):
+    """Build the history of 50 sensors over a week, per row and columnar.
+
+    Mimics the energy and power graphs: sensors updating every minute with
+    attributes that rarely change. Prints the runtime, peak memory and
+    payload size of both formats, and returns the runtime of the columnar
+    format.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.history.modern import (
+        _sorted_states_to_columns,
+        _sorted_states_to_dict,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.json import json_bytes
+
+    row = collections.namedtuple(
+        "Row", ["metadata_id", "state", "last_updated_ts", "attributes"]
+    )
+    entity_ids = [f"sensor.power_{idx}" for idx in range(50)]
+    entity_id_to_metadata_id = {
+        entity_id: idx for idx, entity_id in enumerate(entity_ids)
+    }
+    attributes = (
+        '{"friendly_name":"Power","unit_of_measurement":"W",'
+        '"device_class":"power","state_class":"measurement"}'
+    )
+    rand = random.Random(0)
+    start_ts = 1700000000.0
+    rows = [
+        row(
+            metadata_id,
+            str(round(rand.uniform(0, 3000), 1)),
+            start_ts + minute * 60,
+            attributes,
+        )
+        for metadata_id in range(50)
+        for minute in range(7 * 24 * 60)
+    ]
+
+    def _build(builder, *args):
+        tracemalloc.start()
+        start = timer()
+        payload = json_bytes(
+            builder(rows, start_ts, entity_ids, entity_id_to_metadata_id, *args)
+        )
+        runtime = timer() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return runtime, peak, len(payload)
+
+    for name, builder, args in (
+        ("compressed states", _sorted_states_to_dict, (False, True)),
+        ("columnar", _sorted_states_to_columns, ()),
+    ):
+        runtime, peak, size = _build(builder, *args)
+        print(
+            f"{name}: {runtime:.3f}s, peak memory {peak / 2**20:.1f} MiB,"
+            f" payload {size / 2**20:.1f} MiB"
+        )
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from math import prod
+import random
 import statistics
 from typing import Any
 from unittest.mock import patch
@@ -15,6 +16,7 @@ from homeassistant.components.group.sensor import (
     ATTR_LAST_ENTITY_ID,
     ATTR_MAX_ENTITY_ID,
     ATTR_MIN_ENTITY_ID,
+    CALC_TYPES,
     DEFAULT_NAME,
 )
 from homeassistant.components.sensor import (
@@ -115,6 +117,57 @@ async def test_sensors2(
     assert entity.unique_id == "very_unique_id"
 
 
+@pytest.mark.parametrize(
+    "sensor_type", ["min", "max", "mean", "median", "range", "sum"]
+)
+async def test_sensors_incremental_updates(
+    hass: HomeAssistant, sensor_type: str
+) -> None:
+    """Test member updates give the same results as a full recalculation."""
+    entity_ids = [f"sensor.test_{idx}" for idx in range(12)] + ["sensor.test_0"]
+    config = {
+        SENSOR_DOMAIN: {
+            "platform": GROUP_DOMAIN,
+            "name": DEFAULT_NAME,
+            "type": sensor_type,
+            "entities": entity_ids,
+            "ignore_non_numeric": True,
+        }
+    }
+    assert await async_setup_component(hass, "sensor", config)
+    await hass.async_block_till_done()
+    group = hass.data[SENSOR_DOMAIN].get_entity(f"sensor.sensor_group_{sensor_type}")
+
+    rand = random.Random(0)
+    values = ["0", "1", "1.5", "-2.25", "1e-17", "3", "inf", "nan"]
+    values += [STATE_UNKNOWN, STATE_UNAVAILABLE, "string", None]
+    for _ in range(500):
+        entity_id = rand.choice(entity_ids)
+        if (value := rand.choice(values)) is None:
+            hass.states.async_remove(entity_id)
+        else:
+            hass.states.async_set(entity_id, value)
+        await hass.async_block_till_done()
+
+        sensor_values = []
+        for member_id in entity_ids:
+            if (member_state := hass.states.get(member_id)) is None:
+                continue
+            try:
+                sensor_values.append((member_id, float(member_state.state), None))
+            except ValueError:
+                continue
+        if not sensor_values:
+            assert group.available is False
+            continue
+        attributes, result = CALC_TYPES[sensor_type](sensor_values)
+        assert str(group.native_value) == str(result)
+        assert group.extra_state_attributes == {
+            ATTR_ENTITY_ID: entity_ids,
+            **attributes,
+        }
+
+
 async def test_sensors_attributes_defined(hass: HomeAssistant) -> None:
     """Test the sensors."""
     config = {
@@ -2,7 +2,7 @@
 
 import asyncio
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import pytest
@@ -231,6 +231,118 @@ async def test_history_during_period_impossible_conditions(
     assert response["result"] == {}
 
 
+async def test_history_during_period_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period in the columnar format."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "again"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    sensor_test_history = response["result"]["sensor.test"]
+    assert sensor_test_history["s"] == ["on", "off", "off", "off", "on"]
+    last_updated = sensor_test_history["lu"]
+    assert len(last_updated) == 5
+    assert all(isinstance(timestamp, float) for timestamp in last_updated)
+    # Attributes are only sent when they change
+    assert sensor_test_history["a"] == [
+        [0, {"any": "attr"}],
+        [2, {"any": "changed"}],
+        [3, {"any": "again"}],
+        [4, {"any": "attr"}],
+    ]
+    # last_changed is only sent when it differs from last_updated
+    assert sensor_test_history["lc"] == [
+        [2, last_updated[1]],
+        [3, last_updated[1]],
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": {"s": ["on", "off", "on"], "lu": ANY},
+    }
+
+
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("5", "1", "4", "9", "2", "3", "unavailable", "7"):
+        hass.states.async_set("sensor.power", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    for msg_id, columnar in ((1, False), (2, True)):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.power"],
+                "significant_changes_only": False,
+                "minimal_response": True,
+                "no_attributes": True,
+                "columnar": columnar,
+                "max_points": 4,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        sensor_power_history = response["result"]["sensor.power"]
+        if not columnar:
+            sensor_power_history = {"s": [state["s"] for state in sensor_power_history]}
+        # Only the first, lowest, highest and last states of the bucket
+        # are kept, and unavailable closes the bucket
+        assert sensor_power_history["s"] == ["5", "1", "9", "3", "unavailable", "7"]
+
+
 @pytest.mark.parametrize(
     "time_zone", ["UTC", "Europe/Berlin", "America/Chicago", "US/Hawaii"]
 )
@@ -881,6 +993,86 @@ async def test_history_stream_live_no_attributes_minimal_response(
     }
 
 
+async def test_history_stream_live_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream with history and live data in the columnar format."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": sensor_two_last_updated.timestamp(),
+            "start_time": now.timestamp(),
+            "states": {
+                "sensor.one": {
+                    "a": [[0, {"any": "attr"}]],
+                    "lu": [sensor_one_last_updated.timestamp()],
+                    "s": ["on"],
+                },
+                "sensor.two": {
+                    "a": [[0, {"any": "attr"}]],
+                    "lu": [sensor_two_last_updated.timestamp()],
+                    "s": ["off"],
+                },
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "one", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "two", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "states": {
+                "sensor.one": {
+                    "a": [[0, {"any": "attr"}]],
+                    "lu": [sensor_one_last_updated.timestamp()],
+                    "s": ["one"],
+                },
+                "sensor.two": {
+                    "a": [[0, {"any": "changed"}]],
+                    "lu": [sensor_two_last_updated.timestamp()],
+                    "s": ["two"],
+                },
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+
 async def test_history_stream_live(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
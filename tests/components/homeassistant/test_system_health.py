@@ -0,0 +1,26 @@
+"""Test Home Assistant system health."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import template
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_template_cache_info(hass: HomeAssistant) -> None:
+    """Test the template cache statistics are reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.a", "1")
+    tpl = template.Template("{{ states('sensor.a') }}", hass)
+    tpl.async_render_to_info(memoize=True)
+    tpl.async_render_to_info(memoize=True)
+
+    info = await get_system_health_info(hass, "homeassistant")
+
+    assert info["template_render_cache"] == (
+        f"1/{template.RENDER_MEMO_CACHE_SIZE} entries, 1 hits, 1 misses, 0 evictions"
+    )
+    assert info["template_compiled_cache"].endswith(" evictions")
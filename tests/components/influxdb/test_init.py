@@ -1421,6 +1421,80 @@ async def test_event_listener_backlog_full(
         assert get_write_api(mock_client).call_count == 0
 
 
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_write_buffer(
+    hass: HomeAssistant,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+    tmp_path,
+) -> None:
+    """Test the event listener buffers events on disk while writes fail."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"max_retries": 0, "write_buffer_size": 1}
+    config.update(config_ext)
+    await _setup(hass, mock_client, config, get_write_api)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+
+    # Write fails, the event is buffered on disk. The queue is waited on
+    # twice since the first wait returns before the batch is written.
+    hass.states.async_set("entity.entity_id", 1)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 1
+    assert hass.data[influxdb.DOMAIN].write_buffer.count == 1
+
+    # Write works again, the buffered events are written in order
+    write_api.side_effect = None
+    write_api.reset_mock()
+    hass.data[influxdb.DOMAIN].next_buffer_write = 0
+    hass.states.async_set("entity.entity_id", 2)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 2
+    assert hass.data[influxdb.DOMAIN].write_buffer.count == 0
+
+    if get_write_api == _get_write_api_mock_v1:
+        assert all(
+            write_call.kwargs["protocol"] == "line"
+            for write_call in write_api.call_args_list
+        )
+        first, second = (write_call.args[0] for write_call in write_api.call_args_list)
+    else:
+        first, second = (
+            write_call.kwargs["record"] for write_call in write_api.call_args_list
+        )
+    assert "entity_id=entity_id value=1" in first
+    assert "entity_id=entity_id value=2" in second
+
+    if get_write_api == _get_write_api_mock_v2:
+        # Failed writes are only reported by the synchronous API
+        assert mock_client.return_value.write_api.call_args == call(
+            write_options=influxdb.SYNCHRONOUS
+        )
+
+
 @pytest.mark.parametrize(
     ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
     [
@@ -0,0 +1,98 @@
+"""The tests for the InfluxDB on-disk write buffer."""
+
+from unittest.mock import patch
+
+from homeassistant.components.influxdb.write_buffer import WriteBuffer
+
+
+def test_write_buffer_order(tmp_path) -> None:
+    """Test batches are returned in the order they were buffered."""
+    buffer = WriteBuffer(str(tmp_path), 1024 * 1024)
+    assert buffer.peek() is None
+
+    buffer.append("a value=1\n", 1)
+    buffer.append("a value=2\na value=3\n", 2)
+    assert buffer.count == 3
+
+    assert buffer.peek() == ("a value=1\n", 1)
+    buffer.pop()
+    assert buffer.peek() == ("a value=2\na value=3\n", 2)
+    buffer.pop()
+    assert buffer.peek() is None
+    assert buffer.count == 0
+    assert buffer.size == 0
+
+
+def test_write_buffer_persistent(tmp_path) -> None:
+    """Test batches of a previous run are loaded."""
+    buffer = WriteBuffer(str(tmp_path), 1024 * 1024)
+    buffer.append("a value=1\n", 1)
+    buffer.append("a value=2\n", 1)
+
+    buffer = WriteBuffer(str(tmp_path), 1024 * 1024)
+    assert buffer.count == 2
+    assert buffer.peek() == ("a value=1\n", 1)
+    buffer.append("a value=3\n", 1)
+    buffer.pop()
+    buffer.pop()
+    assert buffer.peek() == ("a value=3\n", 1)
+
+
+def test_write_buffer_full(tmp_path, caplog) -> None:
+    """Test the oldest batches are dropped when the buffer is full."""
+    buffer = WriteBuffer(str(tmp_path), 1)
+    buffer.append("a value=1\n", 1)
+    buffer.append("a value=2\n", 1)
+
+    assert buffer.count == 1
+    assert buffer.peek() == ("a value=2\n", 1)
+    assert "dropped 1 buffered events" in caplog.text
+
+
+def test_write_buffer_unknown_files(tmp_path) -> None:
+    """Test files which are not buffered batches are ignored."""
+    buffer = WriteBuffer(str(tmp_path), 1024 * 1024)
+    buffer.append("a value=1\n", 1)
+    (tmp_path / "foo.lp.gz").write_bytes(b"foo")
+    (tmp_path / "000000000001.lp.gz").write_bytes(b"foo")
+
+    buffer = WriteBuffer(str(tmp_path), 1024 * 1024)
+    assert buffer.count == 1
+    assert buffer.peek() == ("a value=1\n", 1)
+
+
+def test_write_buffer_write_error(tmp_path, caplog) -> None:
+    """Test a batch which can't be written is reported as lost."""
+    buffer = WriteBuffer(str(tmp_path), 1024 * 1024)
+
+    with patch("builtins.open", side_effect=OSError("disk full")):
+        assert buffer.append("a value=1\n", 1) is False
+
+    assert buffer.count == 0
+    assert buffer.peek() is None
+    assert "Could not buffer 1 events on disk" in caplog.text
+    assert buffer.append("a value=2\n", 1) is True
+    assert buffer.peek() == ("a value=2\n", 1)
+
+
+def test_write_buffer_read_error(tmp_path, caplog) -> None:
+    """Test batches which can't be read are dropped."""
+    buffer = WriteBuffer(str(tmp_path), 1024 * 1024)
+    buffer.append("a value=1\na value=2\n", 2)
+    buffer.append("a value=3\n", 1)
+    (tmp_path / "000000000000-2.lp.gz").write_bytes(b"corrupt")
+
+    assert buffer.peek() == ("a value=3\n", 1)
+    assert buffer.count == 1
+    assert "Could not read 2 buffered events" in caplog.text
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["000000000001-1.lp.gz"]
+
+
+def test_write_buffer_load_error(tmp_path, caplog) -> None:
+    """Test the buffer starts empty if the directory can't be read."""
+    with patch("os.listdir", side_effect=OSError("denied")):
+        buffer = WriteBuffer(str(tmp_path), 1024 * 1024)
+
+    assert buffer.count == 0
+    assert buffer.peek() is None
+    assert "Could not load the write buffer" in caplog.text
@@ -1741,6 +1741,62 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.MAX_EVENTS_PER_MESSAGE", 2)
+async def test_logbook_stream_past_only_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are streamed in chunks of MAX_EVENTS_PER_MESSAGE."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    hass.states.async_set("binary_sensor.is_light", STATE_ON)
+    for new_state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("binary_sensor.is_light", new_state)
+    await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["binary_sensor.is_light"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    states = []
+    for expected_count, partial in ((2, True), (2, True), (1, False)):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert len(msg["event"]["events"]) == expected_count
+        assert ("partial" in msg["event"]) is partial
+        states.extend(event["state"] for event in msg["event"]["events"])
+
+    assert states == ["off", "on", "off", "on", "off"]
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 8
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -20,6 +20,12 @@ default_config = {
     "birth_message": {},
     "broker": "mock-broker",
 }
+default_message_dispatch = {
+    "queue_depth": 0,
+    "max_queue_depth": 0,
+    "last_drain_latency": 0.0,
+    "max_drain_latency": 0.0,
+}
 
 
 async def test_entry_diagnostics(
@@ -37,6 +43,7 @@ async def test_entry_diagnostics(
     await get_diagnostics_for_config_entry(hass, hass_client, config_entry)
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
+        "message_dispatch": default_message_dispatch,
         "devices": [],
         "mqtt_config": default_config,
         "mqtt_debug_info": {"entities": [], "triggers": []},
@@ -121,6 +128,7 @@ async def test_entry_diagnostics(
 
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
+        "message_dispatch": default_message_dispatch,
         "devices": [expected_device],
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
@@ -130,6 +138,7 @@ async def test_entry_diagnostics(
         hass, hass_client, config_entry, device_entry
     ) == {
         "connected": True,
+        "message_dispatch": default_message_dispatch,
         "device": expected_device,
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
@@ -248,6 +257,7 @@ async def test_redact_diagnostics(
     await get_diagnostics_for_config_entry(hass, hass_client, config_entry)
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
+        "message_dispatch": default_message_dispatch,
         "devices": [expected_device],
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
@@ -257,6 +267,7 @@ async def test_redact_diagnostics(
         hass, hass_client, config_entry, device_entry
     ) == {
         "connected": True,
+        "message_dispatch": default_message_dispatch,
         "device": expected_device,
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
@@ -275,6 +286,7 @@ async def test_redact_diagnostics(
         hass, hass_client, config_entry, device_entry
     ) == {
         "connected": True,
+        "message_dispatch": default_message_dispatch,
         "device": {
             "id": device_entry.id,
             "name": None,
@@ -568,6 +568,147 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+async def test_unchanged_discovery_payload_skipped(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an unchanged discovery payload is not decoded again."""
+    await mqtt_mock_entry()
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Beer", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    with patch(
+        "homeassistant.components.mqtt.discovery.json_loads_object"
+    ) as json_loads_mock:
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/binary_sensor/bla/config",
+            '{ "name": "Beer", "state_topic": "test-topic" }',
+        )
+        await hass.async_block_till_done()
+
+    assert not json_loads_mock.called
+    assert "Ignoring unchanged discovery payload for binary_sensor bla" in caplog.text
+
+    # A changed payload is processed
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer").name == "Milk"
+
+    # After removal the same payload is discovered again
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.milk") is not None
+
+
+async def test_discovery_burst_decoded_in_executor(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test a burst of discovery messages is decoded in the executor."""
+    await mqtt_mock_entry()
+    with patch(
+        "homeassistant.components.mqtt.discovery._decode_discovery_payloads",
+        wraps=mqtt.discovery._decode_discovery_payloads,
+    ) as decode_mock:
+        for idx in range(80):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/bla{idx}/config",
+                json.dumps({"name": f"Beer {idx}", "state_topic": "test-topic"}),
+            )
+        # The last message overrides the first one of the burst
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/binary_sensor/bla0/config",
+            '{ "name": "Milk", "state_topic": "test-topic" }',
+        )
+        async_fire_mqtt_message(
+            hass, "homeassistant/binary_sensor/bla79/config", "invalid"
+        )
+        await hass.async_block_till_done()
+
+    # The first 50 messages are processed in the event loop
+    assert len(decode_mock.call_args[0][0]) == 32
+    assert len(hass.states.async_all("binary_sensor")) == 80
+    assert hass.states.get("binary_sensor.beer_0").name == "Milk"
+    assert hass.states.get("binary_sensor.beer_79") is not None
+
+
+async def test_unchanged_discovery_burst_not_decoded(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test a replayed burst of unchanged discovery payloads is not decoded."""
+    await mqtt_mock_entry()
+    payloads = {
+        f"homeassistant/binary_sensor/bla{idx}/config": json.dumps(
+            {"name": f"Beer {idx}", "state_topic": "test-topic"}
+        )
+        for idx in range(80)
+    }
+    for topic, payload in payloads.items():
+        async_fire_mqtt_message(hass, topic, payload)
+    await hass.async_block_till_done()
+    assert len(hass.states.async_all("binary_sensor")) == 80
+
+    # Emulate the broker replaying the retained configs after a reconnect
+    with patch(
+        "homeassistant.components.mqtt.discovery._decode_discovery_payloads",
+    ) as decode_mock, patch(
+        "homeassistant.components.mqtt.discovery.json_loads_object"
+    ) as json_loads_mock:
+        for topic, payload in payloads.items():
+            async_fire_mqtt_message(hass, topic, payload)
+        await hass.async_block_till_done()
+
+    assert not decode_mock.called
+    assert not json_loads_mock.called
+
+
+async def test_replayed_discovery_payload_after_queued_change(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test a replayed payload is not skipped while a changed one is queued."""
+    await mqtt_mock_entry()
+    payload_a = '{ "name": "Beer", "state_topic": "test-topic" }'
+    payload_b = '{ "name": "Milk", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload_a)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer").name == "Beer"
+
+    # Start a burst so the following messages are queued for decoding
+    for idx in range(60):
+        async_fire_mqtt_message(
+            hass,
+            f"homeassistant/binary_sensor/other{idx}/config",
+            json.dumps({"name": f"Other {idx}", "state_topic": "test-topic"}),
+        )
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload_b)
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", payload_a)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("binary_sensor.beer").name == "Beer"
+
+
 async def test_removal(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
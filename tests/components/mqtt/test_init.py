@@ -1103,6 +1103,80 @@ async def test_subscribe_topic_level_wildcard(
     assert calls[0].payload == "test-payload"
 
 
+async def test_subscribe_matching_subscriptions_cache(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test matching subscriptions are cached and invalidated on changes."""
+    await mqtt_mock_entry()
+    mqtt_client = hass.data["mqtt"].client
+    await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert mqtt_client.matching_subscriptions_cache_stats() == {
+        "size": 1,
+        "max_size": 8192,
+        "hits": 1,
+        "misses": 1,
+    }
+
+    unsub = await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    assert mqtt_client.matching_subscriptions_cache_stats()["size"] == 0
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    unsub()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 5
+    assert mqtt_client.matching_subscriptions_cache_stats() == {
+        "size": 1,
+        "max_size": 8192,
+        "hits": 1,
+        "misses": 3,
+    }
+
+
+async def test_receive_messages_in_chunks(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test received messages are dispatched in chunks yielding to the loop."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    await mqtt_mock_entry()
+    mqtt_client = hass.data["mqtt"].client
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    for idx in range(250):
+        msg = MQTTMessage(topic=f"test-topic/{idx}".encode())
+        msg.payload = b"test-payload"
+        mqtt_client._mqtt_on_message(None, None, msg)
+
+    assert mqtt_client.message_dispatch_stats()["queue_depth"] == 250
+    await asyncio.sleep(0)
+    assert len(calls) == 100
+    await asyncio.sleep(0)
+    assert len(calls) == 200
+    await hass.async_block_till_done()
+    assert [call.topic for call in calls] == [f"test-topic/{idx}" for idx in range(250)]
+    assert mqtt_client.message_dispatch_stats() == {
+        "queue_depth": 0,
+        "max_queue_depth": 250,
+        "last_drain_latency": ANY,
+        "max_drain_latency": ANY,
+    }
+
+
 async def test_subscribe_topic_level_wildcard_no_subtree_match(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -0,0 +1,101 @@
+"""The tests for the MQTT topic trie."""
+
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("#", "sport", True),
+        ("#", "sport/tennis/player1", True),
+        ("#", "/", True),
+        ("#", "$SYS/broker/uptime", False),
+        ("+", "sport", True),
+        ("+", "sport/tennis", False),
+        ("+", "$SYS", False),
+        ("+/+", "/finance", True),
+        ("/+", "/finance", True),
+        ("+", "/finance", False),
+        ("sport/#", "sport", True),
+        ("sport/#", "sport/", True),
+        ("sport/#", "sport/tennis/player1/ranking", True),
+        ("sport/#", "sports", False),
+        ("sport/tennis/+", "sport/tennis/player1", True),
+        ("sport/tennis/+", "sport/tennis/player1/ranking", False),
+        ("sport/tennis/+", "sport/tennis", False),
+        ("sport/+/player1", "sport/tennis/player1", True),
+        ("sport/+/player1", "sport/tennis/player2", False),
+        ("+/tennis/#", "sport/tennis/player1/ranking", True),
+        ("+/tennis/#", "sport/tennis", True),
+        ("$SYS/#", "$SYS/broker/uptime", True),
+        ("$SYS/+/uptime", "$SYS/broker/uptime", True),
+    ],
+)
+def test_match(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against wildcard topic filters."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(topic_filter, topic_filter)
+    assert (trie.match(topic) == [topic_filter]) is matches
+
+
+def test_match_multiple_filters() -> None:
+    """Test a topic is matched by all matching topic filters."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in (
+        "zigbee2mqtt/+",
+        "zigbee2mqtt/#",
+        "zigbee2mqtt/+/availability",
+        "zigbee2mqtt/bridge/#",
+        "tasmota/discovery/#",
+    ):
+        trie.add(topic_filter, topic_filter)
+    trie.add("zigbee2mqtt/+", "duplicate")
+
+    assert sorted(trie.match("zigbee2mqtt/lamp")) == [
+        "duplicate",
+        "zigbee2mqtt/#",
+        "zigbee2mqtt/+",
+    ]
+    assert sorted(trie.match("zigbee2mqtt/lamp/availability")) == [
+        "zigbee2mqtt/#",
+        "zigbee2mqtt/+/availability",
+    ]
+    assert sorted(trie.match("zigbee2mqtt/bridge/state")) == [
+        "zigbee2mqtt/#",
+        "zigbee2mqtt/bridge/#",
+    ]
+    assert trie.match("tasmota/tele/state") == []
+    assert len(trie) == 6
+
+
+def test_add_remove() -> None:
+    """Test adding and removing values prunes the trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/+/temperature", "first")
+    trie.add("home/+/temperature", "second")
+    trie.add("home/#", "third")
+
+    assert "home/+/temperature" in trie
+    assert "home/+" not in trie
+    assert sorted(trie.values()) == ["first", "second", "third"]
+
+    trie.remove("home/+/temperature", "first")
+    assert "home/+/temperature" in trie
+    assert sorted(trie.match("home/kitchen/temperature")) == ["second", "third"]
+
+    trie.remove("home/+/temperature", "second")
+    assert "home/+/temperature" not in trie
+    assert trie.match("home/kitchen/temperature") == ["third"]
+
+    trie.remove("home/#", "third")
+    assert len(trie) == 0
+    assert list(trie.values()) == []
+    assert trie._root.children == {}
+
+    with pytest.raises(KeyError):
+        trie.remove("home/#", "third")
+    trie.add("home/#", "third")
+    with pytest.raises(ValueError):
+        trie.remove("home/#", "fourth")
@@ -15,11 +15,13 @@ from homeassistant.components.profiler import (
     _SQLALCHEMY_LRU_OBJECT,
     CONF_ENABLED,
     CONF_SECONDS,
+    CONF_TOP,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
+    SERVICE_PROFILE_EVENT_BUS,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
@@ -29,7 +31,7 @@ from homeassistant.components.profiler import (
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
@@ -416,3 +418,49 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_profile_event_bus(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test profiling the event bus logs the slowest listeners."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_PROFILE_EVENT_BUS)
+
+    @callback
+    def _profiled_listener(event):
+        pass
+
+    hass.bus.async_listen("profiled_event", _profiled_listener, run_immediately=True)
+
+    async def _fire_during_profile(seconds):
+        assert hass.bus.profile is not None
+        hass.bus.async_fire("profiled_event")
+
+    with patch("homeassistant.components.profiler.asyncio.sleep", _fire_during_profile):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE_EVENT_BUS,
+            {CONF_SECONDS: 0.000001, CONF_TOP: 10.0},
+            blocking=True,
+        )
+
+    assert hass.bus.profile is None
+    assert "Event type profiled_event: fired 1 times to 1 listeners" in caplog.text
+    assert "_profiled_listener: 1 calls" in caplog.text
+
+    hass.bus.async_start_profile()
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PROFILE_EVENT_BUS, {CONF_SECONDS: 0.000001}, blocking=True
+        )
+    hass.bus.async_stop_profile()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -674,6 +674,59 @@ async def test_update(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_cached_metric_families(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    counter_entities: dict[str, er.RegistryEntry],
+    update_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test only changed metric families are rendered again."""
+    body = await generate_latest_metrics(client)
+    assert (
+        'counter_value{domain="counter",'
+        'entity="counter.counter",'
+        'friendly_name="None"} 2.0' in body
+    )
+
+    set_state_with_entry(hass, counter_entities["counter_1"], 3)
+    await hass.async_block_till_done()
+
+    with mock.patch(
+        "prometheus_client.generate_latest", wraps=prometheus_client.generate_latest
+    ) as mock_generate_latest:
+        body = await generate_latest_metrics(client)
+
+    rendered = {
+        metric.name
+        for registry in (call.args[0] for call in mock_generate_latest.mock_calls)
+        for metric in registry.collect()
+    }
+    assert "counter_value" in rendered
+    assert "update_state" not in rendered
+    assert (
+        'counter_value{domain="counter",'
+        'entity="counter.counter",'
+        'friendly_name="None"} 3.0' in body
+    )
+    assert (
+        'update_state{domain="update",'
+        'entity="update.firmware",'
+        'friendly_name="Firmware"} 1.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_gzip(client: ClientSessionGenerator) -> None:
+    """Test the metrics are gzip compressed when the client accepts it."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "# HELP python_info Python platform information" in await resp.text()
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_renaming_entity_name(
     hass: HomeAssistant,
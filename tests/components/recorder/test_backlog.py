@@ -0,0 +1,106 @@
+"""The tests for the recorder backlog queue."""
+
+import queue
+
+import pytest
+
+from homeassistant.components.recorder.backlog import RecorderQueue
+from homeassistant.components.recorder.tasks import CommitTask
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+
+
+def _state_changed(entity_id: str, state: str | None, fired: float) -> Event:
+    """Return a state_changed event fired at a timestamp."""
+    new_state = None if state is None else State(entity_id, state)
+    event = Event(EVENT_STATE_CHANGED, {"entity_id": entity_id, "new_state": new_state})
+    event.time_fired_timestamp = fired
+    return event
+
+
+def _drain(backlog: RecorderQueue) -> list:
+    """Return all queued items."""
+    items = []
+    while not backlog.empty():
+        items.append(backlog.get_nowait())
+    return items
+
+
+def test_fifo() -> None:
+    """Test tasks and events are returned in order."""
+    backlog = RecorderQueue({}, 100)
+    task = CommitTask()
+    first = _state_changed("sensor.one", "1", 1)
+    second = _state_changed("sensor.one", "2", 2)
+    backlog.put_event(first, "sensor.one")
+    backlog.put(task)
+    backlog.put_event(second, "sensor.one")
+
+    assert backlog.qsize() == 3
+    assert backlog.get() is first
+    assert _drain(backlog) == [task, second]
+    with pytest.raises(queue.Empty):
+        backlog.get_nowait()
+    assert backlog.stats()["max_backlog_seen"] == 3
+
+
+def test_coalesce_domain_within_window() -> None:
+    """Test state changes of a coalesced domain are coalesced within the window."""
+    backlog = RecorderQueue({"sensor": 5}, 100)
+    events = [
+        _state_changed("sensor.one", "1", 0),
+        _state_changed("light.one", "on", 1),
+        _state_changed("sensor.one", "2", 2),
+        _state_changed("light.one", "off", 3),
+        _state_changed("sensor.one", "3", 4),
+        _state_changed("sensor.one", "4", 6),
+    ]
+    for event in events:
+        backlog.put_event(event, event.data["entity_id"])
+
+    # The sensor keeps its position in the queue with its last state in the
+    # window and starts a new window afterwards
+    assert _drain(backlog) == [events[4], events[1], events[3], events[5]]
+    assert backlog.stats()["coalesced"] == 2
+
+
+def test_removed_entities_are_not_coalesced() -> None:
+    """Test the removal of an entity is never replaced or replaces a state."""
+    backlog = RecorderQueue({"sensor": 5}, 100)
+    events = [
+        _state_changed("sensor.one", "1", 0),
+        _state_changed("sensor.one", None, 1),
+        _state_changed("sensor.one", "2", 2),
+    ]
+    for event in events:
+        backlog.put_event(event, "sensor.one")
+
+    assert _drain(backlog) == events
+
+
+def test_backpressure_and_shedding() -> None:
+    """Test all state changes are coalesced and events shed under backpressure."""
+    backlog = RecorderQueue({}, 2)
+    task = CommitTask()
+    other_event = Event("other")
+    backlog.put_event(other_event, None)
+    backlog.put_event(_state_changed("light.one", "on", 0), "light.one")
+    assert backlog.stats()["backpressure"] is True
+
+    last = _state_changed("light.one", "off", 3600)
+    backlog.put_event(_state_changed("light.one", "dim", 1), "light.one")
+    backlog.put_event(last, "light.one")
+    backlog.put_event(Event("other"), None)
+    backlog.shed_events = True
+    backlog.put_event(Event("other"), None)
+    backlog.put(task)
+
+    stats = backlog.stats()
+    assert stats["coalesced"] == 1
+    assert stats["dropped"] == 1
+    assert stats["shedding"] is True
+    items = _drain(backlog)
+    assert items[0] is other_event
+    assert items[-1] is task
+    assert items[2] is last
+    assert len(items) == 5
@@ -0,0 +1,48 @@
+"""The tests for the recorder database executors."""
+
+import threading
+
+import pytest
+
+from homeassistant.components.recorder.executor import DBQueryExecutor
+
+
+def test_query_executor_stats() -> None:
+    """Test the query executor tracks queued, running and cancelled queries."""
+    executor = DBQueryExecutor(
+        thread_name_prefix="DbQueryWorker", max_workers=1, shutdown_hook=lambda: None
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def _blocking_query() -> str:
+        started.set()
+        release.wait(5)
+        return threading.current_thread().name
+
+    running = executor.submit(_blocking_query)
+    assert started.wait(5)
+    queued = executor.submit(lambda: "never")
+    stats = executor.stats()
+    assert stats["workers"] == 1
+    assert stats["queued"] == 1
+    assert stats["running"] == 1
+
+    # A cancelled query is never executed
+    assert queued.cancel()
+    release.set()
+    assert running.result(5).startswith("DbQueryWorker")
+    executor.record_timeout()
+    executor.shutdown()
+
+    stats = executor.stats()
+    assert stats == {
+        "workers": 1,
+        "queued": 0,
+        "running": 0,
+        "completed": 1,
+        "cancelled": 1,
+        "timed_out": 1,
+        "average_wait": pytest.approx(stats["max_wait"]),
+        "max_wait": stats["max_wait"],
+    }
@@ -33,6 +33,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_QUERY_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -49,6 +50,7 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
     StatisticsRuns,
 )
+from homeassistant.components.recorder.executor import DBQueryExecutor
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
@@ -121,6 +123,9 @@ def _default_recorder(hass):
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        coalesce_windows={},
+        query_workers=0,
+        query_timeout=timedelta(minutes=5),
     )
 
 
@@ -380,11 +385,8 @@ def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass)._pending_states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -1393,6 +1395,112 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_saving_links_old_states_within_one_commit(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states recorded between commits are inserted linked to their old state."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    assert instance._bulk_insert_states is True
+
+    with patch(
+        "homeassistant.components.recorder.core.insert_pending_states",
+        wraps=recorder.core.insert_pending_states,
+    ) as insert_pending_states:
+        hass.states.async_set("test.one", "s1", {"attr": 1})
+        hass.states.async_set("test.two", "s2", {})
+        hass.states.async_set("test.one", "s3", {"attr": 2})
+        hass.states.async_set("test.one", "s4", {"attr": 1})
+        hass.states.async_remove("test.two")
+        hass.states.async_set("test.two", "s5", {})
+        hass.bus.async_fire("test_event", {"data": 1})
+        await hass.async_add_executor_job(instance.block_till_done)
+        await async_wait_recording_done(hass)
+
+    assert insert_pending_states.call_count == 1
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s5"].old_state_id is None
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s4"].attributes_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id != states_by_state["s3"].attributes_id
+        )
+        assert session.query(Events).count() >= 1
+
+    # The last state of each entity is linked to after the commit
+    hass.states.async_set("test.one", "s6", {})
+    hass.states.async_set("test.two", "s7", {})
+    await hass.async_add_executor_job(instance.block_till_done)
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(session.query(States.state_id, States.old_state_id, States.state))
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s6"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state["s7"].old_state_id == states_by_state["s5"].state_id
+
+
+async def test_coalesce_config(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test state changes of the configured domains are coalesced."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COALESCE: {"sensor": {"seconds": 10}}}
+    )
+    assert instance._queue.coalesce_windows == {"sensor": 10.0}
+    assert instance.backlog_stats["coalesced"] == 0
+
+
+async def test_query_pool(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test read only queries run on the query pool with a timeout."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_DB_QUERY_WORKERS: 2}
+    )
+    # SQLite databases don't use a query pool
+    assert instance.query_pool_stats is None
+    assert await instance.async_add_query_job(threading.current_thread) is not None
+
+    instance._query_executor = DBQueryExecutor(
+        thread_name_prefix=DB_QUERY_WORKER_PREFIX,
+        max_workers=instance.query_workers,
+        shutdown_hook=lambda: None,
+    )
+    thread = await instance.async_add_query_job(threading.current_thread)
+    assert thread.name.startswith(DB_QUERY_WORKER_PREFIX)
+
+    release = threading.Event()
+    instance.query_timeout = 0.01
+    with pytest.raises(TimeoutError):
+        await instance.async_add_query_job(release.wait, 5)
+    release.set()
+    await hass.async_add_executor_job(instance._query_executor.shutdown)
+    stats = instance.query_pool_stats
+    assert stats["workers"] == 2
+    assert stats["completed"] == 2
+    assert stats["timed_out"] == 1
+    instance._query_executor = None
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -23,7 +23,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import _adapt_batch_size, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -189,6 +189,57 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+async def test_purge_progress(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the progress of a purge is tracked across its cycles."""
+    instance = await async_setup_recorder_instance(hass)
+    assert instance.purge_stats is None
+
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    finished = purge_old_data(
+        instance,
+        purge_before,
+        states_batch_size=1,
+        events_batch_size=1,
+        repack=False,
+    )
+    assert not finished
+    stats = instance.purge_stats
+    assert stats["running"] is True
+    assert stats["rows_purged"] == 4
+    assert stats["progress"] == 0
+
+    finished = purge_old_data(instance, purge_before, repack=False)
+    assert finished
+    stats = instance.purge_stats
+    assert stats["running"] is False
+    assert stats["rows_purged"] == 4
+    assert stats["progress"] == 100
+    assert stats["eta_seconds"] == 0
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "batches", "elapsed", "expected"),
+    [
+        (20, 0, 0.1, 20),  # Nothing to purge
+        (20, 5, 0.1, 20),  # Ran out of rows to purge
+        (20, 20, 0.5, 40),  # Fast deletes, grow at most twice
+        (20, 20, 1.6, 25),  # Grow to fit the target
+        (20, 20, 8, 5),  # Slow deletes
+        (20, 5, 8, 1),  # Slow deletes while running out of rows
+        (80, 80, 0.1, 100),  # Capped to the maximum
+    ],
+)
+def test_purge_adapt_batch_size(
+    batch_size: int, batches: int, elapsed: float, expected: int
+) -> None:
+    """Test the number of batches per purge cycle adapts to the latency."""
+    assert _adapt_batch_size(batch_size, batches, elapsed, 100) == expected
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
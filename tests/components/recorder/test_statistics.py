@@ -2,6 +2,7 @@
 
 from collections.abc import Callable
 from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -9,7 +10,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDay,
+    StatisticsMonth,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -31,6 +36,7 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import CompileMissingStatisticsTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant, callback
@@ -364,6 +370,115 @@ def test_compile_periodic_statistics_exception(
     }
 
 
+def test_compile_hourly_statistics_incrementally(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test hourly statistics are summarized as the 5-minute periods are compiled."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    setup_component(hass, "sensor", {})
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    zero -= timedelta(hours=3)
+
+    def sensor_stats(entity_id, start, value):
+        """Generate fake statistics."""
+        return {
+            "meta": {
+                "has_mean": entity_id == "sensor.mean",
+                "has_sum": entity_id == "sensor.sum",
+                "name": None,
+                "source": "recorder",
+                "statistic_id": entity_id,
+                "unit_of_measurement": "dogs",
+            },
+            "stat": {
+                "start": start,
+                "mean": value,
+                "min": value - 1,
+                "max": value + 1,
+            }
+            if entity_id == "sensor.mean"
+            else {"start": start, "state": value, "sum": value * 2},
+        }
+
+    def get_fake_stats(_hass, session, start, _end):
+        value = (start - zero).total_seconds() / 300 % 12
+        platform_stats = [sensor_stats("sensor.mean", start, value)]
+        # The sum is not updated after it's adjusted during the second hour
+        if start <= zero + timedelta(hours=1, minutes=30):
+            platform_stats.append(sensor_stats("sensor.sum", start, value))
+        return statistics.PlatformCompiledStatistics(
+            platform_stats,
+            get_metadata(_hass, statistic_ids={"sensor.mean", "sensor.sum"}),
+        )
+
+    with (
+        patch(
+            "homeassistant.components.sensor.recorder.compile_statistics",
+            side_effect=get_fake_stats,
+        ),
+        patch(
+            "homeassistant.components.recorder.statistics._query_hourly_statistics_summary",
+            wraps=statistics._query_hourly_statistics_summary,
+        ) as query_summary_mock,
+    ):
+        # All 5-minute periods of the hour are summarized as they are compiled
+        for minute in range(0, 60, 5):
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=minute))
+        wait_recording_done(hass)
+        assert query_summary_mock.call_count == 0
+
+        # Adjusting the short term statistics during the next hour
+        # makes the hourly statistics summarized by the database
+        for minute in range(0, 60, 5):
+            do_adhoc_statistics(hass, start=zero + timedelta(hours=1, minutes=minute))
+            if minute == 30:
+                instance.async_adjust_statistics(
+                    "sensor.sum", zero + timedelta(hours=1, minutes=30), 100, "dogs"
+                )
+        wait_recording_done(hass)
+        assert query_summary_mock.call_count == 1
+
+    stats = statistics_during_period(
+        hass, zero, period="hour", statistic_ids={"sensor.mean", "sensor.sum"}
+    )
+    assert [(row["mean"], row["min"], row["max"]) for row in stats["sensor.mean"]] == [
+        (pytest.approx(5.5), -1, 12)
+    ] * 2
+    assert [row["sum"] for row in stats["sensor.sum"]] == [22, 112]
+
+    # The hours are folded into their day as they are compiled
+    with session_scope(hass=hass, read_only=True) as session:
+        days = session.query(StatisticsDay).order_by(StatisticsDay.metadata_id)
+        assert [
+            (day.mean, day.mean_count, day.min, day.max, day.sum) for day in days
+        ] in (
+            [(pytest.approx(5.5), 2, -1, 12, None), (None, 0, None, None, 112)],
+            # The hours span two days
+            [
+                (pytest.approx(5.5), 1, -1, 12, None),
+                (pytest.approx(5.5), 1, -1, 12, None),
+                (None, 0, None, None, 22),
+                (None, 0, None, None, 112),
+            ],
+        )
+
+    # The database summarizes the first hour the same way
+    with session_scope(hass=hass, read_only=True) as session:
+        summary = statistics._query_hourly_statistics_summary(session, zero)
+    accumulated = statistics.HourlyStatisticsAccumulator()
+    with session_scope(hass=hass, read_only=True) as session:
+        for minute in range(0, 60, 5):
+            start_ts = (zero + timedelta(minutes=minute)).timestamp()
+            accumulated.add_period(
+                zero + timedelta(minutes=minute),
+                session.query(StatisticsShortTerm)
+                .filter(StatisticsShortTerm.start_ts == start_ts)
+                .all(),
+            )
+    assert accumulated.get_summary(zero) == summary
+
+
 def test_rename_entity(hass_recorder: Callable[..., HomeAssistant]) -> None:
     """Test statistics is migrated when entity_id is changed."""
     hass = hass_recorder()
@@ -1854,6 +1969,91 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.freeze_time("2022-12-01 00:00:00+00:00")
+def test_statistics_rollups(hass_recorder: Callable[..., HomeAssistant]) -> None:
+    """Test days, weeks and months are read from their rollups."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Vienna"))
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-01 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour % 7,
+            "min": hour % 7 - 1,
+            "max": hour % 7 + 1,
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(0, 24 * 45, 5)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    def assert_rollups_match_hourly(period: str) -> None:
+        """Assert the rollups match the reduced hourly statistics."""
+        stats = statistics_during_period(hass, start, period=period)
+        with patch.object(
+            statistics, "_statistics_rollups_during_period", return_value=None
+        ):
+            reduced = statistics_during_period(hass, start, period=period)
+        rows = stats["test:total_energy_import"]
+        reduced_rows = reduced["test:total_energy_import"]
+        assert len(rows) == len(reduced_rows) > 1
+        for row, reduced_row in zip(rows, reduced_rows):
+            assert row == pytest.approx(reduced_row)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDay).count() == 45
+        assert session.query(StatisticsMonth).count() == 2
+    for period in ("day", "week", "month"):
+        assert_rollups_match_hourly(period)
+
+    # Adjusting the statistics updates the rollups
+    instance.async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(days=10), 100, "kWh"
+    )
+    wait_recording_done(hass)
+    assert_rollups_match_hourly("month")
+
+    def get_daily_rollups() -> dict[str, list[dict[str, Any]]] | None:
+        """Return the daily rollups if they are in the current time zone."""
+        with session_scope(hass=hass, read_only=True) as session:
+            return statistics._statistics_rollups_during_period(
+                hass,
+                session,
+                start,
+                None,
+                None,
+                None,
+                instance.statistics_meta_manager.get_many(session),
+                "day",
+                None,
+                {"mean", "sum"},
+            )
+
+    # Rollups summarized in another time zone are not used until rebuilt
+    assert get_daily_rollups() is not None
+    dt_util.set_default_time_zone(dt_util.get_time_zone("America/Regina"))
+    assert get_daily_rollups() is None
+    instance.queue_task(CompileMissingStatisticsTask())
+    wait_recording_done(hass)
+    assert get_daily_rollups() is not None
+    for period in ("day", "week", "month"):
+        assert_rollups_match_hourly(period)
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
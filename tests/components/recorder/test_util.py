@@ -195,6 +195,47 @@ def test_setup_connection_for_dialect_mysql(mysql_version) -> None:
     assert execute_args[2] == "SET time_zone = '+00:00'"
 
 
+@pytest.mark.parametrize(
+    ("dialect", "version", "expected"),
+    [
+        ("postgresql", None, ["SET statement_timeout = 1500"]),
+        (
+            "mysql",
+            "10.6.12-MariaDB",
+            ["SELECT VERSION()", "SET SESSION max_statement_time = 1.5"],
+        ),
+        (
+            "mysql",
+            "8.0.32",
+            ["SELECT VERSION()", "SET SESSION max_execution_time = 1500"],
+        ),
+        ("sqlite", None, []),
+    ],
+)
+def test_setup_query_timeout_for_dialect(
+    dialect: str, version: str | None, expected: list[str]
+) -> None:
+    """Test the database is asked to cancel queries of the query pool."""
+    execute_args = []
+
+    def execute_mock(statement):
+        execute_args.append(statement)
+
+    def fetchall_mock():
+        if execute_args[-1] == "SELECT VERSION()":
+            return [[version]]
+        return None
+
+    def _make_cursor_mock(*_):
+        return MagicMock(execute=execute_mock, fetchall=fetchall_mock)
+
+    dbapi_connection = MagicMock(cursor=_make_cursor_mock)
+
+    util.setup_query_timeout_for_dialect(dialect, dbapi_connection, 1.5)
+
+    assert execute_args == expected
+
+
 @pytest.mark.parametrize(
     "sqlite_version",
     ["3.31.0"],
@@ -944,6 +985,15 @@ def test_execute_stmt_lambda_element(
         assert rows[0].state == new_state.state
         assert rows[0].metadata_id == metadata_id
 
+        # stream=True always gives a streaming result, even without a time window
+        rows = util.execute_stmt_lambda_element(
+            session, stmt, orm_rows=False, stream=True
+        )
+        assert not isinstance(rows, list)
+        row = next(rows)
+        assert row.state == new_state.state
+        assert row.metadata_id == metadata_id
+
         with patch.object(session, "execute", MockExecutor):
             rows = util.execute_stmt_lambda_element(session, stmt, now, tomorrow)
             assert rows == ["mock_row"]
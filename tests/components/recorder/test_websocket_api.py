@@ -2088,6 +2088,17 @@ async def test_recorder_info(
     assert response["result"] == {
         "backlog": 0,
         "max_backlog": 65000,
+        "backlog_stats": {
+            "backlog": 0,
+            "backpressure": False,
+            "coalesced": 0,
+            "dropped": 0,
+            "high_water": 32500,
+            "max_backlog_seen": ANY,
+            "shedding": False,
+        },
+        "query_pool_stats": None,
+        "purge_stats": None,
         "migration_in_progress": False,
         "migration_is_live": False,
         "recording": True,
@@ -2193,13 +2204,24 @@ async def test_recorder_info_migration_queue_exhausted(
 
         client = await hass_ws_client()
 
-        # Check the status
+        # Check the status, events are shed but states are still recorded
         await client.send_json_auto_id({"type": "recorder/info"})
         response = await client.receive_json()
         assert response["success"]
         assert response["result"]["migration_in_progress"] is True
-        assert response["result"]["recording"] is False
+        assert response["result"]["recording"] is True
         assert response["result"]["thread_running"] is True
+        assert response["result"]["backlog_stats"]["shedding"] is True
+
+        # Detect the queue still growing
+        hass.states.async_set("my.other_entity", "on", {})
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=4))
+        await hass.async_block_till_done()
+
+        await client.send_json_auto_id({"type": "recorder/info"})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"]["recording"] is False
 
     # Let migration finish
     migration_done.set()
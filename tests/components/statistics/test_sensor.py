@@ -19,7 +19,10 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.components.statistics import DOMAIN as STATISTICS_DOMAIN
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    STATS_NUMERIC_ONLINE,
+    StatisticsSensor,
+)
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
@@ -30,7 +33,7 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -409,6 +412,44 @@ async def test_sampling_size_reduced(hass: HomeAssistant) -> None:
     assert state.attributes.get("buffer_usage_ratio") == round(5 / 5, 2)
 
 
+@pytest.mark.parametrize("characteristic", sorted(STATS_NUMERIC_ONLINE))
+async def test_online_statistics(characteristic: str) -> None:
+    """Test online statistics match the statistics module."""
+    now = dt_util.utcnow()
+    sensors = [
+        StatisticsSensor(
+            "sensor.test_monitored",
+            "test",
+            None,
+            characteristic,
+            5,
+            timedelta(seconds=4),
+            False,
+            2,
+            30,
+        )
+        for _ in range(2)
+    ]
+    sensor, reference = sensors
+    assert sensor.online_statistics is not None
+    reference.online_statistics = None
+
+    values = [*VALUES_NUMERIC, *VALUES_NUMERIC, 5, 5, 17, 3.8]
+    for idx, value in enumerate(values):
+        source_state = State(
+            "sensor.test_monitored",
+            str(value),
+            last_updated=now + timedelta(seconds=idx * (1 + idx % 3)),
+        )
+        with freeze_time(source_state.last_updated + timedelta(seconds=1)):
+            for entity in sensors:
+                entity._add_state_to_queue(source_state)
+                entity._purge_old_states(timedelta(seconds=4))
+                entity._update_value()
+        assert list(sensor.states) == list(reference.states)
+        assert sensor.native_value == reference.native_value
+
+
 async def test_sampling_size_1(hass: HomeAssistant) -> None:
     """Test validity of stats requiring only one sample."""
     assert await async_setup_component(
@@ -17,7 +17,10 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.components.websocket_api.entity_subscriptions import (
+    async_get_entity_subscription_hub,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1259,6 +1262,171 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_fan_out(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test subscribe_entities subscriptions share one state changed listener."""
+    hub = async_get_entity_subscription_hub(hass)
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    other_client = await hass_ws_client(hass)
+
+    for client, msg in (
+        (websocket_client, {"id": 7, "type": "subscribe_entities"}),
+        (other_client, {"id": 7, "type": "subscribe_entities"}),
+        (
+            other_client,
+            {"id": 8, "type": "subscribe_entities", "entity_ids": ["light.other"]},
+        ),
+    ):
+        await client.send_json(msg)
+        result = await client.receive_json()
+        assert result["success"]
+        assert (await client.receive_json())["event"] == {"a": {}}
+
+    assert hub.subscription_count == 3
+    assert hub.group_count == 2
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.other", "on")
+    for client in (websocket_client, other_client):
+        msg = await client.receive_json()
+        assert msg["id"] == 7
+        assert list(msg["event"]["a"]) == ["light.kitchen"]
+    msg = await other_client.receive_json()
+    assert msg["id"] == 7
+    assert list(msg["event"]["a"]) == ["light.other"]
+    msg = await other_client.receive_json()
+    assert msg["id"] == 8
+    assert list(msg["event"]["a"]) == ["light.other"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert list(msg["event"]["a"]) == ["light.other"]
+
+    await other_client.close()
+    await websocket_client.close()
+    await hass.async_block_till_done()
+
+    assert hub.subscription_count == 0
+    assert hub.group_count == 0
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
+async def test_get_states_stream(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states streams the states in chunks."""
+    for idx in range(5):
+        hass.states.async_set(f"light.test_{idx}", "on")
+
+    with patch("homeassistant.components.websocket_api.const.STATES_CHUNK_SIZE", 2):
+        await websocket_client.send_json(
+            {"id": 5, "type": "get_states", "stream": True}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 5
+        assert msg["type"] == const.TYPE_RESULT
+        assert msg["success"]
+
+        entity_ids = []
+        for chunk_size, complete in ((2, False), (2, False), (1, True)):
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == 5
+            assert msg["type"] == "event"
+            assert len(msg["event"]["states"]) == chunk_size
+            assert msg["event"].get("complete", False) is complete
+            entity_ids.extend(state["entity_id"] for state in msg["event"]["states"])
+
+    assert entity_ids == [f"light.test_{idx}" for idx in range(5)]
+
+
+async def test_get_states_stream_coalesce(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states chunks are not coalesced into a single frame."""
+    for idx in range(5):
+        hass.states.async_set(f"light.test_{idx}", "on")
+
+    await websocket_client.send_json(
+        {
+            "id": 4,
+            "type": "supported_features",
+            "features": {FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    with patch("homeassistant.components.websocket_api.const.STATES_CHUNK_SIZE", 2):
+        await websocket_client.send_json(
+            {"id": 5, "type": "get_states", "stream": True}
+        )
+        msg = json_loads(await websocket_client.receive_str())
+        if isinstance(msg, list):
+            assert len(msg) == 1
+            msg = msg[0]
+        assert msg["id"] == 5
+        assert msg["type"] == const.TYPE_RESULT
+
+        for chunk_size, complete in ((2, False), (2, False), (1, True)):
+            msg = json_loads(await websocket_client.receive_str())
+            assert isinstance(msg, dict)
+            assert msg["id"] == 5
+            assert len(msg["event"]["states"]) == chunk_size
+            assert msg["event"].get("complete", False) is complete
+
+
+async def test_subscribe_entities_stream(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test subscribe_entities streams the initial states in chunks."""
+    for idx in range(3):
+        hass.states.async_set(f"light.test_{idx}", "on")
+    hass.states.async_set("light.bad", "on", {"bad": object()})
+
+    with patch("homeassistant.components.websocket_api.const.STATES_CHUNK_SIZE", 2):
+        await websocket_client.send_json(
+            {"id": 7, "type": "subscribe_entities", "stream": True}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        hass.states.async_set("light.test_2", "off")
+
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"a": {"light.test_0": ANY, "light.test_1": ANY}}
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {
+            "a": {"light.test_2": {"s": "on", "a": {}, "c": ANY, "lc": ANY}},
+            "complete": True,
+        }
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["c"]["light.test_2"]["+"]["s"] == "off"
+
+    assert "Unable to serialize to JSON. Bad data found" in caplog.text
+
+
+async def test_subscribe_entities_stream_no_states(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities stream completes without matching states."""
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.missing"],
+            "stream": True,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}, "complete": True}
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2507,6 +2675,45 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_event_bus_profile(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test starting, reading and stopping an event bus profile."""
+    await websocket_client.send_json({"id": 5, "type": "event_bus/profile"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] is None
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "event_bus/profile", "enabled": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] is None
+    assert hass.bus.profile is not None
+
+    hass.bus.async_fire("profiled_event")
+    await websocket_client.send_json(
+        {"id": 7, "type": "event_bus/profile", "enabled": False}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["event_types"]["profiled_event"] == {
+        "fired": 1,
+        "listeners": 0,
+        "callback_time": 0.0,
+    }
+    assert hass.bus.profile is None
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 8, "type": "event_bus/profile"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
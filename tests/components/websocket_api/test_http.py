@@ -3,7 +3,8 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import ANY, patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -17,6 +18,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -432,6 +434,104 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_conflate_entity_updates(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test queued entity updates are conflated instead of overflowing."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_CONFLATE_ENTITY_UPDATES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    await websocket_client.send_json({"id": 2, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.kitchen"]
+
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 5):
+        for value in range(100):
+            hass.states.async_set("sensor.power", str(value))
+        hass.states.async_remove("light.kitchen")
+        hass.states.async_set("light.kitchen", "off", {"effect": "none"})
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 2
+        assert msg["event"]["a"]["sensor.power"]["s"] == "99"
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 2
+        assert msg["event"] == {
+            "c": {
+                "light.kitchen": {
+                    "+": {
+                        "a": {"effect": "none"},
+                        "c": ANY,
+                        "lc": ANY,
+                        "s": "off",
+                    },
+                    "-": {"a": ["brightness"]},
+                }
+            }
+        }
+
+        hass.states.async_set("sensor.power", "100")
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {
+            "c": {"sensor.power": {"+": {"c": ANY, "lc": ANY, "s": "100"}}}
+        }
+
+    assert hass.data[const.DATA_CONFLATED_MESSAGES] == 100
+
+
+async def test_compress_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test large messages are compressed when the client supports it."""
+    for idx in range(100):
+        hass.states.async_set(f"sensor.test_{idx}", str(idx))
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json({"id": 1, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert len(json_loads(msg.data)["result"]) == 100
+    text_size = len(msg.data)
+
+    await websocket_client.send_json(
+        {
+            "id": 2,
+            "type": "supported_features",
+            "features": {const.FEATURE_COMPRESS_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert json_loads(msg.data)["success"] is True
+
+    await websocket_client.send_json({"id": 3, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert len(msg.data) < text_size / 4
+    result = json_loads(zlib.decompress(msg.data))
+    assert result["id"] == 3
+    assert len(result["result"]) == 100
+
+    with patch(
+        "homeassistant.components.websocket_api.http.COMPRESS_MAX_SYNC_SIZE", 1024
+    ):
+        await websocket_client.send_json({"id": 4, "type": "get_states"})
+        msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert json_loads(zlib.decompress(msg.data))["id"] == 4
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
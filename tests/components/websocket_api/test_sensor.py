@@ -5,8 +5,10 @@ from homeassistant.auth.providers.legacy_api_password import (
 )
 from homeassistant.bootstrap import async_setup_component
 from homeassistant.components.websocket_api.auth import TYPE_AUTH_REQUIRED
+from homeassistant.components.websocket_api.const import DATA_CONFLATED_MESSAGES
 from homeassistant.components.websocket_api.http import URL
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_component import async_update_entity
 
 from .test_auth import test_auth_active_with_token
 
@@ -47,3 +49,21 @@ async def test_websocket_api(
 
     state = hass.states.get("sensor.connected_clients")
     assert state.state == "0"
+
+
+async def test_conflated_messages(hass: HomeAssistant) -> None:
+    """Test the conflated messages count."""
+    await async_setup_component(
+        hass, "sensor", {"sensor": {"platform": "websocket_api"}}
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.conflated_messages")
+    assert state.state == "0"
+    assert state.attributes["state_class"] == "total_increasing"
+
+    hass.data[DATA_CONFLATED_MESSAGES] = 100
+    await async_update_entity(hass, "sensor.conflated_messages")
+
+    state = hass.states.get("sensor.conflated_messages")
+    assert state.state == "100"
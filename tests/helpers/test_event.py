@@ -20,6 +20,7 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_UTC_TIME_CHANGE_GROUPS,
     EventStateChangedData,
     TrackStates,
     TrackTemplate,
@@ -3903,6 +3904,69 @@ async def test_periodic_task_minute(
     assert len(specific_runs) == 2
 
 
+async def test_periodic_task_shared_timer(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test periodic tasks with the same pattern share a timer."""
+    runs: dict[str, list[datetime]] = {"first": [], "second": [], "other": []}
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+    timers_before = len(hass.loop._scheduled)
+
+    unsubs = {
+        name: async_track_utc_time_change(
+            hass,
+            callback(lambda x, name=name: runs[name].append(x)),
+            minute=minute,
+            second=0,
+        )
+        for name, minute in (("first", "/5"), ("second", "/5"), ("other", "/10"))
+    }
+    assert len(hass.data[TRACK_UTC_TIME_CHANGE_GROUPS]) == 2
+    assert len(hass.loop._scheduled) == timers_before + 2
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert {name: len(fired) for name, fired in runs.items()} == {
+        "first": 1,
+        "second": 1,
+        "other": 1,
+    }
+
+    unsubs["first"]()
+    unsubs["first"]()
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert {name: len(fired) for name, fired in runs.items()} == {
+        "first": 1,
+        "second": 2,
+        "other": 1,
+    }
+
+    unsubs["second"]()
+    unsubs["other"]()
+    assert hass.data[TRACK_UTC_TIME_CHANGE_GROUPS] == {}
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert {name: len(fired) for name, fired in runs.items()} == {
+        "first": 1,
+        "second": 2,
+        "other": 1,
+    }
+
+
 async def test_periodic_task_hour(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -18,6 +19,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    STORAGE_KEY_JOURNAL,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -353,6 +355,123 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states_to_journal(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that only changed states are journaled and restored on load."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for idx in range(5):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        await platform.async_add_entities([entity])
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+
+    # The first dump of a run writes all states
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 5
+    assert hass_storage[STORAGE_KEY_JOURNAL]["data"] == []
+
+    # Only the changed state is written to the journal
+    hass.states.async_set("input_boolean.b0", "off")
+    await data.async_dump_states()
+    storage_data = hass_storage[STORAGE_KEY]["data"]
+    assert storage_data[0]["state"]["entity_id"] == "input_boolean.b0"
+    assert storage_data[0]["state"]["state"] == "on"
+    journal_data = hass_storage[STORAGE_KEY_JOURNAL]["data"]
+    assert len(journal_data) == 1
+    assert journal_data[0]["state"]["entity_id"] == "input_boolean.b0"
+    assert journal_data[0]["state"]["state"] == "off"
+
+    # Nothing changed, the journal is rewritten as is
+    await data.async_dump_states()
+    assert hass_storage[STORAGE_KEY_JOURNAL]["data"] == journal_data
+
+    # Emulate a fresh load, the journal is applied on top of the states
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+    assert len(data.last_states) == 5
+    assert data.last_states["input_boolean.b0"].state.state == "off"
+    assert data.last_states["input_boolean.b1"].state.state == "on"
+
+
+async def test_dump_compacts_journal(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test that all states are rewritten once the journal grows too large."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for idx in range(5):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        await platform.async_add_entities([entity])
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+
+    hass.states.async_set("input_boolean.b0", "off")
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY_JOURNAL]["data"]) == 1
+
+    # Two of five states changed, more than STATE_COMPACT_RATIO
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_states()
+    assert hass_storage[STORAGE_KEY_JOURNAL]["data"] == []
+    storage_data = hass_storage[STORAGE_KEY]["data"]
+    assert [item["state"]["state"] for item in storage_data] == [
+        "off",
+        "off",
+        "on",
+        "on",
+        "on",
+    ]
+
+    # All states are rewritten once STATE_COMPACT_INTERVAL has passed
+    freezer.tick(timedelta(days=1))
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    assert len(mock_write_data.mock_calls[0][1][0]) == 5
+
+
+async def test_dump_journal_clear_error(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failure to clear the journal does not undo a full dump."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for idx in range(5):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        await platform.async_add_entities([entity])
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    with patch.object(data.journal, "async_save", side_effect=HomeAssistantError):
+        await data.async_dump_states()
+
+    assert "Error clearing last states journal" in caplog.text
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 5
+
+    # The full dump is kept, only the changed state is journaled
+    hass.states.async_set("input_boolean.b0", "off")
+    with patch.object(data.store, "async_save") as mock_write_data:
+        await data.async_dump_states()
+
+    assert not mock_write_data.called
+    journal_data = hass_storage[STORAGE_KEY_JOURNAL]["data"]
+    assert len(journal_data) == 1
+    assert journal_data[0]["state"]["entity_id"] == "input_boolean.b0"
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
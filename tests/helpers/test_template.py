@@ -3192,6 +3192,40 @@ async def test_expand(hass: HomeAssistant) -> None:
     )
 
 
+async def test_domain_entities(hass: HomeAssistant) -> None:
+    """Test domain_entities function."""
+    hass.states.async_set("sensor.power", "150.5")
+    hass.states.async_set("sensor.energy", "12")
+    hass.states.async_set("sensor.broken", "unavailable")
+    hass.states.async_set("light.bowl", "on")
+
+    info = render_to_info(hass, "{{ domain_entities('sensor') | sort }}")
+    assert_result_info(
+        info, ["sensor.broken", "sensor.energy", "sensor.power"], [], ["sensor"]
+    )
+
+    info = render_to_info(hass, "{{ domain_entities('sensor', above=100) }}")
+    assert_result_info(info, ["sensor.power"], [], ["sensor"])
+
+    info = render_to_info(hass, "{{ 'sensor' | domain_entities(below='100') }}")
+    assert_result_info(info, ["sensor.energy"], [], ["sensor"])
+
+    info = render_to_info(
+        hass,
+        "{{ domain_entities(['sensor', 'light'], state=['on', 'unavailable']) | sort }}",
+    )
+    assert_result_info(info, ["light.bowl", "sensor.broken"], [], ["sensor", "light"])
+
+    hass.states.async_set("sensor.energy", "120")
+    info = render_to_info(hass, "{{ domain_entities('sensor', above=100) | sort }}")
+    assert_result_info(info, ["sensor.energy", "sensor.power"], [], ["sensor"])
+
+    with pytest.raises(TemplateError):
+        template.Template(
+            "{{ domain_entities('invalid-domain') }}", hass
+        ).async_render()
+
+
 async def test_device_entities(
     hass: HomeAssistant,
     device_registry: dr.DeviceRegistry,
@@ -4653,26 +4687,138 @@ def test_iif(hass: HomeAssistant) -> None:
 
 
 async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+    """Test caching a parsed template."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
-    tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    env = template._NO_HASS_ENV
+    source = env.parse(template_string)
+    code = env.compile(source)
+    assert env.template_cache.get(source) is code
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    del code
+    assert not env.template_cache.get(source)
+
+
+async def test_compiled_template_cache_shared(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test compiled template code is shared between identical sources."""
+    cache = template._BoundedCache(2)
+    monkeypatch.setattr(template, "COMPILED_TEMPLATE_CACHE", cache)
+
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    tpl.ensure_valid()
+    tpl2 = template.Template("{{ 1 + 1 }}", hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert tpl._compiled_code is tpl2._compiled_code
+    assert cache.get((template.ENV_TYPE_NORMAL, "{{ 1 + 1 }}")) is tpl._compiled_code
+
+    # Other environment types compile their own code
+    strict_env = template.TemplateEnvironment(hass, strict=True)
+    assert strict_env.env_type == template.ENV_TYPE_STRICT
+    assert strict_env.compile("{{ 1 + 1 }}") is not tpl._compiled_code
+
+    template.Template("{{ 2 + 2 }}", hass).ensure_valid()
+    assert cache.get((template.ENV_TYPE_NORMAL, "{{ 1 + 1 }}")) is None
+    assert tpl.async_render() == 2
+    assert cache.stats() == {
+        "size": 2,
+        "max_size": 2,
+        "hits": 2,
+        "misses": 4,
+        "evictions": 1,
+    }
+
+
+async def test_render_to_info_memoize(hass: HomeAssistant) -> None:
+    """Test memoizing the render of a pure template."""
+    hass.states.async_set("sensor.a", "1")
+    hass.states.async_set("sensor.b", "2")
+    template_string = "{{ states('sensor.a') | int + states('sensor.b') | int }}"
+    tpl = template.Template(template_string, hass)
+    tpl2 = template.Template(template_string, hass)
+
+    with patch.object(
+        template, "_render_with_context", wraps=template._render_with_context
+    ) as render_mock:
+        info = tpl.async_render_to_info(memoize=True)
+        assert_result_info(info, 3, {"sensor.a", "sensor.b"})
+        info = tpl2.async_render_to_info(memoize=True)
+        assert_result_info(info, 3, {"sensor.a", "sensor.b"})
+        assert info.template is tpl2
+        assert render_mock.call_count == 1
+
+        # Not memoized unless asked for
+        info = tpl2.async_render_to_info()
+        assert_result_info(info, 3, {"sensor.a", "sensor.b"})
+        assert render_mock.call_count == 2
+
+        # A changed state invalidates the result
+        hass.states.async_set("sensor.b", "5")
+        info = tpl2.async_render_to_info(memoize=True)
+        assert_result_info(info, 6, {"sensor.a", "sensor.b"})
+        assert render_mock.call_count == 3
+        info = tpl.async_render_to_info(memoize=True)
+        assert_result_info(info, 6, {"sensor.a", "sensor.b"})
+        assert render_mock.call_count == 3
+
+        # Renders with variables are never memoized
+        info = tpl.async_render_to_info({"x": 1}, memoize=True)
+        assert_result_info(info, 6, {"sensor.a", "sensor.b"})
+        assert render_mock.call_count == 4
+
+    stats = template.async_get_template_cache_stats(hass)["render"]
+    assert stats["size"] == 1
+    # The entry found after sensor.b changed was outdated
+    assert stats["hits"] == 3
+
+
+async def test_render_to_info_memoize_limited(hass: HomeAssistant) -> None:
+    """Test memoized renders are not shared between environment types."""
+    hass.states.async_set("sensor.a", "1")
+    template_string = "{{ states('sensor.a') }}"
+
+    info = template.Template(template_string, hass).async_render_to_info(memoize=True)
+    assert_result_info(info, 1, {"sensor.a"})
+
+    limited_tpl = template.Template(template_string, hass)
+    info = limited_tpl.async_render_to_info(memoize=True, limited=True)
+    assert isinstance(info.exception, TemplateError)
+    # The compiled template keeps rendering in the limited environment
+    info = limited_tpl.async_render_to_info(memoize=True)
+    assert isinstance(info.exception, TemplateError)
+
+    info = template.Template(template_string, hass).async_render_to_info(memoize=True)
+    assert_result_info(info, 1, {"sensor.a"})
+    assert template.async_get_template_cache_stats(hass)["render"]["hits"] == 1
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states.sensor | count }}",
+        "{{ states | count }}",
+        "{{ now().year > 2000 and states('sensor.a') }}",
+        "{{ states('sensor.a') | int / 0 }}",
+        "{{ [states('sensor.a')] }}",
+    ],
+)
+async def test_render_to_info_memoize_impure(
+    hass: HomeAssistant, template_string: str
+) -> None:
+    """Test renders which track more than entity states are not memoized."""
+    hass.states.async_set("sensor.a", "1")
+    tpl = template.Template(template_string, hass)
+
+    with patch.object(
+        template, "_render_with_context", wraps=template._render_with_context
+    ) as render_mock:
+        tpl.async_render_to_info(memoize=True)
+        tpl.async_render_to_info(memoize=True)
+        assert render_mock.call_count == 2
 
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.async_get_template_cache_stats(hass)["render"]["size"] == 0
 
 
 def test_is_template_string() -> None:
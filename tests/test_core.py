@@ -17,6 +17,7 @@ from typing import Any
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from pytest_unordered import unordered
 import voluptuous as vol
@@ -1309,6 +1310,71 @@ async def test_eventbus_max_length_exceeded(hass: HomeAssistant) -> None:
     assert exc_info.value.value == long_evt_name
 
 
+async def test_eventbus_profile(hass: HomeAssistant) -> None:
+    """Test profiling the fan-out of events to their listeners."""
+    calls = []
+
+    @ha.callback
+    def immediate_listener(event):
+        calls.append(("immediate", event.event_type))
+
+    @ha.callback
+    def scheduled_listener(event):
+        calls.append(("scheduled", event.event_type))
+
+    async def coro_listener(event):
+        calls.append(("coro", event.event_type))
+
+    hass.bus.async_listen("test_event", immediate_listener, run_immediately=True)
+    hass.bus.async_listen("test_event", scheduled_listener)
+    hass.bus.async_listen(
+        "test_event",
+        coro_listener,
+        event_filter=ha.callback(lambda event: event.data.get("coro", False)),
+    )
+
+    assert hass.bus.profile is None
+    assert hass.bus.async_stop_profile() is None
+    profile = hass.bus.async_start_profile()
+    assert hass.bus.profile is profile
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event", {"coro": True})
+    hass.bus.async_fire("no_listeners")
+    await hass.async_block_till_done()
+
+    assert hass.bus.async_stop_profile() is profile
+    assert hass.bus.profile is None
+    assert sorted(calls) == [
+        ("coro", "test_event"),
+        ("immediate", "test_event"),
+        ("immediate", "test_event"),
+        ("scheduled", "test_event"),
+        ("scheduled", "test_event"),
+    ]
+
+    result = profile.as_dict()
+    assert result["buckets"] == list(ha.EVENT_BUS_PROFILE_BUCKETS)
+    assert result["event_types"]["test_event"]["fired"] == 2
+    assert result["event_types"]["test_event"]["listeners"] == 5
+    assert result["event_types"]["no_listeners"] == {
+        "fired": 1,
+        "listeners": 0,
+        "callback_time": 0.0,
+    }
+    for listener in (immediate_listener, scheduled_listener):
+        stats = result["jobs"][f"{__name__}.{listener.__qualname__}"]
+        assert stats["calls"] == 2
+        assert sum(stats["histogram"]) == 2
+        assert stats["max_time"] <= stats["total_time"]
+    assert f"{__name__}.{coro_listener.__qualname__}" not in result["jobs"]
+
+    # Profiling stopped, so nothing is recorded anymore
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert profile.as_dict()["event_types"]["test_event"]["fired"] == 2
+
+
 def test_state_init() -> None:
     """Test state.init."""
     with pytest.raises(InvalidEntityFormatError):
@@ -2392,6 +2458,57 @@ async def test_async_all(hass: HomeAssistant) -> None:
     } == {"light.bowl", "light.frog", "switch.link"}
 
 
+async def test_async_query_entity_ids(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test async_query_entity_ids."""
+    hass.states.async_set("sensor.power", "150.5")
+    hass.states.async_set("sensor.energy", "12")
+    hass.states.async_set("sensor.broken", "unavailable")
+    hass.states.async_set("light.bowl", "on")
+
+    # The columnar index is created on first use
+    assert set(hass.states.async_query_entity_ids()) == {
+        "sensor.power",
+        "sensor.energy",
+        "sensor.broken",
+        "light.bowl",
+    }
+    assert hass.states.async_query_entity_ids("sensor", above=100) == ["sensor.power"]
+    assert hass.states.async_query_entity_ids("SENSOR", below=100) == ["sensor.energy"]
+    assert set(hass.states.async_query_entity_ids("sensor", above=0, below=200)) == {
+        "sensor.power",
+        "sensor.energy",
+    }
+    assert hass.states.async_query_entity_ids(state="on") == ["light.bowl"]
+    assert set(
+        hass.states.async_query_entity_ids(
+            ["sensor", "light", "switch"], state={"on", "unavailable"}
+        )
+    ) == {"light.bowl", "sensor.broken"}
+
+    # The index is updated incrementally
+    freezer.tick(10)
+    changed_since = dt_util.utcnow()
+    hass.states.async_set("sensor.energy", "120")
+    hass.states.async_set("sensor.voltage", "230")
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    assert set(hass.states.async_query_entity_ids("sensor", above=100)) == {
+        "sensor.power",
+        "sensor.energy",
+        "sensor.voltage",
+    }
+    assert set(hass.states.async_query_entity_ids(changed_since=changed_since)) == {
+        "sensor.energy",
+        "sensor.voltage",
+    }
+
+    hass.states.async_remove("sensor.power")
+    hass.states.async_remove("sensor.voltage")
+    assert hass.states.async_query_entity_ids("sensor", above=100) == ["sensor.energy"]
+    assert hass.states.async_query_entity_ids("switch") == []
+
+
 async def test_async_entity_ids_count(hass: HomeAssistant) -> None:
     """Test async_entity_ids_count."""
 